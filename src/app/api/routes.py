@@ -581,7 +581,7 @@ class GenerateFullContentRequest(BaseModel):
 @router.post("/generate-full-content-videos")
 async def generate_full_content_videos_route(payload: GenerateFullContentRequest) -> dict:
     """Generate complete videos for any content type (story, meme, free_content) with auto-merge. Content type is automatically detected from content_data structure."""
-    return cinematographer_controller.handle_generate_full_content_videos(payload.dict())
+    return await cinematographer_controller.handle_generate_full_content_videos(payload.dict())
 
 
 # ---------- VIDEO GENERATION WITH KEYFRAMES ----------
@@ -752,7 +752,7 @@ async def generate_short_film_route(
     - Emotional arc
     - Visual storytelling
     """
-    return screenwriter_controller.generate_short_film(
+    return await screenwriter_controller.generate_short_film(
         idea=payload.idea,
         character_ids=payload.character_ids,
         num_segments=payload.num_segments,
@@ -839,7 +839,9 @@ async def analyze_character_route(
     ```
     """
     from app.controllers.character_controller import character_controller
-    return await character_controller.analyze_character_image(image, character_name, can_speak)
+    return await character_controller.analyze_character_image(
+        image, character_name, can_speak, user_id=current_user["user_id"]
+    )
 
 
 @router.post("/characters/create")
@@ -916,11 +918,56 @@ async def create_character_route(
     )
 
 
+@router.post("/characters/analyze-and-create")
+async def analyze_and_create_character_route(
+    image: UploadFile = File(..., description="Character image file"),
+    character_name: str = Form(..., description="Name of the character"),
+    is_private: bool = Form(True, description="Private (true) = only you can see, Public (false) = everyone can see"),
+    can_speak: bool = Form(False, description="Can speak human language (true) or only creature sounds (false, default)"),
+    current_user: dict = Depends(get_current_active_user)
+) -> dict:
+    """
+    ⚡ Analyze and create a character in a single request
+    
+    **Protected endpoint - requires authentication**
+    
+    Combines **Step 1** (`/characters/analyze`) and **Step 2** (`/characters/create`)
+    for clients that accept the AI suggestions as-is. The image is uploaded once
+    and reused for both the analysis and the Cloudinary upload.
+    
+    **Headers:**
+    ```
+    Authorization: Bearer <access_token>
+    ```
+    
+    **Input:**
+    ```
+    image: [file]
+    character_name: "Floof"
+    can_speak: false
+    is_private: true
+    ```
+    
+    **Returns:** Same response as `/characters/create`
+    """
+    from app.controllers.character_controller import character_controller
+    
+    return await character_controller.analyze_and_create_character(
+        image=image,
+        character_name=character_name,
+        is_private=is_private,
+        can_speak=can_speak,
+        user_id=current_user["user_id"]
+    )
+
+
 @router.get("/characters")
 async def get_all_characters_route(
     skip: int = 0,
     limit: int = 100,
     user_id: Optional[str] = None,
+    detail: bool = True,
+    include_total: bool = True,
     current_user: Optional[dict] = Depends(get_current_user)
 ) -> dict:
     """
@@ -943,6 +990,10 @@ async def get_all_characters_route(
     **Filtering:**
     - user_id: Optional filter by specific user (shows only that user's characters)
     
+    **Detail:**
+    - detail: Include cloudinary_url and cloudinary_public_id (default: true; false returns thumbnail_url only for lighter list views)
+    - include_total: Count all matching characters (default: true; false returns total=null for infinite scroll)
+    
     **Headers (optional):**
     ```
     Authorization: Bearer <access_token>
@@ -963,11 +1014,13 @@ async def get_all_characters_route(
     # Extract current_user_id if authenticated
     current_user_id = current_user.get("user_id") if current_user else None
     
-    return character_controller.get_all_characters(
+    return await character_controller.get_all_characters(
         skip=skip,
         limit=limit,
         user_id=user_id,
-        current_user_id=current_user_id
+        current_user_id=current_user_id,
+        detail=detail,
+        include_total=include_total
     )
 
 
@@ -985,7 +1038,7 @@ async def get_character_route(character_id: str) -> dict:
     **Note:** character_id is the decrypted UUID, not the MongoDB _id
     """
     from app.controllers.character_controller import character_controller
-    return character_controller.get_character_by_id(character_id)
+    return await character_controller.get_character_by_id(character_id)
 
 
 @router.put("/characters/{character_id}")
@@ -1048,6 +1101,21 @@ async def search_characters_route(payload: SearchCharactersRequest) -> dict:
     )
 
 
+@router.get("/characters/saved/stream")
+async def stream_saved_characters_route(skip: int = 0, limit: int = 0):
+    """
+    📜 Stream all saved (analyzed) characters from MongoDB
+    
+    Returns a JSON array that is written row by row as the database cursor
+    advances, so large result sets never have to be held in memory.
+    
+    **Pagination:**
+    - skip: Number of records to skip (default: 0)
+    - limit: Maximum records to return (default: 0 = all)
+    """
+    return screenwriter_controller.stream_saved_characters(skip, limit)
+
+
 @router.get("/characters/health/check")
 async def check_mongodb_connection() -> dict:
     """Check MongoDB connection health"""
@@ -1358,7 +1426,7 @@ async def generate_daily_character_route(
         for char_id in character_ids:
             try:
                 # Get character from database
-                character = character_service.get_character_by_id(char_id)
+                character = await character_service.get_character_by_id(char_id)
             except ValueError as e:
                 # Character not found
                 raise HTTPException(
@@ -1529,7 +1597,7 @@ async def generate_daily_character_v2_route(
         for char_id in character_ids:
             try:
                 # Get character from database
-                character = character_service.get_character_by_id(char_id)
+                character = await character_service.get_character_by_id(char_id)
             except ValueError as e:
                 # Character not found
                 raise HTTPException(
@@ -1826,7 +1894,7 @@ async def generate_daily_character_videos_route(
         
         print(f"🎬 Ready to generate videos for {len(segments)} segment(s)")
         print(f"🔍 Payload keys being sent: {list(payload_dict.keys())}")
-        return cinematographer_controller.handle_generate_daily_character_videos(payload_dict)
+        return await cinematographer_controller.handle_generate_daily_character_videos(payload_dict)
     
     # Resolve character IDs to URIs if provided directly
     elif payload.character_id or payload.character_ids:
@@ -1843,7 +1911,7 @@ async def generate_daily_character_videos_route(
             character_uris = []
             for char_id in character_ids:
                 # Get character from database
-                character = character_service.get_character_by_id(char_id)
+                character = await character_service.get_character_by_id(char_id)
                 
                 # Check privacy permissions
                 if character.get("is_private"):
@@ -1870,7 +1938,7 @@ async def generate_daily_character_videos_route(
             else:
                 payload_dict["character_keyframe_uris"] = character_uris
             
-            return cinematographer_controller.handle_generate_daily_character_videos(payload_dict)
+            return await cinematographer_controller.handle_generate_daily_character_videos(payload_dict)
             
         except HTTPException:
             raise
@@ -1881,7 +1949,7 @@ async def generate_daily_character_videos_route(
             )
     else:
         # Legacy mode - direct URIs provided
-        return cinematographer_controller.handle_generate_daily_character_videos(payload.dict())
+        return await cinematographer_controller.handle_generate_daily_character_videos(payload.dict())
 
 
 @router.post("/generate-daily-character-videos-with-refs")
@@ -1952,7 +2020,7 @@ async def generate_daily_character_videos_with_refs_route(
         "reference_images": reference_images_data  # Add reference images
     }
     
-    return cinematographer_controller.handle_generate_daily_character_videos(payload)
+    return await cinematographer_controller.handle_generate_daily_character_videos(payload)
 
 
 class GenerateDailyCharacterVideosWithReferencesRequest(BaseModel):
@@ -2039,7 +2107,7 @@ async def generate_daily_character_videos_with_references_route(payload: Generat
     - Optional merged final video
     - Failed segments for retry
     """
-    return cinematographer_controller.handle_generate_daily_character_videos_with_references(payload.dict())
+    return await cinematographer_controller.handle_generate_daily_character_videos_with_references(payload.dict())
 
 
 # ---------- IMAGE EDITING & GENERATION ROUTES ----------
@@ -1,11 +1,19 @@
+import logging
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from app.api.routes import router as api_router
 from app.config.settings import settings   # ✅ fixed import
+from app.config.logging_config import configure_logging
+
+configure_logging()
+
+logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# orjson encodes response payloads (including datetimes) natively
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # CORS config based on environment
 app.add_middleware(
@@ -16,6 +24,19 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def create_character_indexes():
+    from app.services.character_service import character_service
+    try:
+        await character_service.create_indexes()
+    except Exception:
+        logger.warning("character.index_creation_failed", exc_info=True)
+
+@app.on_event("startup")
+async def configure_cloudinary():
+    from app.services.cloudinary_service import initialize_cloudinary
+    initialize_cloudinary()
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     return JSONResponse(
@@ -0,0 +1,44 @@
+"""
+Logging Configuration
+
+Routes application logs through a QueueHandler so that formatting and
+stream I/O happen on a background listener thread instead of the
+request thread.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# Singleton listener
+_queue_listener = None
+
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure non-blocking logging for the "app" logger hierarchy (idempotent)
+    
+    Args:
+        level: Minimum log level to emit
+    """
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        return
+    
+    log_queue = queue.Queue(-1)
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(level)
+    app_logger.addHandler(QueueHandler(log_queue))
+    app_logger.propagate = False
+    
+    _queue_listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
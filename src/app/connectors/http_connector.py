@@ -0,0 +1,73 @@
+"""
+HTTP Connector
+
+This module provides a singleton requests session shared by all outbound HTTP
+downloads (character images, generated frames, video segments), so repeated
+requests to the same host reuse pooled keep-alive connections
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Connections kept per host (enough for the parallel image downloads)
+HTTP_POOL_SIZE = 32
+
+# Singleton instances: retrying session, and one for callers that run their own retry loop
+_http_session = None
+_http_session_no_retry = None
+
+
+def _create_session(max_retries: Retry) -> requests.Session:
+    """Create a session with a pooled adapter for http and https"""
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=max_retries)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_http_session(retry: bool = True) -> requests.Session:
+    """
+    Get or create the shared requests session (singleton pattern)
+    
+    With retry=True, transient failures (connection errors, 429 and 5xx responses) are
+    retried up to 3 times with exponential backoff; after that the last response is
+    returned so callers can keep inspecting status codes themselves. Callers that already
+    retry (e.g. inside a generation retry loop) pass retry=False so one logical attempt
+    stays one HTTP request.
+    
+    Args:
+        retry: Whether the adapter retries transient failures itself
+    
+    Returns:
+        requests.Session: Session with a pooled adapter for http and https
+    """
+    global _http_session, _http_session_no_retry
+    
+    if not retry:
+        if _http_session_no_retry is None:
+            _http_session_no_retry = _create_session(Retry(0, read=False))
+        return _http_session_no_retry
+    
+    if _http_session is None:
+        _http_session = _create_session(Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        ))
+    
+    return _http_session
+
+
+def reset_http_session():
+    """
+    Close and reset the shared sessions (useful for testing or reconfiguration)
+    """
+    global _http_session, _http_session_no_retry
+    for session in (_http_session, _http_session_no_retry):
+        if session is not None:
+            session.close()
+    _http_session = None
+    _http_session_no_retry = None
@@ -5,15 +5,19 @@ This module provides a singleton instance of the MongoDB client
 for database operations (character storage, etc.)
 """
 
-from pymongo import MongoClient
+from pymongo import MongoClient, AsyncMongoClient
 from pymongo.database import Database
 from pymongo.collection import Collection
+from pymongo.asynchronous.collection import AsyncCollection
 from app.config.settings import settings
 
 # Singleton instance
 _mongodb_client = None
 _mongodb_database = None
 
+# Singleton asyncio instance (for use inside async request handlers)
+_async_mongodb_client = None
+
 
 def get_mongodb_client() -> MongoClient:
     """
@@ -75,17 +79,60 @@ def get_collection(collection_name: str) -> Collection:
     return database[collection_name]
 
 
+def get_async_mongodb_client() -> AsyncMongoClient:
+    """
+    Get or create the asyncio MongoDB client instance (singleton pattern)
+    
+    Use this from async code so database I/O does not block the event loop.
+    
+    Returns:
+        AsyncMongoClient: Configured asyncio MongoDB client instance
+    """
+    global _async_mongodb_client
+    
+    if _async_mongodb_client is None:
+        mongodb_uri = settings.MONGODB_URI
+        
+        if not mongodb_uri:
+            raise ValueError("MONGODB_URI not configured in settings")
+        
+        _async_mongodb_client = AsyncMongoClient(mongodb_uri)
+        print("✅ Async MongoDB client initialized")
+    
+    return _async_mongodb_client
+
+
+def get_async_collection(collection_name: str) -> AsyncCollection:
+    """
+    Get an asyncio MongoDB collection
+    
+    Args:
+        collection_name: Name of the collection
+    
+    Returns:
+        AsyncCollection: asyncio MongoDB collection instance
+    """
+    db_name = settings.MONGODB_DATABASE
+    
+    if not db_name:
+        raise ValueError("MONGODB_DATABASE not configured in settings")
+    
+    return get_async_mongodb_client()[db_name][collection_name]
+
+
 def reset_mongodb_client():
     """
     Reset the MongoDB client instance (useful for testing or reconfiguration)
     """
-    global _mongodb_client, _mongodb_database
+    global _mongodb_client, _mongodb_database, _async_mongodb_client
     
     if _mongodb_client:
         _mongodb_client.close()
     
     _mongodb_client = None
     _mongodb_database = None
+    # AsyncMongoClient.close() is a coroutine; dropping the reference releases its pool
+    _async_mongodb_client = None
     print("🔄 MongoDB client reset")
 
 
@@ -17,7 +17,8 @@ class CharacterController:
         self,
         image: UploadFile,
         character_name: str,
-        can_speak: bool
+        can_speak: bool,
+        user_id: Optional[str] = None
     ) -> Dict:
         """
         Analyze character image and return AI suggestions
@@ -26,6 +27,7 @@ class CharacterController:
             image: Uploaded image file
             character_name: Name of the character
             can_speak: Whether character can speak human language (guides voice description)
+            user_id: Optional user ID
             
         Returns:
             dict: Analysis results with subject, voice, and keyword suggestions
@@ -34,7 +36,8 @@ class CharacterController:
             result = await character_service.analyze_character_image(
                 image=image,
                 character_name=character_name,
-                can_speak=can_speak
+                can_speak=can_speak,
+                user_id=user_id
             )
             
             return {
@@ -98,12 +101,50 @@ class CharacterController:
                 "error": str(e)
             }
     
-    def get_all_characters(
+    async def analyze_and_create_character(
+        self,
+        image: UploadFile,
+        character_name: str,
+        is_private: bool,
+        can_speak: bool,
+        user_id: Optional[str] = None
+    ) -> Dict:
+        """
+        Analyze a character image and create the character in one request
+        
+        Args:
+            image: Uploaded image file
+            character_name: Name of the character
+            is_private: Private (true) or public (false)
+            can_speak: Whether character can speak human language
+            user_id: Optional user ID
+            
+        Returns:
+            dict: Created character data with auto-generated character_id
+        """
+        try:
+            return await character_service.analyze_and_create_character(
+                image=image,
+                character_name=character_name,
+                is_private=is_private,
+                can_speak=can_speak,
+                user_id=user_id
+            )
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e)
+            }
+    
+    async def get_all_characters(
         self,
         skip: int = 0,
         limit: int = 100,
         user_id: Optional[str] = None,
-        current_user_id: Optional[str] = None
+        current_user_id: Optional[str] = None,
+        detail: bool = True,
+        include_total: bool = True
     ) -> Dict:
         """
         Get all characters with pagination
@@ -113,16 +154,20 @@ class CharacterController:
             limit: Maximum number of records to return
             user_id: Optional user ID filter
             current_user_id: Optional current authenticated user ID (for privacy filtering)
+            detail: Include full-size image URL and Cloudinary public ID (False for a lighter list view)
+            include_total: Whether to count all matching characters
             
         Returns:
             dict: List of characters with pagination info
         """
         try:
-            return character_service.get_all_characters(
+            return await character_service.get_all_characters(
                 skip=skip,
                 limit=limit,
                 user_id=user_id,
-                current_user_id=current_user_id
+                current_user_id=current_user_id,
+                detail=detail,
+                include_total=include_total
             )
             
         except Exception as e:
@@ -133,7 +178,7 @@ class CharacterController:
                 "total": 0
             }
     
-    def get_character_by_id(self, character_id: str) -> Dict:
+    async def get_character_by_id(self, character_id: str) -> Dict:
         """
         Get a specific character by ID
         
@@ -144,7 +189,7 @@ class CharacterController:
             dict: Character data
         """
         try:
-            result = character_service.get_character_by_id(character_id)
+            result = await character_service.get_character_by_id(character_id)
             
             return {
                 "success": True,
@@ -189,7 +189,7 @@ def handle_get_failed_segments(request_body: dict):
     except Exception as e:
         return {"error": str(e)}
 
-def handle_generate_full_content_videos(request_body: dict):
+async def handle_generate_full_content_videos(request_body: dict):
     """
     Generate videos for all segments in any content type (story, meme, free_content) sequentially
     """
@@ -215,7 +215,7 @@ def handle_generate_full_content_videos(request_body: dict):
         from app.services.content_to_video_service import execute_content_video_generation
         
         # Execute the full pipeline
-        results = execute_content_video_generation(content_data, content_type, video_options, generate_videos)
+        results = await execute_content_video_generation(content_data, content_type, video_options, generate_videos)
         
         # Auto-merge if requested and videos were generated
         if auto_merge and generate_videos and results.get("success_count", 0) > 0:
@@ -269,7 +269,7 @@ def handle_generate_full_content_videos(request_body: dict):
         return {"error": str(e)}
 
 
-def handle_generate_daily_character_videos(request_body: dict):
+async def handle_generate_daily_character_videos(request_body: dict):
     """
     Generate videos for daily character content using keyframes.
     Each segment uses the character image as first keyframe for consistency.
@@ -303,7 +303,7 @@ def handle_generate_daily_character_videos(request_body: dict):
         from app.services.content_to_video_service import execute_daily_character_video_generation
         
         # Execute the full pipeline with keyframes
-        results = execute_daily_character_video_generation(content_data, video_options)
+        results = await execute_daily_character_video_generation(content_data, video_options)
         
         # Auto-merge if requested and videos were generated
         if auto_merge and results.get("success_count", 0) > 0:
@@ -356,7 +356,7 @@ def handle_generate_daily_character_videos(request_body: dict):
         return {"error": str(e)}
 
 
-def handle_generate_daily_character_videos_with_references(request_body: dict):
+async def handle_generate_daily_character_videos_with_references(request_body: dict):
     """
     Generate videos for daily character content using REFERENCE IMAGES.
     Uses both previous frame AND character keyframe as reference images for character consistency.
@@ -387,7 +387,7 @@ def handle_generate_daily_character_videos_with_references(request_body: dict):
         from app.services.content_to_video_service import execute_daily_character_video_generation_with_references
         
         # Execute the full pipeline with reference images
-        results = execute_daily_character_video_generation_with_references(content_data, video_options)
+        results = await execute_daily_character_video_generation_with_references(content_data, video_options)
         
         # Auto-merge if requested and videos were generated
         if auto_merge and results.get("success_count", 0) > 0:
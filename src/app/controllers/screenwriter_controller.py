@@ -1,5 +1,7 @@
 from fastapi import HTTPException, status, UploadFile
+from fastapi.responses import StreamingResponse
 from app.services import openai_service
+import orjson
 import random
 
 def build_story(idea: str, segments: int = 5, custom_character_roster: list = None):
@@ -534,6 +536,27 @@ def get_all_saved_characters(skip: int = 0, limit: int = 100):
         )
 
 
+def stream_saved_characters(skip: int = 0, limit: int = 0):
+    """Stream all saved characters from MongoDB as a JSON array"""
+    try:
+        rows = character_service_mongodb.iter_all_characters(skip, limit)
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve characters: {str(e)}"
+        )
+    
+    def generate():
+        yield b'['
+        first = True
+        for row in rows:
+            yield (b',' if not first else b'') + orjson.dumps(row)
+            first = False
+        yield b']'
+    
+    return StreamingResponse(generate(), media_type="application/json")
+
+
 def get_character_by_id(character_id: str):
     """Get a specific character by MongoDB ID"""
     try:
@@ -899,7 +922,7 @@ def generate_daily_character_content_v2(
 
 
 
-def generate_short_film(
+async def generate_short_film(
     idea: str,
     character_ids: list = None,
     num_segments: int = None,
@@ -951,7 +974,7 @@ def generate_short_film(
             
             for char_id in character_ids:
                 print(f"✅ Using character: {char_id}")
-                char_data = character_service.get_character_by_id(char_id)
+                char_data = await character_service.get_character_by_id(char_id)
                 
                 character_names.append(char_data["character_name"])
                 
@@ -15,9 +15,24 @@ class Character:
     Character model for MongoDB storage
     """
     
+    # Fixed attribute layout: no per-instance __dict__
+    __slots__ = (
+        "_id",
+        "character_data",
+        "character_name",
+        "created_at",
+        "updated_at",
+        "version",
+        "image_url",
+        "cloudinary_public_id"
+    )
+    
     # Collection name in MongoDB
     COLLECTION_NAME = "characters"
     
+    # Index backing the newest-first sort used by list endpoints
+    NEWEST_FIRST_INDEX = [("created_at", -1), ("_id", -1)]
+    
     def __init__(
         self,
         character_data: Dict[str, Any],
@@ -60,6 +75,7 @@ class Character:
         """
         data = {
             "character_data": self.character_data,
+            "list_view": self.build_list_view(self.character_data),
             "character_name": self.character_name,
             "created_at": self.created_at,
             "updated_at": self.updated_at,
@@ -73,6 +89,37 @@ class Character:
         
         return data
     
+    @staticmethod
+    def build_list_view(character_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Precompute the summary fields shown in character lists
+        
+        Uses the first characters_roster entry when present, falling back
+        to the direct character format field by field.
+        
+        Args:
+            character_data: Complete character analysis data
+        
+        Returns:
+            dict: character_id, gender, age and role
+        """
+        roster = character_data.get("characters_roster")
+        first_char = roster[0] if isinstance(roster, list) and roster and isinstance(roster[0], dict) else {}
+        roster_appearance = first_char.get("physical_appearance") or {}
+        appearance = character_data.get("physical_appearance") or {}
+        
+        def pick(roster_value, direct_value, default):
+            if roster_value is not None:
+                return roster_value
+            return direct_value if direct_value is not None else default
+        
+        return {
+            "character_id": pick(first_char.get("id"), character_data.get("id"), "unknown"),
+            "gender": pick(roster_appearance.get("gender"), appearance.get("gender"), "Unknown"),
+            "age": pick(roster_appearance.get("estimated_age"), appearance.get("estimated_age"), "Unknown"),
+            "role": pick(first_char.get("role"), character_data.get("role"), "Unknown")
+        }
+    
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Character':
         """
@@ -147,6 +194,16 @@ class Character:
         # Index on created_at for sorting
         collection.create_index("created_at")
         
+        # Compound index for the newest-first list sort (with _id as tie-breaker)
+        collection.create_index(Character.NEWEST_FIRST_INDEX)
+        
+        # bulk_create idempotency key (partial: only documents saved with one)
+        collection.create_index(
+            "client_id",
+            unique=True,
+            partialFilterExpression={"client_id": {"$type": "string"}}
+        )
+        
         # Text index for full-text search
         collection.create_index([
             ("character_name", "text"),
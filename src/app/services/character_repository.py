@@ -4,14 +4,128 @@ Character Repository
 This module provides database operations for character management using MongoDB.
 """
 
-from typing import Optional, Dict, Any, List
+import logging
+import re
 from datetime import datetime
-from bson import ObjectId
+from functools import lru_cache
+from itertools import islice
+from typing import Optional, Dict, Any, List, Iterable, Iterator, Tuple, Union
+from bson import ObjectId, Regex
+from bson.errors import InvalidId
+from bson.raw_bson import RawBSONDocument
+from pymongo import InsertOne, ReturnDocument, UpdateOne
 from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+from pymongo.write_concern import WriteConcern
 
 from app.connectors.mongodb_connector import get_collection
 from app.models.character import Character
 
+logger = logging.getLogger(__name__)
+
+# Server-side equivalent of Character.build_list_view, used to refresh the
+# stored list_view on update and to fill it in for documents written before it existed
+_LIST_VIEW_EXPR = {
+    "$let": {
+        "vars": {"first": {"$arrayElemAt": ["$character_data.characters_roster", 0]}},
+        "in": {
+            "character_id": {"$ifNull": ["$$first.id", "$character_data.id", "unknown"]},
+            "gender": {"$ifNull": [
+                "$$first.physical_appearance.gender",
+                "$character_data.physical_appearance.gender",
+                "Unknown"
+            ]},
+            "age": {"$ifNull": [
+                "$$first.physical_appearance.estimated_age",
+                "$character_data.physical_appearance.estimated_age",
+                "Unknown"
+            ]},
+            "role": {"$ifNull": ["$$first.role", "$character_data.role", "Unknown"]}
+        }
+    }
+}
+
+# Fields needed to build a character list row
+_LIST_PROJECTION = {
+    "character_name": 1,
+    "created_at": 1,
+    "updated_at": 1,
+    "list_view": {"$ifNull": ["$list_view", _LIST_VIEW_EXPR]}
+}
+
+# Maximum number of operations sent per bulk_write round trip
+_BULK_CHUNK_SIZE = 1000
+
+# MongoDB duplicate key error code
+_DUPLICATE_KEY = 11000
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of at most `size` items"""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _bulk_write_op(char_data: Dict[str, Any]) -> Tuple[Union[InsertOne, UpdateOne], ObjectId]:
+    """
+    Build the bulk_create operation for one character
+    
+    Characters with a client_id are upserted on it, so retrying a batch
+    does not duplicate them. Others are inserted as new documents (as with create).
+    
+    Args:
+        char_data: Character data dictionary
+    
+    Returns:
+        tuple: (write operation, _id the document gets if this operation creates it)
+    """
+    character = Character(
+        character_data=char_data.get('character_data', {}),
+        character_name=char_data.get('character_name', 'Unknown')
+    )
+    # Ids are generated client-side, so a partially failed chunk still
+    # reports exactly which documents were saved
+    character._id = ObjectId()
+    document = character.to_dict()
+    
+    client_id = char_data.get('client_id')
+    if client_id is None:
+        return InsertOne(document), character._id
+    
+    return UpdateOne({"client_id": client_id}, {"$setOnInsert": document}, upsert=True), character._id
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    """Timestamp as an ISO-8601 string, the format Character.to_response uses"""
+    return value.isoformat() if value else None
+
+
+def _parse_oid(character_id: str) -> Optional[ObjectId]:
+    """Parse a character ID into an ObjectId, or None if it is not valid"""
+    try:
+        return ObjectId(character_id)
+    except (InvalidId, TypeError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def _filter_regex(value: str, exact: bool = False) -> Regex:
+    """
+    Build (once per value) a case-insensitive filter regex for a literal value
+    
+    Args:
+        value: Filter value as given by the caller
+        exact: Anchor the pattern so it must match the whole field
+    
+    Returns:
+        Regex: BSON regex for the filter
+    """
+    pattern = re.escape(value)
+    if exact:
+        pattern = f"^{pattern}$"
+    return Regex(pattern, "i")
+
 
 class CharacterRepository:
     """
@@ -21,6 +135,14 @@ class CharacterRepository:
     def __init__(self):
         """Initialize the repository with MongoDB collection"""
         self.collection: Collection = get_collection(Character.COLLECTION_NAME)
+        # Lazily decoded documents for list reads: only the fields a row touches are inflated
+        self._raw_collection: Collection = self.collection.with_options(
+            codec_options=self.collection.codec_options.with_options(document_class=RawBSONDocument)
+        )
+        # Unjournaled acknowledged writes for bulk inserts (throughput over durability)
+        self._bulk_collection: Collection = self.collection.with_options(
+            write_concern=WriteConcern(w=1, j=False)
+        )
         # Ensure indexes are created
         Character.create_indexes(self.collection)
     
@@ -54,26 +176,79 @@ class CharacterRepository:
             result = self.collection.insert_one(character.to_dict())
             character._id = result.inserted_id
             
-            print(f"💾 Character saved to MongoDB: {character_name} (ID: {result.inserted_id})")
+            logger.info("character.saved name=%s id=%s", character_name, result.inserted_id)
             if image_url:
-                print(f"🖼️ Character image URL: {image_url}")
+                logger.info("character.image id=%s url=%s", result.inserted_id, image_url)
             
             return {
                 "success": True,
                 "character_id": str(result.inserted_id),
                 "character_name": character_name,
                 "image_url": image_url,
-                "created_at": character.created_at.isoformat()
+                "created_at": _isoformat(character.created_at)
             }
         
         except Exception as e:
             error_msg = f"Failed to create character: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error("character.save_failed name=%s error=%s", character_name, e)
             return {
                 "success": False,
                 "error": error_msg
             }
     
+    def _iter_rows(
+        self,
+        search_filter: Dict[str, Any],
+        skip: int = 0,
+        limit: int = 0
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over matching characters as list rows, newest first
+        
+        Rows are yielded as the cursor advances so only one document is
+        held in memory at a time.
+        
+        Args:
+            search_filter: MongoDB filter
+            skip: Number of records to skip
+            limit: Maximum number of records to yield (0 = no limit)
+        
+        Yields:
+            dict: Character list row
+        """
+        pipeline = [
+            {"$match": search_filter},
+            {"$sort": dict(Character.NEWEST_FIRST_INDEX)},
+            {"$skip": skip}
+        ]
+        if limit:
+            pipeline.append({"$limit": limit})
+        pipeline.append({"$project": _LIST_PROJECTION})
+        
+        options = {"batchSize": min(limit or 500, 500)}
+        # Pin the sort index so low-selectivity filters can't flip the cached plan.
+        # $text queries must use the text index and cannot be hinted.
+        if "$text" not in search_filter:
+            options["hint"] = Character.NEWEST_FIRST_INDEX
+        
+        cursor = self._raw_collection.aggregate(pipeline, **options)
+        
+        for doc in cursor:
+            yield self._to_list_row(doc)
+    
+    def iter_all(self, skip: int = 0, limit: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all characters as list rows without building a list
+        
+        Args:
+            skip: Number of records to skip
+            limit: Maximum number of records to yield (0 = no limit)
+        
+        Yields:
+            dict: Character list row
+        """
+        return self._iter_rows({}, skip, limit)
+    
     def get_all(self, skip: int = 0, limit: int = 100) -> Dict[str, Any]:
         """
         Get all characters with pagination
@@ -88,35 +263,7 @@ class CharacterRepository:
         try:
             total_count = self.collection.count_documents({})
             
-            cursor = self.collection.find().sort("created_at", -1).skip(skip).limit(limit)
-            
-            characters = []
-            for doc in cursor:
-                character = Character.from_dict(doc)
-                
-                # Extract character info from nested structure
-                char_info = character.character_data
-                if 'characters_roster' in char_info and char_info['characters_roster']:
-                    # Data is in characters_roster format
-                    first_char = char_info['characters_roster'][0]
-                    char_id = first_char.get('id', 'unknown')
-                    gender = first_char.get('physical_appearance', {}).get('gender', 'Unknown')
-                    age = first_char.get('physical_appearance', {}).get('estimated_age', 'Unknown')
-                else:
-                    # Data is in direct format
-                    char_id = char_info.get('id', 'unknown')
-                    gender = char_info.get('physical_appearance', {}).get('gender', 'Unknown')
-                    age = char_info.get('physical_appearance', {}).get('estimated_age', 'Unknown')
-                
-                characters.append({
-                    "id": str(character._id),
-                    "character_name": character.character_name,
-                    "character_id": char_id,
-                    "gender": gender,
-                    "age": age,
-                    "created_at": character.created_at.isoformat() if character.created_at else None,
-                    "updated_at": character.updated_at.isoformat() if character.updated_at else None
-                })
+            characters = list(islice(self.iter_all(skip, limit), limit or None))
             
             return {
                 "success": True,
@@ -133,6 +280,25 @@ class CharacterRepository:
                 "error": f"Failed to retrieve characters: {str(e)}"
             }
     
+    @staticmethod
+    def _to_list_row(doc: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build a character list row from a document projected with _LIST_PROJECTION
+        
+        Args:
+            doc: Projected character document (dict or RawBSONDocument)
+        
+        Returns:
+            dict: Character list row
+        """
+        return {
+            "id": str(doc["_id"]),
+            "character_name": doc.get("character_name", "Unknown"),
+            **doc["list_view"],
+            "created_at": _isoformat(doc.get("created_at")),
+            "updated_at": _isoformat(doc.get("updated_at"))
+        }
+    
     def get_by_id(self, character_id: str) -> Dict[str, Any]:
         """
         Get a character by ID
@@ -144,13 +310,14 @@ class CharacterRepository:
             dict: Character data
         """
         try:
-            if not ObjectId.is_valid(character_id):
+            oid = _parse_oid(character_id)
+            if oid is None:
                 return {
                     "success": False,
                     "error": "Invalid character ID format"
                 }
             
-            doc = self.collection.find_one({"_id": ObjectId(character_id)})
+            doc = self.collection.find_one({"_id": oid})
             
             if not doc:
                 return {
@@ -183,50 +350,48 @@ class CharacterRepository:
             dict: Update result
         """
         try:
-            if not ObjectId.is_valid(character_id):
+            oid = _parse_oid(character_id)
+            if oid is None:
                 return {
                     "success": False,
                     "error": "Invalid character ID format"
                 }
             
-            # Get existing character
-            doc = self.collection.find_one({"_id": ObjectId(character_id)})
+            # Merge updated data into character_data on the server in a single round trip.
+            # $literal keeps values such as "$name" from being read as field paths.
+            updated_doc = self.collection.find_one_and_update(
+                {"_id": oid},
+                [
+                    {
+                        "$set": {
+                            "character_data": {
+                                "$mergeObjects": [
+                                    {"$ifNull": ["$character_data", {}]},
+                                    {"$literal": updated_data}
+                                ]
+                            },
+                            "updated_at": "$$NOW"
+                        }
+                    },
+                    {"$set": {"list_view": _LIST_VIEW_EXPR}}
+                ],
+                projection={"updated_at": 1},
+                return_document=ReturnDocument.AFTER
+            )
             
-            if not doc:
+            if updated_doc is None:
                 return {
                     "success": False,
                     "error": f"Character not found with ID: {character_id}"
                 }
             
-            # Merge updated data with existing character_data
-            existing_character_data = doc.get("character_data", {})
-            existing_character_data.update(updated_data)
-            
-            # Update document
-            update_result = self.collection.update_one(
-                {"_id": ObjectId(character_id)},
-                {
-                    "$set": {
-                        "character_data": existing_character_data,
-                        "updated_at": datetime.utcnow()
-                    }
-                }
-            )
-            
-            if update_result.modified_count > 0:
-                print(f"✏️ Character updated: {character_id}")
-                return {
-                    "success": True,
-                    "character_id": character_id,
-                    "updated_at": datetime.utcnow().isoformat(),
-                    "message": "Character updated successfully"
-                }
-            else:
-                return {
-                    "success": True,
-                    "character_id": character_id,
-                    "message": "No changes made (data was identical)"
-                }
+            logger.info("character.updated id=%s", character_id)
+            return {
+                "success": True,
+                "character_id": character_id,
+                "updated_at": _isoformat(updated_doc["updated_at"]),
+                "message": "Character updated successfully"
+            }
         
         except Exception as e:
             return {
@@ -245,16 +410,17 @@ class CharacterRepository:
             dict: Delete result
         """
         try:
-            if not ObjectId.is_valid(character_id):
+            oid = _parse_oid(character_id)
+            if oid is None:
                 return {
                     "success": False,
                     "error": "Invalid character ID format"
                 }
             
-            result = self.collection.delete_one({"_id": ObjectId(character_id)})
+            result = self.collection.delete_one({"_id": oid})
             
             if result.deleted_count > 0:
-                print(f"🗑️ Character deleted: {character_id}")
+                logger.info("character.deleted id=%s", character_id)
                 return {
                     "success": True,
                     "character_id": character_id,
@@ -301,55 +467,19 @@ class CharacterRepository:
             if query:
                 search_filter["$text"] = {"$search": query}
             
-            # Gender filter
+            # Gender filter (whole value, so "male" does not match "female")
             if gender:
-                search_filter["character_data.physical_appearance.gender"] = {
-                    "$regex": gender,
-                    "$options": "i"
-                }
+                search_filter["character_data.physical_appearance.gender"] = _filter_regex(gender, exact=True)
             
-            # Age range filter
+            # Age range filter (substring, e.g. "30" matches "30 years old")
             if age_range:
-                search_filter["character_data.physical_appearance.estimated_age"] = {
-                    "$regex": age_range,
-                    "$options": "i"
-                }
+                search_filter["character_data.physical_appearance.estimated_age"] = _filter_regex(age_range)
             
             # Count total matching documents
             total_count = self.collection.count_documents(search_filter)
             
             # Execute search
-            cursor = self.collection.find(search_filter).sort("created_at", -1).skip(skip).limit(limit)
-            
-            results = []
-            for doc in cursor:
-                character = Character.from_dict(doc)
-                
-                # Extract character info from nested structure
-                char_info = character.character_data
-                if 'characters_roster' in char_info and char_info['characters_roster']:
-                    # Data is in characters_roster format
-                    first_char = char_info['characters_roster'][0]
-                    char_id = first_char.get('id', 'unknown')
-                    gender = first_char.get('physical_appearance', {}).get('gender', 'Unknown')
-                    age = first_char.get('physical_appearance', {}).get('estimated_age', 'Unknown')
-                    role = first_char.get('role', 'Unknown')
-                else:
-                    # Data is in direct format
-                    char_id = char_info.get('id', 'unknown')
-                    gender = char_info.get('physical_appearance', {}).get('gender', 'Unknown')
-                    age = char_info.get('physical_appearance', {}).get('estimated_age', 'Unknown')
-                    role = char_info.get('role', 'Unknown')
-                
-                results.append({
-                    "id": str(character._id),
-                    "character_name": character.character_name,
-                    "character_id": char_id,
-                    "gender": gender,
-                    "age": age,
-                    "role": role,
-                    "created_at": character.created_at.isoformat() if character.created_at else None
-                })
+            results = list(islice(self._iter_rows(search_filter, skip, limit), limit or None))
             
             return {
                 "success": True,
@@ -371,34 +501,97 @@ class CharacterRepository:
                 "error": f"Failed to search characters: {str(e)}"
             }
     
+    def backfill_list_view(self) -> Dict[str, Any]:
+        """
+        Store list_view on characters saved before it was introduced
+        
+        Returns:
+            dict: Backfill result
+        """
+        try:
+            result = self.collection.update_many(
+                {"list_view": {"$exists": False}},
+                [{"$set": {"list_view": _LIST_VIEW_EXPR}}]
+            )
+            
+            logger.info("character.list_view_backfilled count=%s", result.modified_count)
+            
+            return {
+                "success": True,
+                "total_updated": result.modified_count
+            }
+        
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Failed to backfill character list views: {str(e)}"
+            }
+    
     def bulk_create(self, characters_data: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Create multiple characters at once
         
+        A character with a string client_id is only created if no character
+        was saved under that client_id before, so a retried batch is idempotent.
+        Characters without one are always inserted.
+        
         Args:
             characters_data: List of character data dictionaries
+                (character_data, character_name and optional client_id)
         
         Returns:
             dict: Bulk create result
         """
         try:
-            documents = []
-            for char_data in characters_data:
-                character = Character(
-                    character_data=char_data.get('character_data', {}),
-                    character_name=char_data.get('character_name', 'Unknown')
-                )
-                documents.append(character.to_dict())
-            
-            result = self.collection.insert_many(documents)
+            inserted_ids = []
+            matched = 0
+            errors = []
+            operations = map(_bulk_write_op, characters_data)
+            for chunk_number, chunk in enumerate(_chunked(operations, _BULK_CHUNK_SIZE)):
+                try:
+                    # Documents are built by Character.to_dict, so server-side validation is skipped
+                    details = self._bulk_collection.bulk_write(
+                        [op for op, _ in chunk],
+                        ordered=False,
+                        bypass_document_validation=True
+                    ).bulk_api_result
+                except BulkWriteError as e:
+                    # Unordered write: every operation without a write error was applied
+                    details = e.details
+                
+                upserted = {item["index"] for item in details.get("upserted", [])}
+                failed = {}
+                for err in details.get("writeErrors", []):
+                    if err.get("code") == _DUPLICATE_KEY and isinstance(chunk[err["index"]][0], UpdateOne):
+                        continue  # A concurrent call saved the same client_id first
+                    failed[err["index"]] = err.get("errmsg")
+                
+                offset = chunk_number * _BULK_CHUNK_SIZE
+                for i, (op, oid) in enumerate(chunk):
+                    if i in failed:
+                        errors.append({"index": offset + i, "error": failed[i]})
+                    elif isinstance(op, InsertOne) or i in upserted:
+                        inserted_ids.append(oid)
+                    else:
+                        matched += 1
             
-            print(f"💾 Bulk save complete: {len(result.inserted_ids)} characters saved to MongoDB")
+            logger.info(
+                "character.bulk_saved count=%s matched=%s failed=%s",
+                len(inserted_ids), matched, len(errors)
+            )
             
-            return {
+            response = {
                 "success": True,
-                "total_created": len(result.inserted_ids),
-                "character_ids": [str(id) for id in result.inserted_ids]
+                "total_created": len(inserted_ids),
+                "matched": matched,
+                "character_ids": [str(id) for id in inserted_ids]
             }
+            
+            if errors:
+                response["total_failed"] = len(errors)
+                response["errors"] = errors
+            
+            return response
         
         except Exception as e:
             return {
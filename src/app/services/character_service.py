@@ -4,32 +4,181 @@ Character Service
 Handles character management including AI analysis, storage, and retrieval.
 """
 
-import json
-import uuid
-import base64
-from datetime import datetime
-from typing import Optional, Dict, List
+import asyncio
+import hashlib
+import logging
+import orjson
+import re
+import secrets
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Optional, Dict, List, Tuple, Union, BinaryIO
 from fastapi import UploadFile
 from PIL import Image
 from io import BytesIO
 
 from app.services.encryption_service import encryption_service
-from app.services.cloudinary_service import cloudinary_service
-from app.connectors.mongodb_connector import get_collection
+from app.services.cloudinary_service import get_cloudinary_service
+from app.connectors.mongodb_connector import get_async_collection
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import OperationFailure
 from app.data.prompts.analyze_character_prompt import get_character_analysis_prompt
 
+logger = logging.getLogger(__name__)
+
+
+# Voice type indicators, matched against the words of a character's description
+SOFT_VOICE_KEYWORDS = frozenset([
+    "shy", "soft", "gentle", "playful", "cute", "small", "young",
+    "child", "friendly", "sweet", "light", "cheerful", "bubbly",
+    "feminine", "delicate", "timid", "nervous", "high"
+])
+DEEP_VOICE_KEYWORDS = frozenset([
+    "confident", "authoritative", "deep", "serious", "strong",
+    "powerful", "commanding", "bold", "gruff", "rough", "tough",
+    "masculine", "large", "tall", "big", "muscular", "heavy",
+    "intimidating", "stern", "firm", "low"
+])
+MAGICAL_VOICE_KEYWORDS = frozenset([
+    "mysterious", "ethereal", "magical", "mystical", "enchanting",
+    "otherworldly", "supernatural", "spiritual", "cosmic", "divine",
+    "ancient", "wise", "enigmatic", "arcane", "celestial"
+])
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+# Characters removed from a name when building its character_id
+_ID_NAME_STRIP = str.maketrans("", "", " -_")
+
+# Longest edge (px) of images sent to Gemini for analysis
+ANALYSIS_MAX_SIZE = (1024, 1024)
+
+
+def _prepare_for_analysis(image_data: bytes) -> Tuple[bytes, str]:
+    """
+    Decode an image once and derive everything the analysis step needs
+    
+    Resizes to fit ANALYSIS_MAX_SIZE with LANCZOS and re-encodes it as a
+    compact JPEG. Transparent areas are flattened onto white so the subject
+    stays visible.
+    
+    Args:
+        image_data: Original image bytes
+        
+    Returns:
+        tuple: (JPEG image bytes for Gemini, sha256 hex digest of the original bytes)
+    """
+    # Digest of the upload itself, so a Pillow upgrade that changes the
+    # re-encoded bytes does not invalidate cached analyses
+    digest = hashlib.sha256(image_data).hexdigest()
+    
+    img = Image.open(BytesIO(image_data))
+    img.thumbnail(ANALYSIS_MAX_SIZE, Image.LANCZOS)
+    
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        background = Image.new("RGB", img.size, (255, 255, 255))
+        background.paste(img, mask=img.getchannel("A"))
+        img = background
+    else:
+        img = img.convert("RGB")
+    
+    buffer = BytesIO()
+    img.save(buffer, "JPEG", quality=85, optimize=True)
+    return buffer.getvalue(), digest
+
 
 class CharacterService:
     """Service for managing characters with AI analysis and encrypted storage"""
     
+    # Cloudinary fields stored encrypted
+    _ENCRYPTED_FIELDS = ("cloudinary_public_id", "cloudinary_url", "thumbnail_url")
+    # Encrypted fields needed for a list (non-detail) view
+    _SUMMARY_ENCRYPTED_FIELDS = ("thumbnail_url",)
+    
+    # Fields read by _format_character
+    _CHARACTER_PROJECTION = {
+        "_id": 0,
+        "character_id": 1,
+        "character_name": 1,
+        "gender": 1,
+        "voice_description": 1,
+        "keywords": 1,
+        "is_private": 1,
+        "can_speak": 1,
+        "user_id": 1,
+        "cloudinary_public_id": 1,
+        "cloudinary_url": 1,
+        "thumbnail_url": 1,
+        "created_at": 1,
+        "updated_at": 1
+    }
+    _SUMMARY_PROJECTION = {
+        field: value for field, value in _CHARACTER_PROJECTION.items()
+        if field not in ("cloudinary_public_id", "cloudinary_url")
+    }
+    
+    # How long a cached image analysis is reused
+    ANALYSIS_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+    
     def __init__(self):
         self.collection_name = "characters"
+        self.analysis_cache_collection_name = "character_analysis_cache"
+    
+    @cached_property
+    def collection(self) -> AsyncCollection:
+        """Characters collection handle (resolved on first use, then reused)"""
+        return get_async_collection(self.collection_name)
+    
+    @cached_property
+    def analysis_cache(self) -> AsyncCollection:
+        """Image analysis cache collection handle (resolved on first use, then reused)"""
+        return get_async_collection(self.analysis_cache_collection_name)
+    
+    async def create_indexes(self) -> None:
+        """Create indexes backing character lookups and the privacy-filtered listing"""
+        collection = self.collection
+        
+        # Replaced by character_id_1 below (same key, narrower partial filter)
+        try:
+            await collection.drop_index("character_id_legacy")
+        except OperationFailure:
+            pass  # Already dropped (or never created)
+        
+        # character_id lookups (partial: older analysis documents have no character_id)
+        await collection.create_index(
+            [("character_id", 1)],
+            unique=True,
+            partialFilterExpression={"character_id": {"$type": "string"}}
+        )
+        
+        # User's own characters, newest first
+        await collection.create_index([("user_id", 1), ("created_at", -1)])
+        
+        # Public characters, newest first
+        await collection.create_index(
+            [("created_at", -1)],
+            partialFilterExpression={"is_private": False}
+        )
+        
+        # Keyword filters (multikey index over the pre-split keywords)
+        await collection.create_index([("keywords_list", 1)])
+        
+        # Expire cached analyses
+        analysis_cache = self.analysis_cache
+        await analysis_cache.create_index(
+            [("created_at", 1)],
+            expireAfterSeconds=self.ANALYSIS_CACHE_TTL_SECONDS
+        )
+        
+        logger.info("character_service.indexes_created")
     
     async def analyze_character_image(
         self,
         image: UploadFile,
         character_name: str,
-        can_speak: bool
+        can_speak: bool,
+        user_id: Optional[str] = None
     ) -> Dict:
         """
         Analyze character image using AI to suggest voice type and keywords
@@ -38,17 +187,49 @@ class CharacterService:
             image: Uploaded image file
             character_name: Name of the character
             can_speak: Whether character can speak human language (guides voice description format)
+            user_id: Optional user ID (scopes the analysis cache)
             
         Returns:
             dict: Analysis results with suggestions (including AI-detected subject)
         """
+        return await self._analyze_image_data(await image.read(), character_name, can_speak, user_id)
+    
+    async def _analyze_image_data(
+        self,
+        image_data: bytes,
+        character_name: str,
+        can_speak: bool,
+        user_id: Optional[str] = None
+    ) -> Dict:
+        """
+        Analyze already-read character image bytes (see analyze_character_image)
+        
+        Args:
+            image_data: Original image bytes
+            character_name: Name of the character
+            can_speak: Whether character can speak human language
+            user_id: Optional user ID (scopes the analysis cache)
+            
+        Returns:
+            dict: Analysis results with suggestions
+        """
         try:
-            print(f"\n🔍 Analyzing character: {character_name}")
-            print(f"🗣️  Speech capability: {'Enabled (can speak words)' if can_speak else 'Disabled (creature sounds only)'}")
+            logger.info("character.analyze name=%s can_speak=%s", character_name, can_speak)
             
-            # Read image data
-            image_data = await image.read()
-            image_base64 = base64.b64encode(image_data).decode()
+            # Shrink the image before sending it to Gemini (CPU-bound: off the event loop)
+            image_data, image_digest = await asyncio.to_thread(_prepare_for_analysis, image_data)
+            
+            # Reuse this user's previous analysis of the exact same picture
+            # (the prompt depends on name and can_speak). Anonymous calls are not cached.
+            analysis_cache = self.analysis_cache
+            cache_key = None
+            cached = None
+            if user_id:
+                cache_key = f"{user_id}:{image_digest}:{int(can_speak)}:{character_name.strip().lower()}"
+                cached = await analysis_cache.find_one({"_id": cache_key})
+            if cached:
+                logger.info("character.analyze_cache_hit name=%s", character_name)
+                return cached["response"]
             
             # Use Gemini to analyze the character
             from app.services.genai_service import analyze_image_with_gemini
@@ -61,14 +242,16 @@ class CharacterService:
                 can_speak=can_speak
             )
             
-            analysis_result = analyze_image_with_gemini(
-                image_data=image_base64,
+            # Blocking HTTP call: run it in a worker thread to keep the event loop free
+            analysis_result = await asyncio.to_thread(
+                analyze_image_with_gemini,
+                image_data=image_data,
                 prompt=prompt
             )
             
             # Parse the analysis result
             if isinstance(analysis_result, str):
-                analysis_data = json.loads(analysis_result)
+                analysis_data = orjson.loads(analysis_result)
             else:
                 analysis_data = analysis_result
             
@@ -83,8 +266,8 @@ class CharacterService:
             if len(keywords) > 500:
                 keywords = keywords[:497] + "..."
             
-            print(f"✅ Analysis complete: {name} ({gender})")
-            print(f"📝 AI-detected subject: {subject}")
+            logger.info("character.analyzed name=%s gender=%s", name, gender)
+            logger.debug("character.analyzed subject=%s", subject)
             
             # Build simplified response - NO character_id yet (generated in create step)
             response = {
@@ -96,10 +279,20 @@ class CharacterService:
                 "can_speak": can_speak  # Boolean: true if can speak, false if only creature sounds
             }
             
+            if cache_key:
+                try:
+                    await analysis_cache.replace_one(
+                        {"_id": cache_key},
+                        {"response": response, "created_at": datetime.now(timezone.utc)},
+                        upsert=True
+                    )
+                except Exception as e:
+                    logger.warning("character.analyze_cache_failed error=%s", e)
+            
             return response
             
         except Exception as e:
-            print(f"❌ Analysis failed: {str(e)}")
+            logger.error("character.analyze_failed name=%s error=%s", character_name, e)
             raise ValueError(f"Failed to analyze character: {str(e)}")
     
     def _map_speaking_style_to_voice(self, speaking_style: str, character_data: dict) -> str:
@@ -121,39 +314,15 @@ class CharacterService:
         # Combine all text for analysis
         all_text = f"{speaking_style} {personality} {height}".lower()
         
-        print(f"🔍 Analyzing voice from: '{all_text[:100]}'")
-        
-        # Score each voice type
-        soft_score = 0
-        deep_score = 0
-        magical_score = 0
-        
-        # Soft and High-Pitched indicators
-        soft_keywords = ["shy", "soft", "gentle", "playful", "cute", "small", "young", 
-                        "child", "friendly", "sweet", "light", "cheerful", "bubbly",
-                        "feminine", "delicate", "timid", "nervous", "high"]
-        for keyword in soft_keywords:
-            if keyword in all_text:
-                soft_score += 1
-        
-        # Deep and Grumbly indicators
-        deep_keywords = ["confident", "authoritative", "deep", "serious", "strong", 
-                        "powerful", "commanding", "bold", "gruff", "rough", "tough",
-                        "masculine", "large", "tall", "big", "muscular", "heavy",
-                        "intimidating", "stern", "firm", "low"]
-        for keyword in deep_keywords:
-            if keyword in all_text:
-                deep_score += 1
-        
-        # Magical or Otherworldly indicators
-        magical_keywords = ["mysterious", "ethereal", "magical", "mystical", "enchanting",
-                           "otherworldly", "supernatural", "spiritual", "cosmic", "divine",
-                           "ancient", "wise", "enigmatic", "arcane", "celestial"]
-        for keyword in magical_keywords:
-            if keyword in all_text:
-                magical_score += 1
-        
-        print(f"📊 Voice scores - Soft: {soft_score}, Deep: {deep_score}, Magical: {magical_score}")
+        logger.debug("character.voice_text text=%.100s", all_text)
+        
+        # Score each voice type by how many of its indicator words appear
+        words = set(_WORD_RE.findall(all_text))
+        soft_score = len(SOFT_VOICE_KEYWORDS & words)
+        deep_score = len(DEEP_VOICE_KEYWORDS & words)
+        magical_score = len(MAGICAL_VOICE_KEYWORDS & words)
+        
+        logger.debug("character.voice_scores soft=%s deep=%s magical=%s", soft_score, deep_score, magical_score)
         
         # Return the highest scoring voice type
         if magical_score > 0 and magical_score >= soft_score and magical_score >= deep_score:
@@ -237,26 +406,96 @@ class CharacterService:
             can_speak: Can speak human language (true) or only creature sounds (false)
             user_id: Optional user ID for multi-user support
             
+        Returns:
+            dict: Created character data
+        """
+        # Upload the spooled upload file directly (not buffered into a bytes copy here)
+        await image.seek(0)
+        return await self._store_character(
+            image_source=image.file,
+            character_name=character_name,
+            subject=subject,
+            gender=gender,
+            voice_description=voice_description,
+            keywords=keywords,
+            is_private=is_private,
+            can_speak=can_speak,
+            user_id=user_id
+        )
+    
+    async def analyze_and_create_character(
+        self,
+        image: UploadFile,
+        character_name: str,
+        is_private: bool,
+        can_speak: bool,
+        user_id: Optional[str] = None
+    ) -> Dict:
+        """
+        Analyze a character image and create the character from the AI suggestions
+        
+        Reads the upload once and reuses the bytes for both steps.
+        
+        Args:
+            image: Uploaded image file
+            character_name: Name of the character
+            is_private: Private (true) or public (false)
+            can_speak: Can speak human language (true) or only creature sounds (false)
+            user_id: Optional user ID for multi-user support
+            
+        Returns:
+            dict: Created character data (same as create_character)
+        """
+        image_data = await image.read()
+        
+        analysis = await self._analyze_image_data(image_data, character_name, can_speak, user_id)
+        
+        return await self._store_character(
+            image_source=image_data,
+            character_name=analysis["character_name"],
+            subject=analysis["subject"],
+            gender=analysis["gender"],
+            voice_description=analysis["voice_description"],
+            keywords=analysis["keywords"],
+            is_private=is_private,
+            can_speak=can_speak,
+            user_id=user_id
+        )
+    
+    async def _store_character(
+        self,
+        image_source: Union[bytes, BinaryIO],
+        character_name: str,
+        subject: str,
+        gender: str,
+        voice_description: str,
+        keywords: str,
+        is_private: bool,
+        can_speak: bool,
+        user_id: Optional[str] = None
+    ) -> Dict:
+        """
+        Upload the character image and save the character (see create_character)
+        
+        Args:
+            image_source: Image bytes or binary file object
+            
         Returns:
             dict: Created character data
         """
         try:
             # Generate character_id with format: char_charactername_uuid
             # Clean character name for ID (lowercase, remove spaces/special chars)
-            clean_name = character_name.lower().replace(" ", "").replace("-", "").replace("_", "")
-            # Take first 8 characters of UUID for shorter ID
-            short_uuid = str(uuid.uuid4()).split('-')[0]
+            clean_name = character_name.lower().translate(_ID_NAME_STRIP)
+            # 8 random hex characters for a short unique suffix
+            short_uuid = secrets.token_hex(4)
             character_id = f"char_{clean_name}_{short_uuid}"
             
-            print(f"\n💾 Creating character: {character_name} (ID: {character_id})")
-            
-            # Read image data
-            image_data = await image.read()
-            image_base64 = base64.b64encode(image_data).decode()
+            logger.info("character.create name=%s id=%s", character_name, character_id)
             
-            # Upload image to Cloudinary
-            cloudinary_result = cloudinary_service.upload_character_image(
-                image_data=image_base64,
+            # Blocking HTTP call runs in a worker thread to keep the event loop free
+            cloudinary_result = await get_cloudinary_service().upload_character_image_async(
+                image_data=image_source,
                 character_name=character_name
             )
             
@@ -269,7 +508,14 @@ class CharacterService:
             encrypted_url = encryption_service.encrypt(cloudinary_url)
             encrypted_thumbnail = encryption_service.encrypt(thumbnail_url) if thumbnail_url else None
             
+            # Pre-split keywords once so keyword filters can use an index instead of a regex scan
+            keywords_list = list(dict.fromkeys(
+                k.strip().lower() for k in keywords.split(",") if k.strip()
+            ))
+            
             # Prepare character document
+            # Naive UTC, as read back from MongoDB (so both paths format created_at alike)
+            now = datetime.utcnow()
             character_doc = {
                 "character_id": character_id,  # NOT encrypted - used for lookups
                 "character_name": character_name,
@@ -277,23 +523,24 @@ class CharacterService:
                 "gender": gender,
                 "voice_description": voice_description,
                 "keywords": keywords,  # String, not array
+                "keywords_list": keywords_list,  # Lowercased, de-duplicated keywords (indexed)
                 "is_private": is_private,
                 "can_speak": can_speak,  # Speech capability
                 "cloudinary_public_id": encrypted_public_id,  # Encrypted
                 "cloudinary_url": encrypted_url,  # Encrypted
                 "thumbnail_url": encrypted_thumbnail,  # Encrypted
-                "created_at": datetime.utcnow(),
-                "updated_at": datetime.utcnow()
+                "created_at": now,
+                "updated_at": now
             }
             
             if user_id:
                 character_doc["user_id"] = user_id
             
             # Save to MongoDB
-            collection = get_collection(self.collection_name)
-            result = collection.insert_one(character_doc)
+            collection = self.collection
+            result = await collection.insert_one(character_doc)
             
-            print(f"✅ Character created: {character_name} ({'Private' if is_private else 'Public'})")
+            logger.info("character.created id=%s private=%s", character_id, is_private)
             
             # Return response (with decrypted IDs for client)
             return {
@@ -305,19 +552,21 @@ class CharacterService:
                 "keywords": keywords,  # String, not array
                 "cloudinary_url": cloudinary_url,
                 "thumbnail_url": thumbnail_url,
-                "created_at": character_doc["created_at"].isoformat()
+                "created_at": now.isoformat()
             }
             
         except Exception as e:
-            print(f"❌ Creation failed: {str(e)}")
+            logger.error("character.create_failed name=%s error=%s", character_name, e)
             raise ValueError(f"Failed to create character: {str(e)}")
     
-    def get_all_characters(
+    async def get_all_characters(
         self,
         skip: int = 0,
         limit: int = 100,
         user_id: Optional[str] = None,
-        current_user_id: Optional[str] = None
+        current_user_id: Optional[str] = None,
+        detail: bool = True,
+        include_total: bool = True
     ) -> Dict:
         """Get all characters with pagination and privacy filtering
         
@@ -326,9 +575,11 @@ class CharacterService:
             limit: Max records to return
             user_id: Filter by specific user (optional)
             current_user_id: Current authenticated user (for privacy filtering)
+            detail: Include (and decrypt) cloudinary_url and cloudinary_public_id (False skips them)
+            include_total: Count matching characters (False returns total=None, e.g. for infinite scroll)
         """
         try:
-            collection = get_collection(self.collection_name)
+            collection = self.collection
             
             # Build query with privacy logic
             query = {}
@@ -349,20 +600,43 @@ class CharacterService:
                 query["is_private"] = False
             
             # Get total count
-            total = collection.count_documents(query)
+            if not include_total:
+                total = None
+            else:
+                total = await collection.count_documents(query)
             
             # Get characters
-            cursor = collection.find(query).skip(skip).limit(limit).sort("created_at", -1)
-            characters = list(cursor)
-            
-            # Decrypt and format
+            projection = self._CHARACTER_PROJECTION if detail else self._SUMMARY_PROJECTION
+            cursor = collection.find(query, projection).skip(skip).limit(limit).sort("created_at", -1)
+            
+            characters = [char async for char in cursor]
+            
+            # Decrypt the Cloudinary fields of the whole page in one batch
+            fields = self._ENCRYPTED_FIELDS if detail else self._SUMMARY_ENCRYPTED_FIELDS
+            encrypted_fields = [
+                char.get(field)
+                for char in characters
+                for field in fields
+            ]
+            try:
+                decrypted_fields = encryption_service.decrypt_many(encrypted_fields)
+            except ValueError:
+                # Fall back to per-character decryption so one bad document only skips itself
+                decrypted_fields = None
+            
+            # Format
+            width = len(fields)
             formatted_characters = []
-            for char in characters:
+            for i, char in enumerate(characters):
                 try:
-                    formatted_char = self._format_character(char)
+                    decrypted = (
+                        dict(zip(fields, decrypted_fields[i * width:(i + 1) * width]))
+                        if decrypted_fields is not None else None
+                    )
+                    formatted_char = self._format_character(char, decrypted, detail=detail)
                     formatted_characters.append(formatted_char)
                 except Exception as e:
-                    print(f"⚠️  Error formatting character: {str(e)}")
+                    logger.warning("character.format_failed error=%s", e)
                     continue
             
             return {
@@ -373,16 +647,16 @@ class CharacterService:
             }
             
         except Exception as e:
-            print(f"❌ Error getting characters: {str(e)}")
+            logger.error("character.list_failed error=%s", e)
             raise ValueError(f"Failed to get characters: {str(e)}")
     
-    def get_character_by_id(self, character_id: str) -> Dict:
+    async def get_character_by_id(self, character_id: str) -> Dict:
         """Get a specific character by ID"""
         try:
-            collection = get_collection(self.collection_name)
+            collection = self.collection
             
             # character_id is NOT encrypted in database, search directly
-            character = collection.find_one({"character_id": character_id})
+            character = await collection.find_one({"character_id": character_id}, self._CHARACTER_PROJECTION)
             
             if not character:
                 raise ValueError(f"Character not found: {character_id}")
@@ -390,18 +664,29 @@ class CharacterService:
             return self._format_character(character)
             
         except Exception as e:
-            print(f"❌ Error getting character: {str(e)}")
+            logger.error("character.get_failed id=%s error=%s", character_id, e)
             raise ValueError(f"Failed to get character: {str(e)}")
     
-    def _format_character(self, char_doc: dict) -> dict:
-        """Format character document for response (decrypt Cloudinary fields)"""
+    def _format_character(
+        self,
+        char_doc: dict,
+        decrypted: Optional[Dict[str, str]] = None,
+        detail: bool = True
+    ) -> dict:
+        """Format character document for response (decrypt Cloudinary fields)
+        
+        Args:
+            char_doc: Character document from MongoDB
+            decrypted: Already decrypted Cloudinary fields by name (decrypted here if omitted)
+            detail: Include cloudinary_url and cloudinary_public_id (list views skip them)
+        """
         
-        # Decrypt Cloudinary fields only
-        cloudinary_public_id = encryption_service.decrypt(char_doc["cloudinary_public_id"])
-        cloudinary_url = encryption_service.decrypt(char_doc["cloudinary_url"])
-        thumbnail_url = encryption_service.decrypt(char_doc["thumbnail_url"]) if char_doc.get("thumbnail_url") else None
+        if decrypted is None:
+            # Decrypt Cloudinary fields only
+            fields = self._ENCRYPTED_FIELDS if detail else self._SUMMARY_ENCRYPTED_FIELDS
+            decrypted = {field: encryption_service.decrypt(char_doc.get(field)) for field in fields}
         
-        return {
+        response = {
             "character_id": char_doc["character_id"],  # Already unencrypted
             "character_name": char_doc["character_name"],
             "gender": char_doc.get("gender", "undefined"),
@@ -409,14 +694,20 @@ class CharacterService:
             "keywords": char_doc["keywords"],
             "is_private": char_doc.get("is_private", False),
             "can_speak": char_doc.get("can_speak", False),  # Speech capability
-            "cloudinary_url": cloudinary_url,  # Decrypted
-            "cloudinary_public_id": cloudinary_public_id,  # Decrypted
-            "thumbnail_url": thumbnail_url,  # Decrypted
+        }
+        
+        if detail:
+            response["cloudinary_url"] = decrypted["cloudinary_url"]  # Decrypted
+            response["cloudinary_public_id"] = decrypted["cloudinary_public_id"]  # Decrypted
+        
+        response.update({
+            "thumbnail_url": decrypted["thumbnail_url"] or None,  # Decrypted
             "user_id": char_doc.get("user_id"),
             "created_at": char_doc["created_at"].isoformat(),
             "updated_at": char_doc["updated_at"].isoformat()
-        }
-
+        })
+        
+        return response
 
 # Global instance
 character_service = CharacterService()
@@ -4,13 +4,21 @@ Character Service - MongoDB Implementation
 This module provides character management functions using MongoDB instead of local files.
 """
 
-from typing import Optional, Dict, Any
+import hashlib
+import json
+from typing import Optional, Dict, Any, Iterator
 from app.services.character_repository import CharacterRepository
 
 # Initialize repository
 _character_repo = None
 
 
+def _content_digest(character_name: str, character_data: dict) -> str:
+    """Stable bulk_create client_id for a character: sha256 of its name and data"""
+    payload = json.dumps([character_name, character_data], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
 def get_character_repository() -> CharacterRepository:
     """Get or create character repository instance"""
     global _character_repo
@@ -84,7 +92,9 @@ def save_multiple_characters_to_mongodb(characters_list: list, character_names:
             name = character_names[i] if character_names and i < len(character_names) else character.get('name', f'character_{i+1}')
             characters_data.append({
                 'character_data': character,
-                'character_name': name
+                'character_name': name,
+                # Same analysis, same key: saving a batch again does not duplicate it
+                'client_id': _content_digest(name, character)
             })
         
         # Bulk save to MongoDB
@@ -122,6 +132,21 @@ def get_all_characters(skip: int = 0, limit: int = 100) -> dict:
         }
 
 
+def iter_all_characters(skip: int = 0, limit: int = 0) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all saved characters in MongoDB without loading them all at once
+    
+    Args:
+        skip: Number of records to skip (pagination)
+        limit: Maximum number of records to yield (0 = no limit)
+    
+    Returns:
+        Iterator: Character list rows, newest first
+    """
+    repo = get_character_repository()
+    return repo.iter_all(skip, limit)
+
+
 def get_character_by_id(character_id: str) -> dict:
     """
     Get a specific character by MongoDB ID
@@ -211,3 +236,20 @@ def search_characters(
             "success": False,
             "error": f"Failed to search characters: {str(e)}"
         }
+
+
+def backfill_character_list_views() -> dict:
+    """
+    Migration: store the precomputed list_view on existing characters in MongoDB
+    
+    Returns:
+        dict: Backfill result with number of updated characters
+    """
+    try:
+        repo = get_character_repository()
+        return repo.backfill_list_view()
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to backfill character list views: {str(e)}"
+        }
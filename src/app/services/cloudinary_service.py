@@ -4,15 +4,240 @@ Cloudinary Service for Character Image Storage
 Handles uploading, managing, and deleting character images in Cloudinary.
 """
 
+import asyncio
 import cloudinary
 import cloudinary.uploader
-import cloudinary.api
+import cloudinary.api_client.call_api
+import cloudinary.utils
+import cloudinary.exceptions
+import binascii
+import functools
+import logging
 import os
-import uuid
-from typing import Optional, Dict
-import base64
+import re
+import secrets
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Optional, Dict, List, Union, BinaryIO
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib codec
+    import pybase64 as base64
+except ImportError:
+    import base64
 from io import BytesIO
-from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+# Connection pool size per host, sized for concurrent uploads (see upload_many)
+HTTP_POOL_MAXSIZE = 32
+
+# Leading magic bytes -> image format, checked once against the decoded bytes
+_MAGIC = (
+    (b"\xff\xd8", "jpeg"),
+    (b"\x89PNG", "png"),
+    (b"GIF8", "gif"),
+    (b"RIFF", "webp"),
+    (b"BM", "bmp"),
+    (b"II*\x00", "tiff"),
+    (b"MM\x00*", "tiff"),
+)
+
+# The SDK raises one exception class per HTTP status (420/429 RateLimited,
+# 500 GeneralError, 400/401/403/404/409 BadRequest, AuthorizationRequired, ...).
+# Network failures and unparsable responses raise the base Error with these
+# fixed message formats, the latter carrying the status in parentheses.
+_TRANSIENT_ERROR_CLASSES = (cloudinary.exceptions.RateLimited, cloudinary.exceptions.GeneralError)
+_NETWORK_ERROR_PREFIXES = ("Socket error", "Unexpected error")
+_RETRYABLE_STATUS_RE = re.compile(r"^Error parsing server response \((?:420|429|5\d\d)\)")
+
+# Admin API limit on public_ids per delete_resources call
+DELETE_BATCH_SIZE = 100
+
+# Runs of characters not allowed in the public_id name part
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+# Largest accepted base64 image string (about 15 MB decoded)
+_MAX_B64 = 20 * 1024 * 1024
+
+# Uploads above this size use chunked upload_large; re-encoded images stay well
+# below it, but GIFs and data Pillow cannot decode are uploaded unchanged
+LARGE_UPLOAD_THRESHOLD = 5_000_000
+LARGE_UPLOAD_CHUNK_SIZE = 6_000_000
+
+# 256x256 thumbnail derived from every character image
+THUMBNAIL_TRANSFORMATION = {
+    "width": 256,
+    "height": 256,
+    "crop": "fill",
+    "gravity": "auto",
+    "quality": "auto:good"
+}
+
+# Images are resized to fit this box before upload (Cloudinary limits to 1024x1024 anyway)
+UPLOAD_MAX_SIZE = (1024, 1024)
+
+
+@functools.cache
+def initialize_cloudinary() -> None:
+    """
+    Configure the global Cloudinary SDK from environment (runs once per process)
+    
+    Also replaces the SDK's HTTP connector with a single pool that keeps up to
+    HTTP_POOL_MAXSIZE keep-alive connections to the Cloudinary API, so parallel
+    uploads reuse warm TLS connections instead of opening new ones.
+    """
+    cloudinary.config(
+        cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
+        api_key=os.getenv("CLOUDINARY_API_KEY"),
+        api_secret=os.getenv("CLOUDINARY_API_SECRET"),
+        secure=True
+    )
+    
+    _install_http_pool()
+    
+    # Verify configuration
+    if not all([
+        os.getenv("CLOUDINARY_CLOUD_NAME"),
+        os.getenv("CLOUDINARY_API_KEY"),
+        os.getenv("CLOUDINARY_API_SECRET")
+    ]):
+        logger.warning(
+            "cloudinary.credentials_missing "
+            "hint=set CLOUDINARY_CLOUD_NAME, CLOUDINARY_API_KEY, CLOUDINARY_API_SECRET in .env"
+        )
+
+
+def _install_http_pool() -> None:
+    """
+    Swap the SDK's per-module HTTP connectors for one larger keep-alive pool
+    
+    The SDK (pinned to 1.44.1 in pyproject.toml) has no public option for its
+    connection pool: uploader and call_api each build a module-level _http
+    PoolManager that keeps one connection per host. If a future release drops
+    those attributes, the SDK's own connectors are left in place.
+    """
+    modules = (cloudinary.uploader, cloudinary.api_client.call_api)  # upload/destroy, Admin API
+    if not all(hasattr(module, "_http") for module in modules):
+        logger.warning(
+            "cloudinary.http_pool_skipped sdk_version=%s reason=no _http connector",
+            cloudinary.VERSION
+        )
+        return
+    
+    # The SDK's default pool keeps one connection per host and discards the rest
+    http = cloudinary.utils.get_http_connector(
+        cloudinary.config(),
+        dict(cloudinary.CERT_KWARGS, num_pools=4, maxsize=HTTP_POOL_MAXSIZE, block=False)
+    )
+    for module in modules:
+        module._http = http
+
+
+def _is_transient_error(error: cloudinary.exceptions.Error) -> bool:
+    """
+    Whether a Cloudinary error is a network failure, rate limit or server-side error
+    
+    Classified by HTTP status (http_code when set, otherwise the exception class
+    the SDK picked for it); 4xx errors such as an invalid image fail fast.
+    """
+    status = getattr(error, "http_code", None)
+    if status is not None:
+        return status in (420, 429) or status >= 500
+    if isinstance(error, _TRANSIENT_ERROR_CLASSES):
+        return True
+    if type(error) is not cloudinary.exceptions.Error:
+        return False
+    message = str(error)
+    return message.startswith(_NETWORK_ERROR_PREFIXES) or _RETRYABLE_STATUS_RE.match(message) is not None
+
+
+def _retry(fn, *args, attempts: int = 3, **kwargs):
+    """
+    Call fn, retrying transient Cloudinary/network errors with exponential backoff
+    
+    Waits 1s, then 2s between attempts, or the server's retry_after when given.
+    Other errors and the last transient error are raised.
+    """
+    for attempt in range(attempts):
+        try:
+            return fn(*args, **kwargs)
+        except cloudinary.exceptions.Error as e:
+            if attempt == attempts - 1 or not _is_transient_error(e):
+                raise
+            delay = int(getattr(e, "retry_after", 0) or 0) or 2 ** attempt
+            logger.warning(
+                "cloudinary.retry call=%s attempt=%s delay=%s error=%s",
+                getattr(fn, "__name__", fn), attempt + 1, delay, e
+            )
+            time.sleep(delay)
+
+
+def _detect_format(header: bytes) -> Optional[str]:
+    """Image format from the leading magic bytes, or None if not recognized"""
+    return next((fmt for sig, fmt in _MAGIC if header.startswith(sig)), None)
+
+
+def _shrink_for_upload(raw: bytes, image_format: str) -> tuple:
+    """
+    Resize an image to fit UPLOAD_MAX_SIZE and re-encode it as WebP
+    
+    GIFs (possibly animated) and data Pillow cannot decode are returned
+    unchanged, as is any image the re-encode would not make smaller.
+    Installing Pillow-SIMD as a drop-in replacement speeds up the resize.
+    
+    Args:
+        raw: Original image bytes
+        image_format: Format detected from the magic bytes
+        
+    Returns:
+        tuple: (image bytes, format)
+    """
+    if image_format == "gif":
+        return raw, image_format
+    
+    # Pillow is only needed once something is uploaded
+    from PIL import Image
+    
+    try:
+        img = Image.open(BytesIO(raw))
+        img.thumbnail(UPLOAD_MAX_SIZE, Image.LANCZOS)
+        
+        if img.mode not in ("RGB", "RGBA"):
+            has_alpha = img.mode in ("LA", "PA") or "transparency" in img.info
+            img = img.convert("RGBA" if has_alpha else "RGB")
+        
+        buffer = BytesIO()
+        img.save(buffer, "WEBP", quality=82, method=4)
+    except Exception as e:
+        logger.warning("cloudinary.reencode_skipped error=%s", e)
+        return raw, image_format
+    
+    shrunk = buffer.getvalue()
+    if len(shrunk) >= len(raw):
+        return raw, image_format
+    return shrunk, "webp"
+
+
+def _build_url(public_id: str, transformation: Optional[Dict]) -> str:
+    """Build a secure Cloudinary URL for an image"""
+    if transformation:
+        url, _ = cloudinary.utils.cloudinary_url(
+            public_id,
+            transformation=transformation,
+            secure=True
+        )
+    else:
+        url, _ = cloudinary.utils.cloudinary_url(
+            public_id,
+            secure=True
+        )
+    return url
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_url(public_id: str, transformation_key: Optional[tuple]) -> str:
+    """Memoized _build_url; transformation_key is the sorted transformation items"""
+    return _build_url(public_id, dict(transformation_key) if transformation_key else None)
 
 
 class CloudinaryService:
@@ -20,25 +245,14 @@ class CloudinaryService:
     
     def __init__(self):
         """Initialize Cloudinary with credentials from environment"""
-        cloudinary.config(
-            cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
-            api_key=os.getenv("CLOUDINARY_API_KEY"),
-            api_secret=os.getenv("CLOUDINARY_API_SECRET"),
-            secure=True
-        )
+        initialize_cloudinary()
         
-        # Verify configuration
-        if not all([
-            os.getenv("CLOUDINARY_CLOUD_NAME"),
-            os.getenv("CLOUDINARY_API_KEY"),
-            os.getenv("CLOUDINARY_API_SECRET")
-        ]):
-            print("⚠️  WARNING: Cloudinary credentials not fully configured!")
-            print("⚠️  Set CLOUDINARY_CLOUD_NAME, CLOUDINARY_API_KEY, CLOUDINARY_API_SECRET in .env")
+        # Background workers for cleanup deletes nobody waits on
+        self._delete_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cld-del")
     
     def upload_character_image(
         self,
-        image_data: str,
+        image_data: Union[str, bytes, BinaryIO],
         character_name: str,
         folder: str = "characters"
     ) -> Dict:
@@ -46,7 +260,8 @@ class CloudinaryService:
         Upload character image to Cloudinary
         
         Args:
-            image_data: Base64 encoded image data (without data URI prefix)
+            image_data: Raw image bytes, a binary file-like object, or base64 encoded
+                image data (without data URI prefix)
             character_name: Name of the character (used in public_id)
             folder: Cloudinary folder (default: "characters")
             
@@ -55,60 +270,92 @@ class CloudinaryService:
         """
         try:
             # Generate unique public_id
-            unique_id = str(uuid.uuid4())[:8]
-            safe_name = character_name.replace(" ", "_").lower()
+            unique_id = secrets.token_hex(4)
+            safe_name = _SLUG_RE.sub("_", character_name.lower()).strip("_")[:40]
             public_id = f"{folder}/character_{safe_name}_{unique_id}"
             
-            # Format base64 data as data URI for Cloudinary
-            # Cloudinary expects: "data:image/png;base64,iVBORw0KGgo..."
-            if not image_data.startswith("data:"):
-                # Detect image format from base64 header
-                if image_data.startswith("/9j/"):
-                    image_format = "jpeg"
-                elif image_data.startswith("iVBORw0"):
-                    image_format = "png"
-                elif image_data.startswith("R0lGOD"):
-                    image_format = "gif"
-                elif image_data.startswith("UklGR"):
-                    image_format = "webp"
-                else:
-                    image_format = "png"  # Default to PNG
+            # Bring every input to raw bytes; they are uploaded as a multipart file
+            if isinstance(image_data, (bytes, bytearray)):
+                raw = bytes(image_data)
+            elif hasattr(image_data, "read"):
+                raw = image_data.read()
+            # Base64 text is decoded once (a data URI would send 4/3 of the
+            # payload and be decoded again by Cloudinary)
+            elif not image_data.startswith("data:"):
+                # Reject oversized or non-image input before decoding the whole payload
+                if len(image_data) > _MAX_B64:
+                    raise ValueError(f"Image data too large ({len(image_data)} base64 characters, max {_MAX_B64})")
+                try:
+                    if _detect_format(base64.b64decode(image_data[:16], validate=False)) is None:
+                        raise ValueError("Image data is not a supported image format")
+                    raw = base64.b64decode(image_data, validate=False)
+                except binascii.Error as e:
+                    raise ValueError(f"Invalid base64 image data: {str(e)}")
+            else:
+                raw = None
+            
+            if raw is not None:
+                # Detect image format from magic bytes
+                image_format = _detect_format(raw) or "png"
                 
-                image_data = f"data:image/{image_format};base64,{image_data}"
-            
-            # Upload with transformations
-            result = cloudinary.uploader.upload(
-                image_data,
-                folder=folder,
-                public_id=public_id,
-                transformation=[
-                    {
-                        "width": 1024,
-                        "height": 1024,
-                        "crop": "limit",
-                        "quality": "auto:good"
-                    }
-                ],
-                eager=[
-                    {
-                        "width": 256,
-                        "height": 256,
-                        "crop": "fill",
-                        "gravity": "auto",
-                        "quality": "auto:good"
-                    }
-                ],
-                eager_async=False,
-                resource_type="image"
-            )
+                # Send at most 1024x1024 pixels instead of the full-size original
+                raw, image_format = _shrink_for_upload(raw, image_format)
+                upload_name = f"{safe_name}.{image_format}"
             
-            # Get thumbnail URL
-            thumbnail_url = None
-            if result.get('eager'):
-                thumbnail_url = result['eager'][0].get('secure_url')
+            # Generate the thumbnail in the background when a webhook is configured
+            # to receive the completion notification; otherwise wait for it
+            eager_webhook = os.getenv("CLOUDINARY_EAGER_WEBHOOK")
+            if eager_webhook:
+                eager_options = {"eager_async": True, "eager_notification_url": eager_webhook}
+            else:
+                eager_options = {"eager_async": False}
+            
+            # Large images are streamed in chunks instead of one multipart POST
+            if raw is not None and len(raw) > LARGE_UPLOAD_THRESHOLD:
+                upload = functools.partial(cloudinary.uploader.upload_large, chunk_size=LARGE_UPLOAD_CHUNK_SIZE)
+            else:
+                upload = cloudinary.uploader.upload
+            
+            def send() -> Dict:
+                # Each attempt sends the whole file again from a fresh stream
+                # (upload_large closes the stream it is given)
+                if raw is not None:
+                    file = BytesIO(raw)
+                    file.name = upload_name
+                else:
+                    file = image_data
+                return upload(
+                    file,
+                    folder=folder,
+                    public_id=public_id,
+                    transformation=[
+                        {
+                            "width": 1024,
+                            "height": 1024,
+                            "crop": "limit",
+                            "quality": "auto:good"
+                        }
+                    ],
+                    eager=[THUMBNAIL_TRANSFORMATION],
+                    **eager_options,
+                    resource_type="image"
+                )
+            
+            # Upload with transformations, retrying transient failures
+            result = _retry(send)
             
             cloudinary_public_id = result.get("public_id")
-            print(f"☁️  Uploaded to Cloudinary: {character_name}")
+            
+            # Thumbnail URL is derived from the public_id, so it is known even
+            # before an async eager transformation has finished
+            thumbnail_url, _ = cloudinary.utils.cloudinary_url(
+                cloudinary_public_id,
+                transformation=[THUMBNAIL_TRANSFORMATION],
+                version=result.get("version"),
+                format=result.get("format"),
+                secure=True
+            )
+            logger.info("cloudinary.uploaded name=%s public_id=%s", character_name, cloudinary_public_id)
             
             return {
                 "success": True,
@@ -123,7 +370,7 @@ class CloudinaryService:
             }
             
         except Exception as e:
-            print(f"❌ Cloudinary upload error: {str(e)}")
+            logger.error("cloudinary.upload_failed name=%s error=%s", character_name, e)
             raise ValueError(f"Failed to upload image to Cloudinary: {str(e)}")
     
     def delete_character_image(self, public_id: str) -> Dict:
@@ -137,24 +384,100 @@ class CloudinaryService:
             dict: Deletion result
         """
         try:
-            print(f"🗑️  Deleting image from Cloudinary: {public_id}")
+            logger.debug("cloudinary.delete public_id=%s", public_id)
             
-            result = cloudinary.uploader.destroy(
+            result = _retry(
+                cloudinary.uploader.destroy,
                 public_id,
                 resource_type="image"
             )
             
             if result.get("result") == "ok":
-                print(f"✅ Image deleted successfully!")
+                logger.info("cloudinary.deleted public_id=%s", public_id)
                 return {"success": True, "message": "Image deleted"}
             else:
-                print(f"⚠️  Image deletion result: {result.get('result')}")
+                logger.warning("cloudinary.delete_result public_id=%s result=%s", public_id, result.get("result"))
                 return {"success": False, "message": result.get("result")}
                 
         except Exception as e:
-            print(f"❌ Cloudinary deletion error: {str(e)}")
+            logger.error("cloudinary.delete_failed public_id=%s error=%s", public_id, e)
             raise ValueError(f"Failed to delete image from Cloudinary: {str(e)}")
     
+    def delete_character_images(self, public_ids: List[str]) -> Dict:
+        """
+        Delete many character images with batched Admin API calls
+        
+        Sends up to 100 public_ids per request; batches run in parallel. A batch
+        that still fails after retries lands in failed (public_id -> error)
+        without discarding the results of the other batches.
+        
+        Args:
+            public_ids: Cloudinary public_ids of the images
+            
+        Returns:
+            dict: success flag plus deleted, not_found and failed public_ids
+        """
+        # Admin API module is only needed for bulk deletes
+        import cloudinary.api
+        
+        batches = [
+            public_ids[i:i + DELETE_BATCH_SIZE]
+            for i in range(0, len(public_ids), DELETE_BATCH_SIZE)
+        ]
+        logger.debug("cloudinary.delete_many count=%s batches=%s", len(public_ids), len(batches))
+        
+        futures = {
+            self._delete_pool.submit(
+                _retry, cloudinary.api.delete_resources, batch, resource_type="image"
+            ): batch
+            for batch in batches
+        }
+        
+        deleted, not_found, failed = [], [], {}
+        for future in as_completed(futures):
+            batch = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                logger.error("cloudinary.delete_batch_failed size=%s error=%s", len(batch), e)
+                failed.update(dict.fromkeys(batch, str(e)))
+                continue
+            for public_id, status in result.get("deleted", {}).items():
+                (deleted if status == "deleted" else not_found).append(public_id)
+        
+        logger.info(
+            "cloudinary.deleted_many deleted=%s not_found=%s failed=%s",
+            len(deleted), len(not_found), len(failed)
+        )
+        return {
+            "success": not not_found and not failed,
+            "deleted": deleted,
+            "not_found": not_found,
+            "failed": failed
+        }
+    
+    def delete_character_image_background(self, public_id: str) -> Future:
+        """
+        Delete character image in a background thread and return immediately
+        
+        Transient failures are retried by delete_character_image.
+        
+        Args:
+            public_id: Cloudinary public_id of the image
+            
+        Returns:
+            Future: Resolves to the deletion result, or None if the delete failed
+        """
+        return self._delete_pool.submit(self._delete_quietly, public_id)
+    
+    def _delete_quietly(self, public_id: str) -> Optional[Dict]:
+        """Delete an image, logging instead of raising on failure"""
+        try:
+            return self.delete_character_image(public_id)
+        except Exception as e:
+            logger.error("cloudinary.delete_abandoned public_id=%s error=%s", public_id, e)
+            return None
+    
     def get_image_url(self, public_id: str, transformation: Optional[Dict] = None) -> str:
         """
         Get Cloudinary URL for an image with optional transformation
@@ -167,22 +490,15 @@ class CloudinaryService:
             str: Cloudinary URL
         """
         try:
-            if transformation:
-                url, _ = cloudinary.utils.cloudinary_url(
-                    public_id,
-                    transformation=transformation,
-                    secure=True
-                )
-            else:
-                url, _ = cloudinary.utils.cloudinary_url(
-                    public_id,
-                    secure=True
-                )
-            
-            return url
+            transformation_key = tuple(sorted(transformation.items())) if transformation else None
+            try:
+                return _cached_url(public_id, transformation_key)
+            except TypeError:
+                # Unhashable (nested) transformation values: build the URL uncached
+                return _build_url(public_id, transformation)
             
         except Exception as e:
-            print(f"❌ Error generating Cloudinary URL: {str(e)}")
+            logger.error("cloudinary.url_failed public_id=%s error=%s", public_id, e)
             return ""
     
     def update_character_image(
@@ -195,6 +511,8 @@ class CloudinaryService:
         """
         Update character image (delete old, upload new)
         
+        The old image is deleted in the background; only the upload is waited on.
+        
         Args:
             old_public_id: Public ID of old image to delete
             new_image_data: New image data to upload
@@ -205,21 +523,119 @@ class CloudinaryService:
             dict: Upload result for new image
         """
         try:
-            # Delete old image
+            # Delete old image (cleanup only, nothing depends on it)
             if old_public_id:
-                print(f"🗑️  Deleting old image: {old_public_id}")
-                self.delete_character_image(old_public_id)
+                logger.debug("cloudinary.replace old_public_id=%s", old_public_id)
+                self.delete_character_image_background(old_public_id)
             
             # Upload new image
             return self.upload_character_image(new_image_data, character_name, folder)
             
         except Exception as e:
-            print(f"❌ Error updating character image: {str(e)}")
+            logger.error("cloudinary.update_failed name=%s error=%s", character_name, e)
             raise ValueError(f"Failed to update character image: {str(e)}")
+    
+    async def upload_character_image_async(
+        self,
+        image_data: Union[str, bytes, BinaryIO],
+        character_name: str,
+        folder: str = "characters"
+    ) -> Dict:
+        """
+        Upload character image without blocking the event loop
+        
+        Runs upload_character_image in a worker thread.
+        
+        Args:
+            image_data: Raw image bytes, a binary file-like object, or base64 encoded image data
+            character_name: Name of the character (used in public_id)
+            folder: Cloudinary folder (default: "characters")
+            
+        Returns:
+            dict: Upload result with url, public_id, etc.
+        """
+        return await asyncio.to_thread(
+            self.upload_character_image,
+            image_data,
+            character_name,
+            folder
+        )
+    
+    async def delete_character_image_async(self, public_id: str) -> Dict:
+        """
+        Delete character image without blocking the event loop
+        
+        Args:
+            public_id: Cloudinary public_id of the image
+            
+        Returns:
+            dict: Deletion result
+        """
+        return await asyncio.to_thread(self.delete_character_image, public_id)
+    
+    async def update_character_image_async(
+        self,
+        old_public_id: str,
+        new_image_data: Union[str, bytes, BinaryIO],
+        character_name: str,
+        folder: str = "characters"
+    ) -> Dict:
+        """
+        Update character image without blocking the event loop
+        
+        The old image is deleted in the background (see update_character_image);
+        only the upload is awaited.
+        
+        Args:
+            old_public_id: Public ID of old image to delete
+            new_image_data: New image data to upload
+            character_name: Character name
+            folder: Cloudinary folder
+            
+        Returns:
+            dict: Upload result for new image
+        """
+        return await asyncio.to_thread(
+            self.update_character_image,
+            old_public_id,
+            new_image_data,
+            character_name,
+            folder
+        )
+    
+    async def upload_many(self, items: List[Dict], max_concurrency: int = 8) -> List[Dict]:
+        """
+        Upload several character images concurrently
+        
+        Args:
+            items: Keyword arguments for upload_character_image_async, one dict per image
+            max_concurrency: Maximum number of uploads in flight at once
+            
+        Returns:
+            list: Upload results in the same order as items. Failed uploads are
+                returned as {"success": False, "error": ...} instead of raising.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def upload_one(item: Dict) -> Dict:
+            async with semaphore:
+                try:
+                    return await self.upload_character_image_async(**item)
+                except Exception as e:
+                    return {"success": False, "error": str(e)}
+        
+        return await asyncio.gather(*(upload_one(item) for item in items))
 
 
-# Global instance
-cloudinary_service = CloudinaryService()
+@functools.lru_cache(maxsize=1)
+def get_cloudinary_service() -> CloudinaryService:
+    """
+    Get the shared CloudinaryService, created on first use
+    
+    Nothing is configured at import time. Usable directly or as a FastAPI
+    dependency: Depends(get_cloudinary_service).
+    """
+    return CloudinaryService()
 
 
 if __name__ == "__main__":
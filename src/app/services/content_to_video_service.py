@@ -1,23 +1,130 @@
 """
 Unified service to convert any content type (story, meme, free content) to video generation prompts
 """
+import asyncio
 import json
-import re
-import time
+import logging
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from itertools import chain
+from typing import Awaitable, Callable, Optional, Union
+
+from app.services.file_storage_manager import storage_manager, ContentType
+from app.services.genai_service import download_video, generate_video_from_payload, generate_video_with_keyframes
+from app.services.imagen_service import generate_first_frame_with_imagen, generate_last_frame_with_imagen
+from app.utils.retry_policy import TokenBucket, backoff_delay, is_rate_limit_error, is_temporary_error
+
+logger = logging.getLogger(__name__)
+
+# Admission control for Veo keyframe requests: one request every 2s on average,
+# with bursts of up to 3 when the provider has been idle
+_VEO_BUCKET = TokenBucket(rate=0.5, burst=3)
+
+
+@dataclass(slots=True)
+class StorySegmentPrompt:
+    """Video prompt extracted from a story segment"""
+    prompt: str
+    segment_number: int
+    content_type: str  # Segment kind: 'narration' or 'dialogue'
+    duration_seconds: int
+    characters_present: list
+    background_type: str
+    mood: str
+    camera_style: str
+    lighting: str
+    color_palette: str
+    narrator_voice: dict
+    segment_narrator: dict
+    original_content_type: str = "story"
+
+
+@dataclass(slots=True)
+class MemeSegmentPrompt:
+    """Video prompt extracted from a meme segment"""
+    prompt: str
+    segment_number: int
+    duration_seconds: int
+    characters_present: list
+    meme_type: str
+    comedy_style: str
+    mood: str
+    camera_style: str
+    narrator_voice: dict
+    segment_narrator: dict
+    content_type: str = "meme"
+    original_content_type: str = "meme"
+
+
+@dataclass(slots=True)
+class FreeContentSegmentPrompt:
+    """Video prompt extracted from a free content segment"""
+    prompt: str
+    segment_number: int
+    duration_seconds: int
+    content_category: str
+    target_audience: str
+    value_proposition: str
+    camera_style: str
+    lighting: str
+    color_scheme: str
+    narrator_voice: dict
+    segment_narrator: dict
+    content_type: str = "free_content"
+    mood: str = "engaging"
+    original_content_type: str = "free_content"
+
+
+SegmentPrompt = Union[StorySegmentPrompt, MemeSegmentPrompt, FreeContentSegmentPrompt]
+
+
+# Typographic dashes and smart quotes -> ASCII equivalents (explicit codepoints)
+_CLEAN_TABLE = str.maketrans({
+    '\u2011': '-',  # non-breaking hyphen
+    '\u2013': '-',  # en-dash
+    '\u2014': '-',  # em-dash
+    '\u201c': '"',  # left double quote
+    '\u201d': '"',  # right double quote
+    '\u2018': "'",  # left single quote
+    '\u2019': "'",  # right single quote
+})
 
 
 def clean_json_string(text: str) -> str:
     """Clean JSON string by replacing problematic characters"""
-    # Replace en-dash and em-dash with regular dash
-    text = text.replace('‑', '-').replace('—', '-').replace('–', '-')
+    # Common case: pure ASCII (an O(1) flag check) - the table only maps non-ASCII
+    if text.isascii():
+        return text
+    
+    # Replace dashes and smart quotes in a single pass
+    text = text.translate(_CLEAN_TABLE)
     
-    # Replace smart quotes with regular quotes
-    text = text.replace('"', '"').replace('"', '"').replace(''', "'").replace(''', "'")
+    if text.isascii():
+        return text
     
     # Remove other problematic Unicode characters
-    text = re.sub(r'[^\x00-\x7F]+', '', text)
+    return text.encode('ascii', 'ignore').decode('ascii')
+
+
+def _join_prompt_sections(sections) -> str:
+    """
+    Join (label, value) prompt sections into "Label: value. Label: value"
     
-    return text
+    Sections with an empty value are skipped; a None label emits the value as-is.
+    """
+    # A single str.join measured ~30% faster than writing pieces to an io.StringIO
+    return ". ".join(
+        value if label is None else f"{label}: {value}"
+        for label, value in sections
+        if value
+    )
+
+
+# Top-level keys that identify the content type
+_CONTENT_TYPE_MARKERS = frozenset({'characters_roster', 'segments', 'meme_type', 'content_type', 'value_proposition'})
 
 
 def detect_content_type(content_data: dict) -> str:
@@ -30,16 +137,19 @@ def detect_content_type(content_data: dict) -> str:
     Returns:
         str: Content type ('story', 'meme', 'free_content')
     """
+    # One pass over the document's keys instead of a membership test per branch
+    keys = content_data.keys() & _CONTENT_TYPE_MARKERS
+    
     # Check for story-specific fields
-    if 'characters_roster' in content_data and 'segments' in content_data:
-        return 'story'
+    if 'characters_roster' in keys:
+        return 'story' if 'segments' in keys else 'meme'
     
     # Check for meme-specific fields
-    if 'meme_type' in content_data or 'characters_roster' in content_data:
+    if 'meme_type' in keys:
         return 'meme'
     
     # Check for free content-specific fields
-    if 'content_type' in content_data or 'value_proposition' in content_data:
+    if 'content_type' in keys or 'value_proposition' in keys:
         return 'free_content'
     
     # Default fallback - check segments structure
@@ -56,7 +166,44 @@ def detect_content_type(content_data: dict) -> str:
     return 'story'  # Default fallback
 
 
-def extract_video_prompt_from_content_segment(content_data: dict, segment_number: int, content_type: str = None) -> dict:
+def index_characters_roster(content_data: dict) -> dict:
+    """
+    Map character id -> roster entry for O(1) lookups per segment
+    
+    Args:
+        content_data: The content data dictionary
+    
+    Returns:
+        dict: Roster entries keyed by 'id' (first entry wins on duplicate ids)
+    """
+    roster = content_data.get('characters_roster', [])
+    return {c['id']: c for c in reversed(roster) if 'id' in c}
+
+
+@dataclass(slots=True)
+class ContentContext:
+    """Document-level values every segment extractor needs, resolved once per document"""
+    roster_by_id: dict
+    narrator_voice: dict
+    meme_type: str
+    content_category: str
+    target_audience: str
+    value_proposition: str
+    
+    @classmethod
+    def from_content(cls, content_data: dict) -> "ContentContext":
+        """Resolve the shared values from the content data"""
+        return cls(
+            roster_by_id=index_characters_roster(content_data),
+            narrator_voice=content_data.get('narrator_voice', {}),
+            meme_type=content_data.get('meme_type', 'comedy'),
+            content_category=content_data.get('content_type', 'educational'),
+            target_audience=content_data.get('target_audience', 'general'),
+            value_proposition=content_data.get('value_proposition', '')
+        )
+
+
+def extract_video_prompt_from_content_segment(content_data: dict, segment_number: int, content_type: str = None, context: ContentContext = None) -> SegmentPrompt:
     """
     Extract a clean video generation prompt from any content type segment
     
@@ -64,9 +211,10 @@ def extract_video_prompt_from_content_segment(content_data: dict, segment_number
         content_data: The complete content data
         segment_number: Which segment to extract (1-based indexing)
         content_type: Override content type detection
+        context: Pre-built ContentContext, to reuse across segments
     
     Returns:
-        dict: Clean prompt data for video generation
+        SegmentPrompt: Clean prompt data for video generation
     """
     if content_type is None:
         content_type = detect_content_type(content_data)
@@ -81,11 +229,11 @@ def extract_video_prompt_from_content_segment(content_data: dict, segment_number
         
         # Extract based on content type
         if content_type == 'story':
-            return extract_story_segment_prompt(content_data, segment, segment_number)
+            return extract_story_segment_prompt(content_data, segment, segment_number, context)
         elif content_type == 'meme':
-            return extract_meme_segment_prompt(content_data, segment, segment_number)
+            return extract_meme_segment_prompt(content_data, segment, segment_number, context)
         elif content_type == 'free_content':
-            return extract_free_content_segment_prompt(content_data, segment, segment_number)
+            return extract_free_content_segment_prompt(content_data, segment, segment_number, context)
         else:
             raise ValueError(f"Unknown content type: {content_type}")
             
@@ -93,195 +241,224 @@ def extract_video_prompt_from_content_segment(content_data: dict, segment_number
         raise ValueError(f"Error extracting video prompt: {str(e)}")
 
 
-def extract_story_segment_prompt(content_data: dict, segment: dict, segment_number: int) -> dict:
+# Narrator-line templates per content type (filled with str.format_map)
+_STORY_NARRATOR_TMPL = "Narrator Voice: CONSISTENT {voice_type} (same as all segments) with {tone_variation} tone variation, {pace_variation} pace, {emotion} emotion"
+_MEME_NARRATOR_TMPL = "Meme Narrator: CONSISTENT {voice_type} (same as all segments) with {delivery_variation} delivery variation, {pace_variation} pace for {meme_type} meme"
+_FREE_CONTENT_NARRATOR_TMPL = "Educational Narrator: CONSISTENT {voice_type} (same as all segments) with {tone_variation} tone variation, {pace_variation} pace, {authority} authority for {content_type} content targeting {target_audience}"
+
+# Production-note templates per content type ({duration} = clip seconds, {text} = overlay text)
+_STORY_NOTES = {
+    "narration": "NARRATION: External voiceover only - characters do NOT speak the narration text. Narration is overlay audio, not character dialogue",
+    "timing": "TIMING: Adjust narration/dialogue speed to fit exactly {duration} seconds. Keep dialogue and narration concise and complete",
+    "overlay_fields": ('text_overlays',),
+    "overlay": "TEXT OVERLAYS: Display on screen: {text}",
+    "transition": "TRANSITION: Smooth fade or cut to maintain story flow",
+    "completeness": "COMPLETENESS: Ensure video segment feels complete within duration - no abrupt cuts or incomplete actions",
+}
+
+_MEME_NOTES = {
+    "narration": "NARRATION: Meme commentary is external voiceover - characters do NOT speak narrator text. Commentary overlays the visual action",
+    "timing": "TIMING: Adjust dialogue/reactions/commentary speed to fit exactly {duration} seconds. Keep comedic timing tight and complete",
+    "overlay_fields": ('text_overlays', 'meme_text'),
+    "overlay": "TEXT OVERLAYS: Display meme text on screen: {text}",
+    "transition": "TRANSITION: Quick cut or comedic transition to maintain meme pacing",
+    "completeness": "COMPLETENESS: Ensure meme segment delivers complete joke/gag within duration - no incomplete punchlines",
+}
+
+_FREE_CONTENT_NOTES = {
+    "narration": "NARRATION: Educational voiceover is external - presenter/characters do NOT speak narrator text unless specifically presenting. Narration overlays visual demonstrations",
+    "timing": "TIMING: Adjust narration/presentation speed to fit exactly {duration} seconds. Keep educational content clear and complete",
+    "overlay_fields": ('text_overlays', 'key_points'),
+    "overlay": "TEXT OVERLAYS: Display educational text on screen: {text}",
+    "transition": "TRANSITION: Smooth educational transition to maintain learning flow",
+    "completeness": "COMPLETENESS: Ensure educational segment delivers complete concept/lesson within duration - no incomplete explanations",
+}
+
+
+def _character_descriptions(segment: dict, roster_by_id: dict) -> str:
+    """'; '-joined "Name: description" for the roster characters present in a segment"""
+    return '; '.join(
+        f"{character['name']}: {character['video_prompt_description']}"
+        for character in map(roster_by_id.get, segment.get('characters_present', []))
+        if character and character.get('video_prompt_description')
+    )
+
+
+def _production_notes(segment: dict, notes: dict, narration: bool = True) -> str:
+    """
+    Critical video production instructions for a segment
+    
+    Args:
+        segment: The segment data
+        notes: Content-type note templates (_STORY_NOTES, _MEME_NOTES, _FREE_CONTENT_NOTES)
+        narration: Include the external-voiceover instruction
+    
+    Returns:
+        str: '; '-joined production notes
+    """
+    production_notes = []
+    
+    # Narration instructions
+    if narration:
+        production_notes.append(notes["narration"])
+    
+    # Timing and pacing instructions
+    production_notes.append(notes["timing"].format(duration=segment.get('clip_duration', 8)))
+    
+    # Text overlay instructions
+    overlay_lists = [segment.get(field, []) for field in notes["overlay_fields"]]
+    if any(overlay_lists):
+        # The join consumes the chained lists directly, no merged copy
+        production_notes.append(notes["overlay"].format(text=', '.join(chain.from_iterable(overlay_lists))))
+    
+    # Transition instructions
+    transition = segment.get('transition', '')
+    production_notes.append(f"TRANSITION: {transition}" if transition else notes["transition"])
+    
+    # Completeness instruction
+    production_notes.append(notes["completeness"])
+    
+    return '; '.join(production_notes)
+
+
+def _build_segment_prompt(sections) -> str:
+    """Join prompt sections (see _join_prompt_sections) and clean the result if needed"""
+    prompt = _join_prompt_sections(sections)
+    return prompt if prompt.isascii() else clean_json_string(prompt)
+
+
+def extract_story_segment_prompt(content_data: dict, segment: dict, segment_number: int, context: ContentContext = None) -> StorySegmentPrompt:
     """Extract video prompt from story segment"""
-    characters_roster = content_data.get('characters_roster', [])
-    main_narrator_voice = content_data.get('narrator_voice', {})
+    # Bind the per-segment lookups once
+    get = segment.get
+    segment_narrator = get('narrator_voice_for_segment', {})
+    duration = get('clip_duration', 8)
     
-    # Build character descriptions for this segment
-    characters_present = segment.get('characters_present', [])
-    character_descriptions = []
+    if context is None:
+        context = ContentContext.from_content(content_data)
+    main_narrator_voice = context.narrator_voice
     
-    for char_id in characters_present:
-        character = next((c for c in characters_roster if c.get('id') == char_id), None)
-        if character:
-            char_desc = character.get('video_prompt_description', '')
-            if char_desc:
-                character_descriptions.append(f"{character['name']}: {char_desc}")
+    characters_present = get('characters_present', [])
     
     # Get background description
-    background_def = segment.get('background_definition', {})
+    background_def = get('background_definition', {})
     background_prompt = background_def.get('video_prompt_background', background_def.get('setting_description', ''))
     
     # Build the main prompt with validation
-    scene_description = segment.get('scene', '').strip()
+    scene_description = get('scene', '').strip()
     if not scene_description:
         scene_description = f"Scene from {content_data.get('title', 'story')} segment {segment_number}"
     
     # Get content (narration or dialogue) with validation
-    content_type = segment.get('content_type', 'narration')
+    content_type = get('content_type', 'narration')
     content_text = ""
     narrator_info = ""
     
     if content_type == 'narration':
-        content_text = segment.get('narration', '').strip()
+        content_text = get('narration', '').strip()
         if not content_text:
             content_text = f"Narration for segment {segment_number} of the story"
             
         # Add narrator voice information for narration segments - ENSURE CONSISTENCY
-        segment_narrator = segment.get('narrator_voice_for_segment', {})
         if segment_narrator or main_narrator_voice:
-            # ALWAYS use main narrator voice type for consistency
-            voice_type = main_narrator_voice.get('voice_type', 'neutral')
-            base_tone = main_narrator_voice.get('tone', 'neutral')
-            base_pace = main_narrator_voice.get('speaking_pace', 'moderate')
-            
-            # Allow only minor variations per segment
-            tone_variation = segment_narrator.get('tone_variation', base_tone)
-            pace_variation = segment_narrator.get('pace_variation', 'same')
-            emotion = segment_narrator.get('emotion', 'neutral')
+            narrator_info = _STORY_NARRATOR_TMPL.format_map({
+                # ALWAYS use main narrator voice type for consistency
+                'voice_type': main_narrator_voice.get('voice_type', 'neutral'),
+                # Allow only minor variations per segment
+                'tone_variation': segment_narrator.get('tone_variation', main_narrator_voice.get('tone', 'neutral')),
+                'pace_variation': segment_narrator.get('pace_variation', 'same'),
+                'emotion': segment_narrator.get('emotion', 'neutral'),
+            })
             emphasis = segment_narrator.get('emphasis', '')
-            
-            narrator_info = f"Narrator Voice: CONSISTENT {voice_type} (same as all segments) with {tone_variation} tone variation, {pace_variation} pace, {emotion} emotion"
             if emphasis:
                 narrator_info += f", emphasizing {emphasis}"
             
     elif content_type == 'dialogue':
-        dialogue_lines = segment.get('dialogue', [])
-        dialogue_text = []
-        for line in dialogue_lines:
-            char_name = line.get('character', 'Character').strip()
-            char_line = line.get('line', '').strip()
-            if char_name and char_line:
-                dialogue_text.append(f"{char_name}: \"{char_line}\"")
-        content_text = " ".join(dialogue_text) if dialogue_text else f"Dialogue for segment {segment_number}"
-    
-    # Build the complete prompt
-    prompt_parts = []
-    
-    if scene_description:
-        prompt_parts.append(f"Scene: {scene_description}")
-    
-    if background_prompt:
-        prompt_parts.append(f"Background: {background_prompt}")
-    
-    if character_descriptions:
-        prompt_parts.append(f"Characters: {'; '.join(character_descriptions)}")
-    
-    if content_text:
-        prompt_parts.append(f"Action/Dialogue: {content_text}")
-    
-    if narrator_info:
-        prompt_parts.append(narrator_info)
+        dialogue_lines = get('dialogue', [])
+        # Strip each field once; skip lines missing a speaker or text
+        dialogue_text = [
+            f"{char_name}: \"{char_line}\""
+            for char_name, char_line in (
+                ((line.get('character') or 'Character').strip(), (line.get('line') or '').strip())
+                for line in dialogue_lines
+            )
+            if char_name and char_line
+        ]
+        # Same separator as meme dialogue
+        content_text = "; ".join(dialogue_text) if dialogue_text else f"Dialogue for segment {segment_number}"
     
     # Add visual style elements
-    camera = segment.get('camera', '')
-    lighting = segment.get('lighting', '')
-    color_palette = segment.get('color_palette', '')
-    mood = segment.get('mood', '')
-    
-    if camera:
-        prompt_parts.append(f"Camera: {camera}")
-    if lighting:
-        prompt_parts.append(f"Lighting: {lighting}")
-    if color_palette:
-        prompt_parts.append(f"Colors: {color_palette}")
-    if mood:
-        prompt_parts.append(f"Mood: {mood}")
-    
-    # Add critical video production instructions
-    production_notes = []
-    
-    # Narration instructions
-    if content_type == 'narration':
-        production_notes.append("NARRATION: External voiceover only - characters do NOT speak the narration text. Narration is overlay audio, not character dialogue")
-    
-    # Timing and pacing instructions
-    production_notes.append(f"TIMING: Adjust narration/dialogue speed to fit exactly {segment.get('clip_duration', 8)} seconds. Keep dialogue and narration concise and complete")
-    
-    # Text overlay instructions
-    text_overlays = segment.get('text_overlays', [])
-    if text_overlays:
-        production_notes.append(f"TEXT OVERLAYS: Display on screen: {', '.join(text_overlays)}")
-    
-    # Transition instructions
-    transition = segment.get('transition', '')
-    if transition:
-        production_notes.append(f"TRANSITION: {transition}")
-    else:
-        production_notes.append("TRANSITION: Smooth fade or cut to maintain story flow")
-    
-    # Completeness instruction
-    production_notes.append("COMPLETENESS: Ensure video segment feels complete within duration - no abrupt cuts or incomplete actions")
-    
-    # Add production notes to prompt
-    if production_notes:
-        prompt_parts.append(f"PRODUCTION NOTES: {'; '.join(production_notes)}")
-    
-    # Join all parts
-    final_prompt = ". ".join(prompt_parts)
-    final_prompt = clean_json_string(final_prompt)
-    
-    return {
-        "prompt": final_prompt,
-        "segment_number": segment_number,
-        "content_type": content_type,
-        "duration_seconds": segment.get('clip_duration', 8),
-        "characters_present": characters_present,
-        "background_type": background_def.get('environment_type', 'realistic'),
-        "mood": mood,
-        "camera_style": camera,
-        "lighting": lighting,
-        "color_palette": color_palette,
-        "narrator_voice": main_narrator_voice,
-        "segment_narrator": segment.get('narrator_voice_for_segment', {}),
-        "original_content_type": "story"
-    }
+    camera = get('camera', '')
+    lighting = get('lighting', '')
+    color_palette = get('color_palette', '')
+    mood = get('mood', '')
+    
+    # Build the complete prompt (empty sections are skipped)
+    final_prompt = _build_segment_prompt((
+        ("Scene", scene_description),
+        ("Background", background_prompt),
+        ("Characters", _character_descriptions(segment, context.roster_by_id)),
+        ("Action/Dialogue", content_text),
+        (None, narrator_info),
+        ("Camera", camera),
+        ("Lighting", lighting),
+        ("Colors", color_palette),
+        ("Mood", mood),
+        ("PRODUCTION NOTES", _production_notes(segment, _STORY_NOTES, narration=content_type == 'narration')),
+    ))
+    
+    return StorySegmentPrompt(
+        prompt=final_prompt,
+        segment_number=segment_number,
+        content_type=content_type,
+        duration_seconds=duration,
+        characters_present=characters_present,
+        background_type=background_def.get('environment_type', 'realistic'),
+        mood=mood,
+        camera_style=camera,
+        lighting=lighting,
+        color_palette=color_palette,
+        narrator_voice=main_narrator_voice,
+        segment_narrator=segment_narrator
+    )
 
 
-def extract_meme_segment_prompt(content_data: dict, segment: dict, segment_number: int) -> dict:
+def extract_meme_segment_prompt(content_data: dict, segment: dict, segment_number: int, context: ContentContext = None) -> MemeSegmentPrompt:
     """Extract video prompt from meme segment"""
-    characters_roster = content_data.get('characters_roster', [])
-    main_narrator_voice = content_data.get('narrator_voice', {})
-    meme_type = content_data.get('meme_type', 'comedy')
+    # Bind the per-segment lookups once
+    get = segment.get
+    segment_narrator = get('narrator_voice_for_segment', {})
+    duration = get('clip_duration', 8)
     
-    # Build character descriptions for this segment
-    characters_present = segment.get('characters_present', [])
-    character_descriptions = []
+    if context is None:
+        context = ContentContext.from_content(content_data)
+    main_narrator_voice = context.narrator_voice
+    meme_type = context.meme_type
     
-    for char_id in characters_present:
-        character = next((c for c in characters_roster if c.get('id') == char_id), None)
-        if character:
-            char_desc = character.get('video_prompt_description', '')
-            if char_desc:
-                character_descriptions.append(f"{character['name']}: {char_desc}")
+    characters_present = get('characters_present', [])
     
     # Build the main prompt for meme
-    scene_description = segment.get('scene', '')
-    visual_comedy = segment.get('visual_comedy', '')
+    scene_description = get('scene', '')
+    visual_comedy = get('visual_comedy', '')
     
     # Add narrator voice information for meme commentary - ENSURE CONSISTENCY
     narrator_info = ""
-    segment_narrator = segment.get('narrator_voice_for_segment', {})
     if segment_narrator or main_narrator_voice:
-        # ALWAYS use main narrator voice type for consistency
-        voice_type = main_narrator_voice.get('voice_type', '')
-        base_comedic_style = main_narrator_voice.get('comedic_style', '')
-        base_pace = main_narrator_voice.get('speaking_pace', '')
-        
-        # Allow only minor variations per segment
-        delivery_variation = segment_narrator.get('comedic_delivery_variation', base_comedic_style)
-        pace_variation = segment_narrator.get('pace_variation', 'same')
-        energy_adjustment = segment_narrator.get('energy_adjustment', 'same')
+        narrator_info = _MEME_NARRATOR_TMPL.format_map({
+            # ALWAYS use main narrator voice type for consistency
+            'voice_type': main_narrator_voice.get('voice_type', ''),
+            # Allow only minor variations per segment
+            'delivery_variation': segment_narrator.get('comedic_delivery_variation', main_narrator_voice.get('comedic_style', '')),
+            'pace_variation': segment_narrator.get('pace_variation', 'same'),
+            'meme_type': meme_type,
+        })
         joke_timing = segment_narrator.get('joke_timing', '')
-        
-        narrator_info = f"Meme Narrator: CONSISTENT {voice_type} (same as all segments) with {delivery_variation} delivery variation, {pace_variation} pace for {meme_type} meme"
         if joke_timing:
             narrator_info += f", {joke_timing} timing"
     
     # Get dialogue/reactions
-    dialogue_lines = segment.get('dialogue', [])
-    reactions = segment.get('reactions', [])
+    dialogue_lines = get('dialogue', [])
+    reactions = get('reactions', [])
     
     dialogue_text = []
     for line in dialogue_lines:
@@ -295,257 +472,173 @@ def extract_meme_segment_prompt(content_data: dict, segment: dict, segment_numbe
         char_reaction = reaction.get('reaction', '')
         reaction_text.append(f"{char_name} reacts: {char_reaction}")
     
-    # Build the complete prompt
-    prompt_parts = []
-    
-    if scene_description:
-        prompt_parts.append(f"Scene: {scene_description}")
-    
-    if visual_comedy:
-        prompt_parts.append(f"Visual Comedy: {visual_comedy}")
-    
-    if character_descriptions:
-        prompt_parts.append(f"Characters: {'; '.join(character_descriptions)}")
-    
-    if dialogue_text:
-        prompt_parts.append(f"Dialogue: {'; '.join(dialogue_text)}")
-    
-    if reaction_text:
-        prompt_parts.append(f"Reactions: {'; '.join(reaction_text)}")
-    
-    if narrator_info:
-        prompt_parts.append(narrator_info)
-    
     # Add meme-specific elements
-    meme_format = segment.get('meme_format', '')
-    facial_expressions = segment.get('facial_expressions', [])
-    visual_gags = segment.get('visual_gags', [])
-    
-    if meme_format:
-        prompt_parts.append(f"Meme Format: {meme_format}")
-    if facial_expressions:
-        prompt_parts.append(f"Expressions: {', '.join(facial_expressions)}")
-    if visual_gags:
-        prompt_parts.append(f"Visual Gags: {', '.join(visual_gags)}")
+    meme_format = get('meme_format', '')
+    facial_expressions = get('facial_expressions', [])
+    visual_gags = get('visual_gags', [])
     
     # Add style elements
-    camera = segment.get('camera', '')
-    mood = segment.get('mood', 'comedic')
-    
-    if camera:
-        prompt_parts.append(f"Camera: {camera}")
-    
-    prompt_parts.append(f"Style: Comedic meme video, {mood} mood")
-    
-    # Add critical video production instructions for memes
-    production_notes = []
-    
-    # Meme-specific narration instructions
-    production_notes.append("NARRATION: Meme commentary is external voiceover - characters do NOT speak narrator text. Commentary overlays the visual action")
-    
-    # Timing and pacing instructions for comedy
-    production_notes.append(f"TIMING: Adjust dialogue/reactions/commentary speed to fit exactly {segment.get('clip_duration', 8)} seconds. Keep comedic timing tight and complete")
-    
-    # Text overlay instructions for memes
-    text_overlays = segment.get('text_overlays', [])
-    meme_text = segment.get('meme_text', [])
-    all_text = text_overlays + meme_text
-    if all_text:
-        production_notes.append(f"TEXT OVERLAYS: Display meme text on screen: {', '.join(all_text)}")
-    
-    # Transition instructions for comedy flow
-    transition = segment.get('transition', '')
-    if transition:
-        production_notes.append(f"TRANSITION: {transition}")
-    else:
-        production_notes.append("TRANSITION: Quick cut or comedic transition to maintain meme pacing")
-    
-    # Completeness instruction for memes
-    production_notes.append("COMPLETENESS: Ensure meme segment delivers complete joke/gag within duration - no incomplete punchlines")
-    
-    # Add production notes to prompt
-    if production_notes:
-        prompt_parts.append(f"PRODUCTION NOTES: {'; '.join(production_notes)}")
-    
-    # Join all parts
-    final_prompt = ". ".join(prompt_parts)
-    final_prompt = clean_json_string(final_prompt)
-    
-    return {
-        "prompt": final_prompt,
-        "segment_number": segment_number,
-        "content_type": "meme",
-        "duration_seconds": segment.get('clip_duration', 8),
-        "characters_present": characters_present,
-        "meme_type": content_data.get('meme_type', 'comedy'),
-        "comedy_style": segment.get('comedy_style', 'visual'),
-        "mood": mood,
-        "camera_style": camera,
-        "narrator_voice": main_narrator_voice,
-        "segment_narrator": segment.get('narrator_voice_for_segment', {}),
-        "original_content_type": "meme"
-    }
+    camera = get('camera', '')
+    mood = get('mood', 'comedic')
+    
+    # Build the complete prompt (empty sections are skipped)
+    final_prompt = _build_segment_prompt((
+        ("Scene", scene_description),
+        ("Visual Comedy", visual_comedy),
+        ("Characters", _character_descriptions(segment, context.roster_by_id)),
+        ("Dialogue", '; '.join(dialogue_text)),
+        ("Reactions", '; '.join(reaction_text)),
+        (None, narrator_info),
+        ("Meme Format", meme_format),
+        ("Expressions", ', '.join(facial_expressions)),
+        ("Visual Gags", ', '.join(visual_gags)),
+        ("Camera", camera),
+        ("Style", f"Comedic meme video, {mood} mood"),
+        ("PRODUCTION NOTES", _production_notes(segment, _MEME_NOTES)),
+    ))
+    
+    return MemeSegmentPrompt(
+        prompt=final_prompt,
+        segment_number=segment_number,
+        duration_seconds=duration,
+        characters_present=characters_present,
+        meme_type=meme_type,
+        comedy_style=get('comedy_style', 'visual'),
+        mood=mood,
+        camera_style=camera,
+        narrator_voice=main_narrator_voice,
+        segment_narrator=segment_narrator
+    )
 
 
-def extract_free_content_segment_prompt(content_data: dict, segment: dict, segment_number: int) -> dict:
+def extract_free_content_segment_prompt(content_data: dict, segment: dict, segment_number: int, context: ContentContext = None) -> FreeContentSegmentPrompt:
     """Extract video prompt from free content segment"""
-    main_narrator_voice = content_data.get('narrator_voice', {})
-    content_type = content_data.get('content_type', 'educational')
-    target_audience = content_data.get('target_audience', 'general')
+    # Bind the per-segment lookups once
+    get = segment.get
+    segment_narrator = get('narrator_voice_for_segment', {})
+    duration = get('clip_duration', 8)
+    
+    if context is None:
+        context = ContentContext.from_content(content_data)
+    main_narrator_voice = context.narrator_voice
+    content_type = context.content_category
+    target_audience = context.target_audience
     
     # Build the main prompt for free content
-    scene_description = segment.get('scene', '')
-    key_message = segment.get('key_message', '')
-    value_content = segment.get('value_content', '')
-    entertainment_element = segment.get('entertainment_element', '')
-    visual_demonstration = segment.get('visual_demonstration', '')
+    scene_description = get('scene', '')
+    key_message = get('key_message', '')
+    value_content = get('value_content', '')
+    entertainment_element = get('entertainment_element', '')
+    visual_demonstration = get('visual_demonstration', '')
     
     # Add narrator voice information for educational content - ENSURE CONSISTENCY
     narrator_info = ""
-    segment_narrator = segment.get('narrator_voice_for_segment', {})
     if segment_narrator or main_narrator_voice:
-        # ALWAYS use main narrator voice type for consistency
-        voice_type = main_narrator_voice.get('voice_type', '')
-        base_tone = main_narrator_voice.get('tone', '')
-        base_pace = main_narrator_voice.get('speaking_pace', '')
-        authority = main_narrator_voice.get('authority_level', '')
-        
-        # Allow only minor variations per segment
-        tone_variation = segment_narrator.get('tone_variation', base_tone)
-        pace_variation = segment_narrator.get('pace_variation', 'same')
+        narrator_info = _FREE_CONTENT_NARRATOR_TMPL.format_map({
+            # ALWAYS use main narrator voice type for consistency
+            'voice_type': main_narrator_voice.get('voice_type', ''),
+            'authority': main_narrator_voice.get('authority_level', ''),
+            # Allow only minor variations per segment
+            'tone_variation': segment_narrator.get('tone_variation', main_narrator_voice.get('tone', '')),
+            'pace_variation': segment_narrator.get('pace_variation', 'same'),
+            'content_type': content_type,
+            'target_audience': target_audience,
+        })
         emphasis_style = segment_narrator.get('emphasis_style', '')
-        teaching_approach = segment_narrator.get('teaching_approach', '')
-        
-        narrator_info = f"Educational Narrator: CONSISTENT {voice_type} (same as all segments) with {tone_variation} tone variation, {pace_variation} pace, {authority} authority for {content_type} content targeting {target_audience}"
         if emphasis_style:
             narrator_info += f", {emphasis_style} emphasis"
     
-    # Build the complete prompt
-    prompt_parts = []
-    
-    if scene_description:
-        prompt_parts.append(f"Scene: {scene_description}")
-    
-    if key_message:
-        prompt_parts.append(f"Key Message: {key_message}")
-    
-    if value_content:
-        prompt_parts.append(f"Educational Content: {value_content}")
-    
-    if entertainment_element:
-        prompt_parts.append(f"Entertainment: {entertainment_element}")
-    
-    if visual_demonstration:
-        prompt_parts.append(f"Visual Demo: {visual_demonstration}")
-    
-    if narrator_info:
-        prompt_parts.append(narrator_info)
-    
     # Add content-specific elements
-    engagement_hook = segment.get('engagement_hook', '')
-    call_to_action = segment.get('call_to_action', '')
-    text_overlays = segment.get('text_overlays', [])
-    
-    if engagement_hook:
-        prompt_parts.append(f"Engagement: {engagement_hook}")
-    
-    if call_to_action:
-        prompt_parts.append(f"CTA: {call_to_action}")
-    
-    if text_overlays:
-        prompt_parts.append(f"Text Overlays: {', '.join(text_overlays)}")
+    engagement_hook = get('engagement_hook', '')
+    call_to_action = get('call_to_action', '')
+    text_overlays = get('text_overlays', [])
     
     # Add style elements
-    camera = segment.get('camera', '')
-    lighting = segment.get('lighting', 'bright, natural')
-    color_scheme = segment.get('color_scheme', 'vibrant')
-    
-    if camera:
-        prompt_parts.append(f"Camera: {camera}")
-    
-    prompt_parts.append(f"Style: Educational content video, {lighting} lighting, {color_scheme} colors")
-    
-    # Add critical video production instructions for educational content
-    production_notes = []
-    
-    # Educational narration instructions
-    production_notes.append("NARRATION: Educational voiceover is external - presenter/characters do NOT speak narrator text unless specifically presenting. Narration overlays visual demonstrations")
-    
-    # Timing and pacing instructions for education
-    production_notes.append(f"TIMING: Adjust narration/presentation speed to fit exactly {segment.get('clip_duration', 8)} seconds. Keep educational content clear and complete")
-    
-    # Text overlay instructions for educational content
-    text_overlays = segment.get('text_overlays', [])
-    key_points = segment.get('key_points', [])
-    all_text = text_overlays + key_points
-    if all_text:
-        production_notes.append(f"TEXT OVERLAYS: Display educational text on screen: {', '.join(all_text)}")
-    
-    # Transition instructions for educational flow
-    transition = segment.get('transition', '')
-    if transition:
-        production_notes.append(f"TRANSITION: {transition}")
-    else:
-        production_notes.append("TRANSITION: Smooth educational transition to maintain learning flow")
-    
-    # Completeness instruction for educational content
-    production_notes.append("COMPLETENESS: Ensure educational segment delivers complete concept/lesson within duration - no incomplete explanations")
-    
-    # Add production notes to prompt
-    if production_notes:
-        prompt_parts.append(f"PRODUCTION NOTES: {'; '.join(production_notes)}")
-    
-    # Join all parts
-    final_prompt = ". ".join(prompt_parts)
-    final_prompt = clean_json_string(final_prompt)
-    
-    return {
-        "prompt": final_prompt,
-        "segment_number": segment_number,
-        "content_type": "free_content",
-        "duration_seconds": segment.get('clip_duration', 8),
-        "content_category": content_data.get('content_type', 'educational'),
-        "target_audience": content_data.get('target_audience', 'general'),
-        "value_proposition": content_data.get('value_proposition', ''),
-        "mood": "engaging",
-        "camera_style": camera,
-        "lighting": lighting,
-        "color_scheme": color_scheme,
-        "narrator_voice": main_narrator_voice,
-        "segment_narrator": segment.get('narrator_voice_for_segment', {}),
-        "original_content_type": "free_content"
-    }
+    camera = get('camera', '')
+    lighting = get('lighting', 'bright, natural')
+    color_scheme = get('color_scheme', 'vibrant')
+    
+    # Build the complete prompt (empty sections are skipped)
+    final_prompt = _build_segment_prompt((
+        ("Scene", scene_description),
+        ("Key Message", key_message),
+        ("Educational Content", value_content),
+        ("Entertainment", entertainment_element),
+        ("Visual Demo", visual_demonstration),
+        (None, narrator_info),
+        ("Engagement", engagement_hook),
+        ("CTA", call_to_action),
+        ("Text Overlays", ', '.join(text_overlays)),
+        ("Camera", camera),
+        ("Style", f"Educational content video, {lighting} lighting, {color_scheme} colors"),
+        ("PRODUCTION NOTES", _production_notes(segment, _FREE_CONTENT_NOTES)),
+    ))
+    
+    return FreeContentSegmentPrompt(
+        prompt=final_prompt,
+        segment_number=segment_number,
+        duration_seconds=duration,
+        content_category=content_type,
+        target_audience=target_audience,
+        value_proposition=context.value_proposition,
+        camera_style=camera,
+        lighting=lighting,
+        color_scheme=color_scheme,
+        narrator_voice=main_narrator_voice,
+        segment_narrator=segment_narrator
+    )
+
+
+def _extract_segment_or_error(content_data: dict, content_type: str, context: ContentContext, segment_number: int) -> tuple:
+    """Extract one segment prompt, returning (prompt_data, None) or (None, error message)"""
+    try:
+        return extract_video_prompt_from_content_segment(content_data, segment_number, content_type, context), None
+    except Exception as e:
+        return None, str(e)
 
 
-def extract_all_content_video_prompts(content_data: dict, content_type: str = None) -> list:
+def extract_all_content_video_prompts(content_data: dict, content_type: str = None, max_workers: int = None) -> list:
     """
     Extract video prompts for all segments in any content type
     
+    Extraction takes ~20µs per segment, so it runs serially by default; pass
+    max_workers to spread very large documents over worker processes.
+    
     Args:
         content_data: The complete content data
         content_type: Override content type detection
+        max_workers: Number of worker processes (None = extract in this process)
     
     Returns:
-        list: List of video prompt dictionaries
+        list: SegmentPrompt per extracted segment, in segment order
     """
     if content_type is None:
         content_type = detect_content_type(content_data)
     
     segments = content_data.get('segments', [])
-    prompts = []
+    context = ContentContext.from_content(content_data)
+    extract = partial(_extract_segment_or_error, content_data, content_type, context)
+    segment_numbers = range(1, len(segments) + 1)
+    
+    if max_workers and max_workers > 1 and len(segments) > 1:
+        # One chunk per worker so content_data is pickled once per worker, not per segment
+        chunksize = -(-len(segments) // max_workers)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(extract, segment_numbers, chunksize=chunksize))
+    else:
+        results = map(extract, segment_numbers)
     
-    for i in range(1, len(segments) + 1):
-        try:
-            prompt_data = extract_video_prompt_from_content_segment(content_data, i, content_type)
-            prompts.append(prompt_data)
-        except Exception as e:
-            print(f"Error extracting segment {i}: {str(e)}")
+    prompts = []
+    for i, (prompt_data, error) in zip(segment_numbers, results):
+        if error is not None:
+            logger.warning("content_video.extract_failed segment=%s error=%s", i, error)
             continue
+        prompts.append(prompt_data)
     
     return prompts
 
 
-def content_segment_to_video_request(content_data: dict, segment_number: int, content_type: str = None, **video_options) -> dict:
+def content_segment_to_video_request(content_data: dict, segment_number: int, content_type: str = None, prompt_data: SegmentPrompt = None, **video_options) -> dict:
     """
     Convert any content segment to a video generation request
     
@@ -553,6 +646,7 @@ def content_segment_to_video_request(content_data: dict, segment_number: int, co
         content_data: The complete content data
         segment_number: Which segment to convert
         content_type: Override content type detection
+        prompt_data: Already-extracted prompt for this segment (skips re-extraction)
         **video_options: Additional video generation options
     
     Returns:
@@ -561,12 +655,18 @@ def content_segment_to_video_request(content_data: dict, segment_number: int, co
     if content_type is None:
         content_type = detect_content_type(content_data)
     
-    prompt_data = extract_video_prompt_from_content_segment(content_data, segment_number, content_type)
+    if prompt_data is None:
+        prompt_data = extract_video_prompt_from_content_segment(content_data, segment_number, content_type)
     
+    return _video_request_from_prompt(prompt_data, segment_number, content_type, video_options)
+
+
+def _video_request_from_prompt(prompt_data: SegmentPrompt, segment_number: int, content_type: str, video_options: dict) -> dict:
+    """Build a video generation request from an already-extracted segment prompt"""
     # Default video options
     video_request = {
-        "prompt": prompt_data["prompt"],
-        "durationSeconds": prompt_data.get("duration_seconds", 8),
+        "prompt": prompt_data.prompt,
+        "durationSeconds": prompt_data.duration_seconds,
         "resolution": video_options.get("resolution", "720p"),
         "aspectRatio": video_options.get("aspectRatio", "9:16"),
         "download": video_options.get("download", False),
@@ -614,26 +714,31 @@ def generate_full_content_videos(content_data: dict, content_type: str = None, v
         "downloaded_files": []
     }
     
-    print(f"🎬 Starting video generation for {content_type}: {results['content_title']}")
-    print(f"📊 Total segments to process: {len(segments)}")
+    logger.info(
+        "content_video.prepare_start type=%s title=%s segments=%s",
+        content_type, results['content_title'], len(segments)
+    )
+    
+    # Document-level values, resolved once for all segments
+    context = ContentContext.from_content(content_data)
     
     # Process each segment sequentially
     for i, segment in enumerate(segments, 1):
-        print(f"\n🎯 Processing {content_type.title()} Segment {i}/{len(segments)}")
         
         try:
             # Extract video prompt for this segment
-            prompt_data = extract_video_prompt_from_content_segment(content_data, i, content_type)
+            prompt_data = extract_video_prompt_from_content_segment(content_data, i, content_type, context)
             
-            # Create video request
+            # Create video request from the prompt just extracted (no second extraction/detection)
             video_request = content_segment_to_video_request(
-                content_data, 
-                i, 
+                content_data,
+                i,
                 content_type,
+                prompt_data=prompt_data,
                 **video_options
             )
             
-            print(f"📝 Prompt: {video_request['prompt'][:100]}...")
+            logger.debug("content_video.segment_prompt segment=%s prompt=%.100s", i, video_request['prompt'])
             
             # Store segment info
             segment_result = {
@@ -648,11 +753,11 @@ def generate_full_content_videos(content_data: dict, content_type: str = None, v
             
             results["segments_results"].append(segment_result)
             
-            print(f"✅ {content_type.title()} Segment {i} prepared successfully")
+            logger.debug("content_video.segment_prepared type=%s segment=%s/%s", content_type, i, len(segments))
             
         except Exception as e:
             error_msg = f"Error processing {content_type} segment {i}: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error("content_video.segment_prepare_failed %s", error_msg)
             
             segment_result = {
                 "segment_number": i,
@@ -665,22 +770,105 @@ def generate_full_content_videos(content_data: dict, content_type: str = None, v
             results["segments_results"].append(segment_result)
             results["error_count"] += 1
     
-    print(f"\n📋 Preparation Summary:")
-    print(f"✅ Successfully prepared: {len(segments) - results['error_count']} segments")
-    print(f"❌ Errors: {results['error_count']} segments")
+    logger.info(
+        "content_video.prepare_done prepared=%s errors=%s",
+        len(segments) - results['error_count'], results['error_count']
+    )
     
     return results
 
 
-def execute_content_video_generation(content_data: dict, content_type: str = None, video_options: dict = None, generate_videos: bool = True):
+async def _generate_content_segment_video(segment_result: dict, content_label: str, semaphore: asyncio.Semaphore) -> None:
+    """
+    Generate (and optionally download) the video for one prepared segment, with retries
+    
+    Updates segment_result in place (status, video_url, downloaded_file, error).
+    
+    Args:
+        segment_result: Prepared segment entry from generate_full_content_videos
+        content_label: Content type, for log messages
+        semaphore: Limits concurrent generation requests
+    """
+    segment_num = segment_result["segment_number"]
+    video_request = segment_result["video_request"]
+    
+    logger.info("content_video.segment_start type=%s segment=%s", content_label, segment_num)
+    
+    # Retry logic for failed segments
+    max_retries = 3
+    retry_delay = 0.0  # seconds, set from the last transient error
+    
+    for attempt in range(max_retries):
+        try:
+            if attempt > 0:
+                logger.info(
+                    "content_video.segment_retry segment=%s attempt=%s/%s delay=%.1f",
+                    segment_num, attempt + 1, max_retries, retry_delay
+                )
+                await asyncio.sleep(retry_delay)
+            
+            # Generate video (blocking client call, run in a worker thread)
+            async with semaphore:
+                video_response = await asyncio.to_thread(generate_video_from_payload, video_request)
+            
+            if isinstance(video_response, list) and len(video_response) > 0:
+                video_url = video_response[0]
+                segment_result["video_url"] = video_url
+                segment_result["status"] = "completed"
+                
+                logger.info("content_video.segment_generated segment=%s url=%.50s", segment_num, video_url)
+                
+                # Download if requested
+                if video_request.get("download", False):
+                    try:
+                        filename = video_request.get("filename", f"segment_{segment_num}")
+                        filepath = await asyncio.to_thread(download_video, video_url, filename)
+                        segment_result["downloaded_file"] = filepath
+                        logger.info("content_video.segment_downloaded segment=%s path=%s", segment_num, filepath)
+                    except Exception as e:
+                        logger.warning("content_video.download_failed segment=%s error=%s", segment_num, e)
+                
+                return  # Success, exit retry loop
+                
+            else:
+                raise Exception("No video URL returned from generation")
+                
+        except Exception as e:
+            error_text = str(e)  # computed once for the message, classifier and backoff
+            error_msg = f"Video generation failed for segment {segment_num} (attempt {attempt + 1}): {error_text}"
+            logger.error("content_video.segment_failed %s", error_msg)
+            
+            if attempt == max_retries - 1:  # Last attempt failed
+                segment_result["status"] = "failed"
+                segment_result["error"] = error_msg
+                segment_result["retry_attempts"] = max_retries
+            else:
+                # Check if it's a temporary error (overload, rate limit, internal server errors, etc.)
+                if is_temporary_error(error_text):
+                    retry_delay = backoff_delay(error_text, attempt, getattr(e, "retry_after", None))
+                    logger.info("content_video.segment_temporary_error segment=%s", segment_num)
+                    continue
+                else:
+                    # Permanent error, don't retry
+                    segment_result["status"] = "failed"
+                    segment_result["error"] = error_msg
+                    segment_result["retry_attempts"] = attempt + 1
+                    return
+
+
+async def execute_content_video_generation(content_data: dict, content_type: str = None, video_options: dict = None, generate_videos: bool = True, max_concurrency: int = 3):
     """
     Complete pipeline: prepare segments and optionally execute video generation for any content type
     
+    Segments are generated concurrently (at most max_concurrency requests at a time);
+    retry waits do not hold up other segments.
+    
     Args:
         content_data: Complete content data
         content_type: Override content type detection
         video_options: Video generation options
         generate_videos: Whether to actually generate videos or just prepare
+        max_concurrency: Maximum number of simultaneous video generation requests
     
     Returns:
         dict: Complete results with video generation status
@@ -689,609 +877,427 @@ def execute_content_video_generation(content_data: dict, content_type: str = Non
     results = generate_full_content_videos(content_data, content_type, video_options)
     
     if not generate_videos:
-        print("🔄 Preparation complete. Set generate_videos=True to execute video generation.")
+        logger.info("content_video.prepared_only segments=%s", results['total_segments'])
         return results
     
-    print(f"\n🚀 Starting video generation for {results['total_segments']} {results['content_type']} segments...")
+    logger.info(
+        "content_video.generate_start type=%s segments=%s max_concurrency=%s",
+        results['content_type'], results['total_segments'], max_concurrency
+    )
     
-    # Import here to avoid circular imports
-    from app.services.genai_service import generate_video_from_payload, download_video
+    # Execute video generation for all prepared segments concurrently
+    semaphore = asyncio.Semaphore(max_concurrency)
+    await asyncio.gather(*(
+        _generate_content_segment_video(segment_result, results["content_type"], semaphore)
+        for segment_result in results["segments_results"]
+        if segment_result["status"] == "processing"
+    ))
     
-    # Execute video generation for each prepared segment
+    # Collect outcomes in segment order (segments finish out of order; merging relies on this order)
     for segment_result in results["segments_results"]:
-        if segment_result["status"] != "processing":
-            continue
-        
-        segment_num = segment_result["segment_number"]
-        video_request = segment_result["video_request"]
-        
-        print(f"\n🎬 Generating video for {results['content_type'].title()} Segment {segment_num}...")
-        
-        # Retry logic for failed segments
-        max_retries = 3
-        retry_delay = 30  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                if attempt > 0:
-                    print(f"🔄 Retry attempt {attempt + 1}/{max_retries} for Segment {segment_num}")
-                    print(f"⏳ Waiting {retry_delay} seconds before retry...")
-                    time.sleep(retry_delay)
-                
-                # Generate video
-                video_response = generate_video_from_payload(video_request)
-                
-                if isinstance(video_response, list) and len(video_response) > 0:
-                    video_url = video_response[0]
-                    segment_result["video_url"] = video_url
-                    segment_result["status"] = "completed"
-                    results["video_urls"].append(video_url)
-                    results["success_count"] += 1
-                    
-                    print(f"✅ Segment {segment_num} video generated: {video_url[:50]}...")
-                    
-                    # Download if requested
-                    if video_request.get("download", False):
-                        try:
-                            filename = video_request.get("filename", f"segment_{segment_num}")
-                            filepath = download_video(video_url, filename)
-                            segment_result["downloaded_file"] = filepath
-                            results["downloaded_files"].append(filepath)
-                            print(f"📥 Downloaded: {filepath}")
-                        except Exception as e:
-                            print(f"⚠️ Download failed for segment {segment_num}: {str(e)}")
-                    
-                    break  # Success, exit retry loop
-                    
-                else:
-                    raise Exception("No video URL returned from generation")
-                    
-            except Exception as e:
-                error_msg = f"Video generation failed for segment {segment_num} (attempt {attempt + 1}): {str(e)}"
-                print(f"❌ {error_msg}")
-                
-                if attempt == max_retries - 1:  # Last attempt failed
-                    segment_result["status"] = "failed"
-                    segment_result["error"] = error_msg
-                    segment_result["retry_attempts"] = max_retries
-                    results["error_count"] += 1
-                else:
-                    # Check if it's a temporary error (overload, rate limit, internal server errors, etc.)
-                    error_str = str(e).lower()
-                    is_temporary_error = (
-                        "overloaded" in error_str or 
-                        "rate" in error_str or 
-                        "quota" in error_str or
-                        "internal server" in error_str or
-                        "'code': 13" in str(e) or
-                        "server issue" in error_str or
-                        "try again" in error_str
-                    )
-                    
-                    if is_temporary_error:
-                        print(f"🔄 Temporary error detected, will retry...")
-                        continue
-                    else:
-                        # Permanent error, don't retry
-                        segment_result["status"] = "failed"
-                        segment_result["error"] = error_msg
-                        segment_result["retry_attempts"] = attempt + 1
-                        results["error_count"] += 1
-                        break
+        if segment_result["status"] == "completed":
+            results["video_urls"].append(segment_result["video_url"])
+            results["success_count"] += 1
+            if segment_result.get("downloaded_file"):
+                results["downloaded_files"].append(segment_result["downloaded_file"])
+        elif segment_result["status"] == "failed":
+            results["error_count"] += 1
     
     # Final summary
-    print(f"\n🎉 {results['content_type'].title()} Video Generation Complete!")
-    print(f"✅ Successfully generated: {results['success_count']} videos")
-    print(f"❌ Failed: {results['error_count']} videos")
-    print(f"📥 Downloaded: {len(results['downloaded_files'])} files")
+    logger.info(
+        "content_video.generate_done type=%s succeeded=%s failed=%s downloaded=%s",
+        results['content_type'], results['success_count'], results['error_count'], len(results['downloaded_files'])
+    )
     
     return results
 
 
-
-def execute_daily_character_video_generation(content_data: dict, video_options: dict = None):
+def build_daily_character_video_prompt(segment: dict) -> str:
     """
-    Generate videos for daily character content using keyframes with CHAT-BASED frame generation.
-    Uses chat sessions to maintain continuity across continuous segments.
+    Build a video prompt from daily character segment data.
     
     Args:
-        content_data: Daily character content data with segments
-        video_options: Video generation options including character_keyframe_uri
+        segment: Daily character segment with scene, action, reaction, etc.
     
     Returns:
-        dict: Complete results with video generation status
+        str: Complete video prompt for generation
     """
-    import time
-    import requests
-    from io import BytesIO
-    from PIL import Image
-    from app.services.genai_service import generate_video_with_keyframes
-    from app.services.imagen_chat_service import FrameGenerationChat
-    
-    if video_options is None:
-        video_options = {}
-    
-    character_keyframe_uri = video_options.get("character_keyframe_uri")
-    if not character_keyframe_uri:
-        return {"error": "character_keyframe_uri is required in video_options"}
-    
-    # Extract segments
-    segments = content_data.get("segments", [])
-    if not segments:
-        return {"error": "No segments found in content_data"}
+    get = segment.get
+    background = get('background') or {}
+    
+    # One (label, value) table joined once; empty fields are skipped
+    return _join_prompt_sections((
+        ("Scene", get('scene')),
+        ("Action", get('action')),
+        ("Reaction", get('reaction')),
+        ("Visual Focus", get('visual_focus')),
+        ("Background", background.get('video_prompt_background')),
+        ("Camera", get('camera')),
+        ("Comedy", get('comedy_element')),
+        # Pacing instruction for faster, more dynamic videos
+        ("Pacing", "Fast-paced, energetic movement with quick transitions. Dynamic and snappy action"),
+    ))
+
+
+def _resolve_segment_characters(segment: dict, char_by_name: dict, default_names: list, default_subjects: list) -> tuple:
+    """
+    Resolve the names and subjects of the characters present in a segment.
     
-    character_name = content_data.get("character_name", "Character")
-    title = content_data.get("title", "Daily Character Content")
+    Args:
+        segment: The segment data (characters_present lists character names)
+        char_by_name: Character metadata keyed by character_name
+        default_names: Names used when the segment lists no characters or no metadata is loaded
+        default_subjects: Subjects matching default_names
     
-    # Extract character metadata for multi-character support
-    character_metadata = content_data.get("character_metadata", {})
-    characters = character_metadata.get("characters", [])
+    Returns:
+        tuple: (character names, character subjects) for Imagen
+    """
+    characters_present = segment.get("characters_present")
+    if characters_present and char_by_name:
+        # Match characters_present to character metadata
+        names = [name for name in characters_present if name in char_by_name]
+        return names, [char_by_name[name].get("subject", "creature") for name in names]
+    # Fallback to all characters
+    return default_names, default_subjects
+
+
+@dataclass(slots=True)
+class DailyCharacterRun:
+    """Settings shared by every segment of one daily character generation run"""
+    video_options: dict
+    character_keyframe_uri: str
+    char_by_name: dict
+    character_names_list: list
+    character_subjects_list: list
+    content_style: str
+    total_segments: int
+    frames_dir: str
+    videos_dir: str
+    filename_prefix: str
+    aspect_ratio: str
+    resolution: str
+    download: bool
+
+
+def split_scene_chains(segments: list) -> list:
+    """
+    Group daily character segments into scene chains
     
-    # Extract visual style from content_data (vibe for daily character, genre for short films)
-    content_style = content_data.get("vibe") or content_data.get("genre") or content_data.get("style") or "cute character animation"
+    A segment with a first_frame_description starts a new scene; the segments after it
+    continue from the previous segment's last frame, so a chain must be generated in
+    order while separate chains are independent of each other.
     
-    # Build character names and subjects lists for Imagen
-    character_names_list = []
-    character_subjects_list = []
-    character_url_to_info = {}  # Map URL to character info
+    Args:
+        segments: Daily character segments
     
-    # Get character URLs list
-    character_keyframe_uris = video_options.get("character_keyframe_uris", [character_keyframe_uri])
+    Returns:
+        list: Chains of (segment_number, segment) tuples, in segment order
+    """
+    chains = []
+    for i, segment in enumerate(segments, 1):
+        first_frame_description = segment.get('first_frame_description')
+        if i == 1 or (first_frame_description and first_frame_description.strip()):
+            chains.append([])
+        chains[-1].append((i, segment))
+    return chains
+
+
+async def _generate_daily_character_segment(
+    i: int,
+    segment: dict,
+    previous_frame: str,
+    run: DailyCharacterRun,
+    semaphore: asyncio.Semaphore,
+    earlier_frame: Callable[[], Awaitable[Optional[str]]]
+) -> tuple:
+    """
+    Generate the frames and video for one daily character segment
     
-    if characters:
-        for char in characters:
-            char_name = char.get("character_name", "Character")
-            char_subject = char.get("subject", "creature")  # Get subject description from database
-            char_url = char.get("cloudinary_url", "")
-            
-            character_names_list.append(char_name)
-            character_subjects_list.append(char_subject)
-            
-            if char_url:
-                character_url_to_info[char_url] = {
-                    "name": char_name,
-                    "subject": char_subject
-                }
-        
-        print(f"📋 Character metadata loaded:")
-        for name, subject in zip(character_names_list, character_subjects_list):
-            print(f"   - {name}: {subject[:50]}...")
-    else:
-        # Fallback for single character without metadata
-        character_names_list = [character_name]
-        character_subjects_list = [content_data.get("creature_sound_description", "creature")]
+    Args:
+        i: 1-based segment number
+        segment: The segment data
+        previous_frame: Last frame generated for the previous segment of the same scene chain
+        run: Shared run settings
+        semaphore: Limits concurrent video generation requests
+        earlier_frame: Latest last frame of the preceding scene chains, awaited only when
+            this chain has no frame to fall back on (as in a sequential run)
     
-    # Download character images once for chat service
-    print(f"📥 Downloading character images for chat service...")
-    character_images = []
-    for idx, url in enumerate(character_keyframe_uris, 1):
-        if url.startswith("http://") or url.startswith("https://"):
-            print(f"   Downloading character {idx}/{len(character_keyframe_uris)}...")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            img = Image.open(BytesIO(response.content))
-            character_images.append(img)
-            print(f"   ✅ Character {idx} loaded: {img.size}")
-    
-    print(f"\n🎬 Starting daily character video generation for: {title}")
-    print(f"👤 Character(s): {', '.join(character_names_list)}")
-    print(f"🎭 Style: {content_style}")
-    print(f"🖼️ Keyframe: {character_keyframe_uri}")
-    print(f"📊 Total segments: {len(segments)}")
-    print(f"🔄 Using CHAT-BASED frame generation for continuity")
-    
-    # Initialize results
-    results = {
-        "success": False,
-        "content_type": "daily_character",
-        "character_name": character_name,
-        "title": title,
-        "total_segments": len(segments),
-        "success_count": 0,
-        "error_count": 0,
-        "video_urls": [],
-        "downloaded_files": [],
-        "segments_results": [],
-        "frame_chain": []  # Track frame chaining
+    Returns:
+        tuple: (segment_result, previous_frame for the next segment of the chain,
+                video download task or None)
+    """
+    video_options = run.video_options
+    character_keyframe_uri = run.character_keyframe_uri
+    char_by_name = run.char_by_name
+    character_names_list = run.character_names_list
+    character_subjects_list = run.character_subjects_list
+    content_style = run.content_style
+    get = segment.get
+    
+    logger.info("daily_video.segment_start segment=%s/%s", i, run.total_segments)
+    
+    segment_result = {
+        "segment_number": i,
+        "status": "processing",
+        "video_url": None,
+        "error": None
     }
+    download = None
     
-    # Initialize chat session for frame generation (will be reused for continuous segments)
-    frame_chat = None
-    
-    # Process each segment
-    for idx, segment in enumerate(segments):
-        segment_num = segment.get("segment", 0)
-        duration = segment.get("duration", 8)
-        is_first_segment = (idx == 0)
-        is_last_segment = (idx == len(segments) - 1)
-        
-        # Check for Veo 3 structured prompt first
-        veo_prompt = segment.get("veo_prompt")
-        
-        if veo_prompt:
-            # Use the new Veo 3 structured prompt with audio cues
-            prompt = veo_prompt
-            print(f"✅ Using Veo 3 structured prompt with integrated audio")
+    try:
+        # Extract or build prompt from segment
+        # Check for Veo 3 structured prompt first (veo_prompt), then fallback to video_prompt
+        prompt = get('veo_prompt', '') or get('video_prompt', '')
+        if prompt:
+            logger.debug("daily_video.prompt_source segment=%s source=veo_prompt", i)
         else:
-            # Fallback: Build prompt from individual fields (old method)
-            scene = segment.get("scene", "")
-            action = segment.get("action", "")
-            reaction = segment.get("reaction", "")
-            camera = segment.get("camera", "")
-            visual_focus = segment.get("visual_focus", "")
-            
-            # Get background details
-            background = segment.get("background", {})
-            video_prompt_background = background.get("video_prompt_background", "")
-            
-            # Combine all visual elements into prompt
-            prompt_parts = []
-            if scene:
-                prompt_parts.append(scene)
-            if action:
-                prompt_parts.append(action)
-            if reaction:
-                prompt_parts.append(f"Character shows {reaction}.")
-            if visual_focus:
-                prompt_parts.append(f"Focus on: {visual_focus}.")
-            if camera:
-                prompt_parts.append(f"Camera: {camera}.")
-            if video_prompt_background:
-                prompt_parts.append(f"Background: {video_prompt_background}")
-            
-            prompt = " ".join(prompt_parts)
-            print(f"⚠️  Using legacy prompt format (no integrated audio)")
+            # Build prompt from segment fields for daily character content
+            prompt = build_daily_character_video_prompt(segment)
+            logger.info("daily_video.prompt_source segment=%s source=legacy", i)
         
-        segment_result = {
-            "segment_number": segment_num,
-            "duration": duration,
-            "prompt": prompt,
-            "status": "processing",
-            "video_url": None,
-            "error": None,
-            "first_frame_source": None,
-            "last_frame_extracted": None
-        }
+        if not prompt or prompt == "Daily character moment":
+            raise ValueError(f"Could not build video prompt for segment {i}")
         
-        results["segments_results"].append(segment_result)
+        logger.debug("daily_video.segment_prompt segment=%s prompt=%.100s", i, prompt)
         
-        print(f"\n🎬 Generating video for Segment {segment_num}/{len(segments)}...")
-        print(f"📝 Prompt: {prompt[:100]}...")
+        frames_dir = run.frames_dir
         
-        # Determine first frame for this segment using CHAT-BASED generation
-        first_frame_to_use = None
-        first_frame_desc = segment.get("first_frame_description")
-        last_frame_desc = segment.get("last_frame_description")
+        # Character URLs, names and subjects for this segment (support multi-character), shared by both frames
+        segment_char_urls = get("character_keyframe_uris") or [get("character_keyframe_uri", character_keyframe_uri)]
+        segment_char_names, segment_char_subjects = _resolve_segment_characters(
+            segment, char_by_name, character_names_list, character_subjects_list
+        )
         
-        # Get character info for this segment
-        segment_char_names = []
-        segment_char_subjects = []
-        characters_present = segment.get("characters_present", [])
+        is_last_segment = (i == run.total_segments)
         
-        if characters_present and characters:
-            # Match characters_present to character metadata
-            for char_name in characters_present:
-                for char in characters:
-                    if char.get("character_name") == char_name:
-                        segment_char_names.append(char_name)
-                        segment_char_subjects.append(char.get("subject", "creature"))
-                        break
-        else:
-            # Fallback to all characters
-            segment_char_names = character_names_list
-            segment_char_subjects = character_subjects_list
+        # STEP 1: Determine IMAGE parameter (first frame for video)
+        # Logic:
+        # - If first_frame_description exists (scene change): Generate new frame with Imagen
+        # - If no first_frame_description (continuous scene): Use previous segment's last frame
+        # - Segment 1 always needs a first frame (either generated or character keyframe)
+        first_frame = None
+        first_frame_description = get('first_frame_description')
         
-        # CHAT-BASED FRAME GENERATION LOGIC
-        try:
-            if first_frame_desc:
-                # NEW SCENE - Create new chat session
-                print(f"🆕 Segment {segment_num}: NEW SCENE detected (has first_frame_description)")
-                print(f"   Creating new chat session for frame generation...")
-                
-                frame_chat = FrameGenerationChat(
-                    model=video_options.get("image_model", "gemini-2.5-flash-image")
-                )
-                
-                # Generate first frame with new chat
-                print(f"🎨 Generating first frame with new chat session...")
-                generated_image, first_frame_path = frame_chat.generate_first_frame(
-                    character_images=character_images,
-                    frame_description=first_frame_desc,
+        # Check if first_frame_description is provided and not empty
+        has_first_frame_desc = first_frame_description and first_frame_description.strip()
+        
+        if has_first_frame_desc:
+            # Scene change detected: Generate new first frame with Imagen
+            logger.info("daily_video.first_frame_start segment=%s scene_change=True", i)
+            logger.debug("daily_video.first_frame_description segment=%s description=%.100s", i, first_frame_description)
+            try:
+                generated_image, frame_path = await asyncio.to_thread(
+                    generate_first_frame_with_imagen,
+                    character_image_urls=segment_char_urls,
+                    frame_description=first_frame_description,
+                    aspect_ratio=run.aspect_ratio,
+                    output_dir=frames_dir,
+                    additional_reference_images=video_options.get("reference_images"),
+                    image_model=video_options.get("image_model", "gemini-2.5-flash-image"),
                     character_names=segment_char_names,
                     character_subjects=segment_char_subjects,
-                    style=content_style,
-                    aspect_ratio=video_options.get("aspect_ratio", "9:16"),
-                    resolution="2K",
-                    output_dir="frames"
-                )
-                
-                first_frame_to_use = first_frame_path
-                segment_result["first_frame_source"] = "chat_new_scene"
-                segment_result["first_frame_path"] = first_frame_path
-                print(f"✅ First frame generated (new scene): {first_frame_path}")
-                
-            elif frame_chat is not None:
-                # CONTINUOUS SEGMENT - Reuse existing chat session
-                print(f"🔄 Segment {segment_num}: CONTINUOUS from previous (no first_frame_description)")
-                print(f"   Reusing existing chat session for continuity...")
-                
-                # The last frame from previous segment becomes the first frame
-                # We don't need to generate a new first frame - just use the last one
-                if hasattr(frame_chat, 'current_frame') and frame_chat.current_frame:
-                    # Save the current frame as first frame for this segment
-                    import os
-                    from datetime import datetime
-                    os.makedirs("frames", exist_ok=True)
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    first_frame_path = os.path.join("frames", f"first_frame_continuous_{timestamp}.png")
-                    frame_chat.current_frame.save(first_frame_path, "PNG")
-                    
-                    first_frame_to_use = first_frame_path
-                    segment_result["first_frame_source"] = "chat_continuous"
-                    segment_result["first_frame_path"] = first_frame_path
-                    print(f"✅ Using previous last frame as first frame: {first_frame_path}")
-                else:
-                    # Fallback to character keyframe
-                    first_frame_to_use = character_keyframe_uri
-                    segment_result["first_frame_source"] = "character_keyframe_fallback"
-                    print(f"⚠️ No previous frame available, using character keyframe")
-            else:
-                # First segment without first_frame_description - use character keyframe
-                first_frame_to_use = character_keyframe_uri
-                segment_result["first_frame_source"] = "character_keyframe"
-                print(f"🖼️ Segment {segment_num}: Using character keyframe as first frame")
-            
-            # Generate LAST FRAME using chat (if description provided)
-            last_frame_to_use = None
-            if last_frame_desc and frame_chat is not None:
-                print(f"🎨 Generating last frame with chat session...")
-                generated_image, last_frame_path = frame_chat.generate_last_frame(
-                    last_frame_description=last_frame_desc,
-                    aspect_ratio=video_options.get("aspect_ratio", "9:16"),
-                    resolution="2K",
-                    output_dir="frames"
+                    style=content_style
                 )
-                
-                last_frame_to_use = last_frame_path
-                segment_result["last_frame_generated"] = last_frame_path
-                print(f"✅ Last frame generated: {last_frame_path}")
-                print(f"   → Will be used as first frame for next continuous segment")
+                first_frame = frame_path
+                segment_result["first_frame_generated"] = frame_path
+                segment_result["scene_change"] = True
+                logger.info("daily_video.first_frame_generated segment=%s path=%s", i, frame_path)
+            except Exception as e:
+                logger.warning("daily_video.first_frame_failed segment=%s error=%s", i, e)
+                # Fallback: use previous frame if available, otherwise character keyframe
+                first_frame = previous_frame or await earlier_frame() or character_keyframe_uri
+        else:
+            # Continuous scene: Use previous segment's last frame
+            if i == 1:
+                # First segment with no description: use character keyframe
+                first_frame = character_keyframe_uri
+                logger.info("daily_video.first_frame segment=1 source=character_keyframe")
+            elif previous_frame or (previous_frame := await earlier_frame()):
+                # Continuous scene: use previous last frame
+                first_frame = previous_frame
+                segment_result["scene_change"] = False
+                logger.info("daily_video.first_frame segment=%s source=previous_last_frame path=%s", i, first_frame)
             else:
-                print(f"⚠️ No last_frame_description provided for segment {segment_num}")
-                
-        except Exception as e:
-            print(f"⚠️ Chat-based frame generation failed: {str(e)}")
-            print(f"   Falling back to character keyframe")
-            first_frame_to_use = character_keyframe_uri
-            last_frame_to_use = None
-            segment_result["first_frame_source"] = "character_keyframe_fallback"
-            segment_result["frame_generation_error"] = str(e)
+                # Fallback: Use character keyframe
+                logger.warning("daily_video.first_frame segment=%s source=character_keyframe reason=no_previous_frame", i)
+                first_frame = character_keyframe_uri
         
-        # Retry logic
-        max_retries = 3
-        retry_delay = 30
+        # STEP 2: Generate LAST_FRAME parameter with Imagen (for ALL segments)
+        last_frame = None
+        last_frame_description = get('last_frame_description')
         
-        for attempt in range(max_retries):
+        if last_frame_description:
+            logger.info("daily_video.last_frame_start segment=%s", i)
+            logger.debug("daily_video.last_frame_description segment=%s description=%.100s", i, last_frame_description)
             try:
-                if attempt > 0:
-                    print(f"🔄 Retry attempt {attempt + 1}/{max_retries} for Segment {segment_num}")
-                    print(f"⏳ Waiting {retry_delay} seconds before retry...")
-                    time.sleep(retry_delay)
-                
-                # Generate video with keyframe chaining and character reference (Veo 3.1)
-                video_urls = generate_video_with_keyframes(
-                    prompt=prompt,
-                    first_frame=first_frame_to_use,  # Chat-generated or character keyframe
-                    last_frame=last_frame_to_use,  # Chat-generated last frame (if available)
-                    duration=duration,
-                    resolution=video_options.get("resolution", "720p"),
-                    aspect_ratio=video_options.get("aspect_ratio", "9:16"),
-                    reference_image_urls=[character_keyframe_uri]  # Character as reference for consistency
+                generated_image, last_frame_path = await asyncio.to_thread(
+                    generate_last_frame_with_imagen,
+                    character_image_urls=segment_char_urls,
+                    first_frame_path=first_frame,
+                    last_frame_description=last_frame_description,
+                    aspect_ratio=run.aspect_ratio,
+                    output_dir=frames_dir,
+                    additional_reference_images=video_options.get("reference_images"),
+                    image_model=video_options.get("image_model", "gemini-2.5-flash-image"),
+                    character_names=segment_char_names,
+                    character_subjects=segment_char_subjects,
+                    style=content_style
+                )
+                last_frame = last_frame_path
+                segment_result["last_frame_generated"] = last_frame_path
+                logger.info(
+                    "daily_video.last_frame_generated segment=%s path=%s next_first_frame=%s",
+                    i, last_frame_path, not is_last_segment
                 )
                 
-                if video_urls and len(video_urls) > 0:
-                    video_url = video_urls[0]
-                    segment_result["video_url"] = video_url
-                    segment_result["status"] = "completed"
-                    results["video_urls"].append(video_url)
-                    results["success_count"] += 1
-                    
-                    print(f"✅ Segment {segment_num} video generated: {video_url[:50]}...")
-                    
-                    # Download video to content directory
-                    try:
-                        from app.services.genai_service import download_video
-                        from app.services.file_storage_manager import storage_manager, ContentType
-                        import os
-                        
-                        # Get content directory from file storage manager
-                        content_dir = storage_manager.get_content_directory(ContentType.DAILY_CHARACTER, title)
-                        
-                        # Create subdirectories
-                        videos_dir = os.path.join(content_dir, "videos")
-                        os.makedirs(videos_dir, exist_ok=True)
-                        
-                        # Download video to content directory
-                        temp_filename = f"{character_name}_segment_{segment_num}"
-                        temp_video_path = download_video(video_url, temp_filename, download_dir=videos_dir)
-                        print(f"📥 Downloaded to: {temp_video_path}")
-                        
-                        # Also save to downloads folder if requested
-                        if video_options.get("download", False):
-                            downloads_path = download_video(video_url, temp_filename, download_dir="downloads")
-                            segment_result["downloaded_file"] = downloads_path
-                            results["downloaded_files"].append(downloads_path)
-                            print(f"💾 Also saved to downloads: {downloads_path}")
-                        
-                        segment_result["video_file"] = temp_video_path
-                        print(f"📁 Content directory: {content_dir}")
-                        
-                    except Exception as e:
-                        print(f"⚠️ Video download failed for segment {segment_num}: {str(e)}")
-                    
-                    break  # Success, exit retry loop
-                    
-                else:
-                    raise Exception("No video URL returned from generation")
-                    
-            except Exception as e:
-                error_msg = f"Video generation failed for segment {segment_num} (attempt {attempt + 1}): {str(e)}"
-                print(f"❌ {error_msg}")
+                # Store generated last frame for next segment (no extraction needed!)
+                if not is_last_segment:
+                    previous_frame = last_frame_path
                 
-                if attempt == max_retries - 1:  # Last attempt failed
-                    segment_result["status"] = "failed"
-                    segment_result["error"] = error_msg
-                    segment_result["retry_attempts"] = max_retries
-                    results["error_count"] += 1
-                else:
-                    # Check if it's a temporary error
-                    error_str = str(e).lower()
-                    is_temporary_error = (
-                        "overloaded" in error_str or 
-                        "rate" in error_str or 
-                        "quota" in error_str or
-                        "internal server" in error_str or
-                        "'code': 13" in str(e) or
-                        "server issue" in error_str or
-                        "try again" in error_str
-                    )
-                    
-                    if is_temporary_error:
-                        print(f"🔄 Temporary error detected, will retry...")
-                        continue
-                    else:
-                        # Permanent error, don't retry
-                        segment_result["status"] = "failed"
-                        segment_result["error"] = error_msg
-                        segment_result["retry_attempts"] = attempt + 1
-                        results["error_count"] += 1
-                        break
+            except Exception as e:
+                logger.warning("daily_video.last_frame_failed segment=%s error=%s", i, e)
+                last_frame = None
+        else:
+            logger.warning("daily_video.last_frame_skipped segment=%s reason=no_description", i)
         
-        # Small delay between segments to avoid rate limits
-        if segment_num < len(segments):
-            time.sleep(2)
-    
-    # Update final status
-    results["success"] = results["error_count"] == 0
-    
-    # Summary
-    print(f"\n{'='*60}")
-    print(f"🎉 Daily Character Video Generation Complete!")
-    print(f"✅ Successful: {results['success_count']}/{results['total_segments']}")
-    print(f"❌ Failed: {results['error_count']}/{results['total_segments']}")
-    
-    if results["error_count"] > 0:
-        failed_segments = [s["segment_number"] for s in results["segments_results"] if s["status"] == "failed"]
-        print(f"⚠️ Failed segments: {failed_segments}")
-        print(f"💡 You can retry failed segments using the retry endpoint")
-    
-    # Clean up extracted frames (no longer needed after all videos are generated)
-    if results["frame_chain"]:
-        print(f"\n🧹 Cleaning up extracted frames...")
-        import os
-        from app.services.file_storage_manager import storage_manager, ContentType
+        # Generate video with BOTH first and last frames (Veo 3.1 interpolation)
+        logger.info("daily_video.video_start segment=%s last_frame=%s", i, last_frame is not None)
+        async with semaphore:
+            await asyncio.sleep(_VEO_BUCKET.reserve())
+            video_urls = await asyncio.to_thread(
+                generate_video_with_keyframes,
+                prompt=prompt,
+                first_frame=first_frame,
+                last_frame=last_frame,  # Use generated last frame if available
+                duration=get('clip_duration', 8),
+                resolution=run.resolution,
+                aspect_ratio=run.aspect_ratio,
+                reference_image_urls=None,  # No reference images in this mode
+                use_frames_as_references=False  # Use frames as image parameter
+            )
         
-        try:
-            content_dir = storage_manager.get_content_directory(ContentType.DAILY_CHARACTER, title, create=False)
-            frames_dir = os.path.join(content_dir, "frames")
+        if video_urls and len(video_urls) > 0:
+            video_url = video_urls[0]
+            segment_result["video_url"] = video_url
+            segment_result["status"] = "completed"
             
-            if os.path.exists(frames_dir):
-                # Delete all frame files EXCEPT the last one
-                frame_chain = results["frame_chain"]
-                last_frame_path = frame_chain[-1].get("last_frame") if frame_chain else None
-                
-                for frame_info in frame_chain:
-                    frame_path = frame_info.get("last_frame")
-                    if frame_path and os.path.exists(frame_path):
-                        # Keep the last frame, delete all others
-                        if frame_path != last_frame_path:
-                            os.remove(frame_path)
-                            print(f"🗑️ Deleted: {os.path.basename(frame_path)}")
-                        else:
-                            print(f"💾 Kept last frame: {os.path.basename(frame_path)}")
-                
-                # Don't remove frames directory since we're keeping the last frame
-                remaining_files = os.listdir(frames_dir)
-                if not remaining_files:
-                    os.rmdir(frames_dir)
-                    print(f"🗑️ Removed empty frames directory")
-                else:
-                    print(f"📁 Frames directory kept with {len(remaining_files)} file(s)")
-                
-                print(f"✅ Cleanup complete")
-        except Exception as e:
-            print(f"⚠️ Cleanup warning: {str(e)}")
-    
-    print(f"{'='*60}\n")
-    
-    return results
+            # STEP 3: Download video in the background (NO extraction - using generated frames!)
+            # The next segment of the chain only needs previous_frame, so its frame
+            # generation overlaps with this download
+            download = asyncio.create_task(_download_daily_character_video(segment_result, run))
+            
+            logger.info("daily_video.segment_completed segment=%s url=%s", i, video_url)
+        else:
+            raise ValueError("No video URL returned from generation")
+            
+    except Exception as e:
+        error_text = str(e)
+        if is_rate_limit_error(error_text):
+            # Halt the other chains' Veo requests for the provider's Retry-After
+            _VEO_BUCKET.pause(backoff_delay(error_text, 0, getattr(e, "retry_after", None)))
+        error_msg = f"Video generation failed for segment {i}: {error_text}"
+        logger.error("daily_video.segment_failed %s", error_msg)
+        segment_result["status"] = "failed"
+        segment_result["error"] = error_msg
+    
+    return segment_result, previous_frame, download
 
 
+def _copy_file(source: str, destination: str) -> str:
+    """Copy a file, creating the destination directory if needed"""
+    os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+    return shutil.copyfile(source, destination)
 
-def build_daily_character_video_prompt(segment: dict) -> str:
+
+async def _download_daily_character_video(segment_result: dict, run: DailyCharacterRun) -> None:
     """
-    Build a video prompt from daily character segment data.
-    
-    Args:
-        segment: Daily character segment with scene, action, reaction, etc.
+    Download a completed segment's video into the content directory (and downloads/ if requested)
     
-    Returns:
-        str: Complete video prompt for generation
+    Updates segment_result in place (video_file, downloaded_file, download_error).
     """
-    prompt_parts = []
-    
-    # Scene description
-    scene = segment.get('scene', '')
-    if scene:
-        prompt_parts.append(f"Scene: {scene}")
-    
-    # Action
-    action = segment.get('action', '')
-    if action:
-        prompt_parts.append(f"Action: {action}")
-    
-    # Reaction
-    reaction = segment.get('reaction', '')
-    if reaction:
-        prompt_parts.append(f"Reaction: {reaction}")
-    
-    # Visual focus
-    visual_focus = segment.get('visual_focus', '')
-    if visual_focus:
-        prompt_parts.append(f"Visual Focus: {visual_focus}")
-    
-    # Background
-    background = segment.get('background', {})
-    if background:
-        bg_prompt = background.get('video_prompt_background', '')
-        if bg_prompt:
-            prompt_parts.append(f"Background: {bg_prompt}")
+    i = segment_result["segment_number"]
+    video_url = segment_result["video_url"]
+    try:
+        # Download video to content directory
+        filename = f"{run.filename_prefix}_segment_{i}"
+        video_path = await asyncio.to_thread(download_video, video_url, filename, download_dir=run.videos_dir)
+        segment_result["video_file"] = video_path
+        logger.info("daily_video.downloaded segment=%s path=%s", i, video_path)
+        
+        # Also save to downloads folder if explicitly requested: a local copy of the
+        # file just fetched instead of a second download from the provider
+        if run.download:
+            downloads_path = os.path.join("downloads", os.path.basename(video_path))
+            await asyncio.to_thread(_copy_file, video_path, downloads_path)
+            segment_result["downloaded_file"] = downloads_path
+            logger.info("daily_video.downloaded segment=%s path=%s", i, downloads_path)
+        
+    except Exception as download_error:
+        logger.warning("daily_video.download_failed segment=%s error=%s", i, download_error)
+        segment_result["download_error"] = str(download_error)
+
+
+async def _generate_daily_character_chain(
+    scene: list,
+    run: DailyCharacterRun,
+    semaphore: asyncio.Semaphore,
+    earlier_chain_frames: list,
+    chain_frame: asyncio.Future
+) -> list:
+    """
+    Generate one scene chain in order, carrying each segment's last frame into the next
     
-    # Camera
-    camera = segment.get('camera', '')
-    if camera:
-        prompt_parts.append(f"Camera: {camera}")
+    Video downloads run in the background and are awaited once the chain is done.
     
-    # Comedy element
-    comedy = segment.get('comedy_element', '')
-    if comedy:
-        prompt_parts.append(f"Comedy: {comedy}")
+    Args:
+        scene: (segment_number, segment) tuples of the chain
+        run: Shared run settings
+        semaphore: Limits concurrent video generation requests
+        earlier_chain_frames: chain_frame futures of the preceding chains, in order
+        chain_frame: Resolved with this chain's latest last frame (or None) once it is done
     
-    # Add pacing instruction for faster, more dynamic videos
-    prompt_parts.append("Pacing: Fast-paced, energetic movement with quick transitions. Dynamic and snappy action")
+    Returns:
+        list: segment_result dicts for the chain, in segment order
+    """
+    async def earlier_frame():
+        # A sequential run carries the latest last frame across scene changes,
+        # so walk back through the preceding chains until one produced a frame
+        for future in reversed(earlier_chain_frames):
+            frame = await future
+            if frame:
+                return frame
+        return None
     
-    # Join all parts
-    return ". ".join(prompt_parts) if prompt_parts else "Daily character moment"
+    previous_frame = None  # Track previous frame for continuity
+    scene_results = []
+    downloads = []
+    try:
+        for i, segment in scene:
+            segment_result, previous_frame, download = await _generate_daily_character_segment(
+                i, segment, previous_frame, run, semaphore, earlier_frame
+            )
+            scene_results.append(segment_result)
+            if download is not None:
+                downloads.append(download)
+    finally:
+        # Later chains may be waiting on this frame; never leave them hanging
+        chain_frame.set_result(previous_frame)
+    await asyncio.gather(*downloads)
+    return scene_results
 
 
-def execute_daily_character_video_generation(content_data: dict, video_options: dict = None):
+async def execute_daily_character_video_generation(content_data: dict, video_options: dict = None, max_concurrency: int = 3):
     """
     Generate videos for daily character content using keyframes (original mode).
     Uses character image as first frame and previous frame as image parameter.
     
+    Scene chains (see split_scene_chains) are generated concurrently; segments within
+    a chain run in order because each starts from the previous segment's last frame.
+    
     Args:
         content_data: Daily character content data
         video_options: Video generation options including character_keyframe_uri
+        max_concurrency: Maximum number of simultaneous video generation requests
     
     Returns:
         dict: Complete results with video generation status
@@ -1311,24 +1317,20 @@ def execute_daily_character_video_generation(content_data: dict, video_options:
     # Extract character metadata for multi-character support
     character_metadata = content_data.get("character_metadata", {})
     characters = character_metadata.get("characters", [])
+    # Character metadata by name for the per-segment lookups (first entry wins on duplicate names)
+    char_by_name = {char.get("character_name"): char for char in reversed(characters)}
     
     # Extract visual style from content_data (vibe for daily character, genre for short films)
     content_style = content_data.get("vibe") or content_data.get("genre") or content_data.get("style") or "cute character animation"
     
     # Build character names and subjects lists for Imagen
-    character_names_list = []
-    character_subjects_list = []
-    
     if characters:
-        for char in characters:
-            char_name = char.get("character_name", "Character")
-            char_subject = char.get("subject", "creature")  # Get subject description from database
-            character_names_list.append(char_name)
-            character_subjects_list.append(char_subject)
+        character_names_list = [char.get("character_name", "Character") for char in characters]
+        # Subject descriptions come from the database
+        character_subjects_list = [char.get("subject", "creature") for char in characters]
         
-        print(f"📋 Character metadata loaded:")
         for name, subject in zip(character_names_list, character_subjects_list):
-            print(f"   - {name}: {subject[:50]}...")
+            logger.debug("daily_video.character name=%s subject=%.50s", name, subject)
     else:
         # Fallback for single character without metadata
         character_names_list = [content_data.get('character_name', 'Character')]
@@ -1347,278 +1349,85 @@ def execute_daily_character_video_generation(content_data: dict, video_options:
         "character_keyframe_uri": character_keyframe_uri
     }
     
-    print(f"🎬 Starting daily character video generation for: {results['content_title']}")
-    print(f"👤 Character(s): {', '.join(character_names_list)}")
-    print(f"🎭 Style: {content_style}")
-    print(f"🖼️ Keyframe: {character_keyframe_uri}")
-    print(f"📊 Total segments: {len(segments)}")
-    
-    # Import here to avoid circular imports
-    from app.services.genai_service import generate_video_with_keyframes
-    from app.services.imagen_service import generate_first_frame_with_imagen
-    
-    previous_frame = None  # Track previous frame for continuity
-    
-    # Process each segment sequentially
-    for i, segment in enumerate(segments, 1):
-        print(f"\n🎬 Generating video for Segment {i}/{len(segments)}...")
-        
-        segment_result = {
-            "segment_number": i,
-            "status": "processing",
-            "video_url": None,
-            "error": None
-        }
-        
-        try:
-            # Extract or build prompt from segment
-            # Check for Veo 3 structured prompt first (veo_prompt), then fallback to video_prompt
-            prompt = segment.get('veo_prompt', '') or segment.get('video_prompt', '')
-            if prompt:
-                print(f"✅ Using Veo 3 structured prompt with integrated audio")
-            else:
-                # Build prompt from segment fields for daily character content
-                prompt = build_daily_character_video_prompt(segment)
-                print(f"⚠️  Using legacy prompt format (no integrated audio)")
-            
-            if not prompt or prompt == "Daily character moment":
-                raise ValueError(f"Could not build video prompt for segment {i}")
-            
-            print(f"📝 Prompt: {prompt[:100]}...")
-            
-            # Setup organized directories using file_storage_manager
-            from app.services.file_storage_manager import storage_manager, ContentType
-            import os
-            
-            title = content_data.get('title', 'Untitled')
-            content_dir = storage_manager.get_content_directory(ContentType.DAILY_CHARACTER, title)
-            frames_dir = os.path.join(content_dir, "frames")
-            videos_dir = os.path.join(content_dir, "videos")
-            os.makedirs(frames_dir, exist_ok=True)
-            os.makedirs(videos_dir, exist_ok=True)
-            
-            is_last_segment = (i == len(segments))
-            
-            # STEP 1: Determine IMAGE parameter (first frame for video)
-            # Logic:
-            # - If first_frame_description exists (scene change): Generate new frame with Imagen
-            # - If no first_frame_description (continuous scene): Use previous segment's last frame
-            # - Segment 1 always needs a first frame (either generated or character keyframe)
-            first_frame = None
-            first_frame_description = segment.get('first_frame_description')
-            
-            # Check if first_frame_description is provided and not empty
-            has_first_frame_desc = first_frame_description and first_frame_description.strip()
-            
-            if has_first_frame_desc:
-                # Scene change detected: Generate new first frame with Imagen
-                print(f"🎨 Segment {i}: Scene change detected - Generating first frame with Imagen...")
-                print(f"📝 Frame description: {first_frame_description[:100]}...")
-                try:
-                    # Get character URLs for this segment (support multi-character)
-                    segment_char_urls = segment.get("character_keyframe_uris")
-                    if not segment_char_urls:
-                        segment_char_urls = [segment.get("character_keyframe_uri", character_keyframe_uri)]
-                    
-                    # Get character names and subjects for this segment's characters
-                    segment_char_names = []
-                    segment_char_subjects = []
-                    characters_present = segment.get("characters_present", [])
-                    
-                    if characters_present and characters:
-                        # Match characters_present to character metadata
-                        for char_name in characters_present:
-                            for char in characters:
-                                if char.get("character_name") == char_name:
-                                    segment_char_names.append(char_name)
-                                    segment_char_subjects.append(char.get("subject", "creature"))
-                                    break
-                    else:
-                        # Fallback to all characters
-                        segment_char_names = character_names_list
-                        segment_char_subjects = character_subjects_list
-                    
-                    generated_image, frame_path = generate_first_frame_with_imagen(
-                        character_image_urls=segment_char_urls,
-                        frame_description=first_frame_description,
-                        aspect_ratio=video_options.get("aspect_ratio", "9:16"),
-                        output_dir=frames_dir,
-                        additional_reference_images=video_options.get("reference_images"),
-                        image_model=video_options.get("image_model", "gemini-2.5-flash-image"),
-                        character_names=segment_char_names,
-                        character_subjects=segment_char_subjects,
-                        style=content_style
-                    )
-                    first_frame = frame_path
-                    segment_result["first_frame_generated"] = frame_path
-                    segment_result["scene_change"] = True
-                    print(f"✅ First frame generated for scene change: {frame_path}")
-                except Exception as e:
-                    print(f"⚠️ Imagen generation failed: {str(e)}, using fallback")
-                    # Fallback: use previous frame if available, otherwise character keyframe
-                    first_frame = previous_frame if previous_frame else character_keyframe_uri
-            else:
-                # Continuous scene: Use previous segment's last frame
-                if i == 1:
-                    # First segment with no description: use character keyframe
-                    first_frame = character_keyframe_uri
-                    print(f"📸 Segment 1: Using character keyframe as first frame")
-                elif previous_frame:
-                    # Continuous scene: use previous last frame
-                    first_frame = previous_frame
-                    segment_result["scene_change"] = False
-                    print(f"🔗 Segment {i}: Continuous scene - Using previous segment's last frame")
-                    print(f"🔗 Segment {i}: Using generated last frame from previous segment: {first_frame}")
-                else:
-                    # Fallback: Use character keyframe
-                    print(f"⚠️ Segment {i}: Previous frame not available, using character keyframe")
-                    first_frame = character_keyframe_uri
-            
-            # STEP 2: Generate LAST_FRAME parameter with Imagen (for ALL segments)
-            last_frame = None
-            last_frame_description = segment.get('last_frame_description')
-            
-            if last_frame_description:
-                print(f"🎨 Segment {i}: Generating last frame with Imagen (dual reference)...")
-                print(f"📝 Last frame description: {last_frame_description[:100]}...")
-                try:
-                    from app.services.imagen_service import generate_last_frame_with_imagen
-                    
-                    # Get character URLs for this segment (support multi-character)
-                    segment_char_urls = segment.get("character_keyframe_uris")
-                    if not segment_char_urls:
-                        segment_char_urls = [segment.get("character_keyframe_uri", character_keyframe_uri)]
-                    
-                    # Get character names and subjects for this segment's characters
-                    segment_char_names = []
-                    segment_char_subjects = []
-                    characters_present = segment.get("characters_present", [])
-                    
-                    if characters_present and characters:
-                        # Match characters_present to character metadata
-                        for char_name in characters_present:
-                            for char in characters:
-                                if char.get("character_name") == char_name:
-                                    segment_char_names.append(char_name)
-                                    segment_char_subjects.append(char.get("subject", "creature"))
-                                    break
-                    else:
-                        # Fallback to all characters
-                        segment_char_names = character_names_list
-                        segment_char_subjects = character_subjects_list
-                    
-                    generated_image, last_frame_path = generate_last_frame_with_imagen(
-                        character_image_urls=segment_char_urls,
-                        first_frame_path=first_frame,
-                        last_frame_description=last_frame_description,
-                        aspect_ratio=video_options.get("aspect_ratio", "9:16"),
-                        output_dir=frames_dir,
-                        additional_reference_images=video_options.get("reference_images"),
-                        image_model=video_options.get("image_model", "gemini-2.5-flash-image"),
-                        character_names=segment_char_names,
-                        character_subjects=segment_char_subjects,
-                        style=content_style
-                    )
-                    last_frame = last_frame_path
-                    segment_result["last_frame_generated"] = last_frame_path
-                    print(f"✅ Last frame generated: {last_frame_path}")
-                    
-                    # Store generated last frame for next segment (no extraction needed!)
-                    if not is_last_segment:
-                        previous_frame = last_frame_path
-                        print(f"   → Will be used as first frame for segment {i+1}")
-                    else:
-                        print(f"   → Last segment: Frame used for video interpolation only")
-                    
-                except Exception as e:
-                    print(f"⚠️ Last frame generation failed: {str(e)}")
-                    last_frame = None
-            else:
-                print(f"⚠️ No last_frame_description provided for segment {i}")
-            
-            # Generate video with BOTH first and last frames (Veo 3.1 interpolation)
-            print(f"🎬 Generating video with first frame{' and last frame' if last_frame else ''}...")
-            video_urls = generate_video_with_keyframes(
-                prompt=prompt,
-                first_frame=first_frame,
-                last_frame=last_frame,  # Use generated last frame if available
-                duration=segment.get('clip_duration', 8),
-                resolution=video_options.get("resolution", "720p"),
-                aspect_ratio=video_options.get("aspect_ratio", "9:16"),
-                reference_image_urls=None,  # No reference images in this mode
-                use_frames_as_references=False  # Use frames as image parameter
-            )
-            
-            if video_urls and len(video_urls) > 0:
-                video_url = video_urls[0]
-                segment_result["video_url"] = video_url
-                segment_result["status"] = "completed"
-                results["video_urls"].append(video_url)
-                results["success_count"] += 1
-                
-                # STEP 3: Download video (NO extraction - using generated frames!)
-                try:
-                    from app.services.genai_service import download_video
-                    
-                    # Download video to content directory
-                    character_name = content_data.get('character_name', 'character')
-                    safe_name = "".join(c for c in character_name if c.isalnum() or c in (' ', '-', '_')).strip().replace(' ', '_').lower()
-                    filename = f"{safe_name}_segment_{i}"
-                    video_path = download_video(video_url, filename, download_dir=videos_dir)
-                    segment_result["video_file"] = video_path
-                    print(f"📥 Downloaded to: {video_path}")
-                    
-                    # Also save to downloads folder if explicitly requested
-                    if video_options.get("download", False):
-                        downloads_path = download_video(video_url, filename, download_dir="downloads")
-                        segment_result["downloaded_file"] = downloads_path
-                        if "downloaded_files" not in results:
-                            results["downloaded_files"] = []
-                        results["downloaded_files"].append(downloads_path)
-                        print(f"💾 Also saved to downloads: {downloads_path}")
-                    
-                except Exception as download_error:
-                    print(f"⚠️ Download failed for segment {i}: {str(download_error)}")
-                    segment_result["download_error"] = str(download_error)
-                
-                print(f"✅ Segment {i} completed: {video_url}")
-            else:
-                raise ValueError("No video URL returned from generation")
-                
-        except Exception as e:
-            error_msg = f"Video generation failed for segment {i}: {str(e)}"
-            print(f"❌ {error_msg}")
-            segment_result["status"] = "failed"
-            segment_result["error"] = error_msg
-            results["error_count"] += 1
-        
+    logger.info(
+        "daily_video.generate_start title=%s characters=%s style=%s keyframe=%s segments=%s",
+        results['content_title'], ", ".join(character_names_list), content_style, character_keyframe_uri, len(segments)
+    )
+    
+    # Segments of one scene chain depend on each other's frames; separate chains run concurrently
+    scene_chains = split_scene_chains(segments)
+    logger.info("daily_video.scene_chains chains=%s max_concurrency=%s", len(scene_chains), max_concurrency)
+    
+    # Setup organized directories using file_storage_manager (once for all segments)
+    content_dir = storage_manager.get_content_directory(ContentType.DAILY_CHARACTER, content_data.get('title', 'Untitled'))
+    frames_dir = os.path.join(content_dir, "frames")
+    videos_dir = os.path.join(content_dir, "videos")
+    os.makedirs(frames_dir, exist_ok=True)
+    os.makedirs(videos_dir, exist_ok=True)
+    
+    character_name = content_data.get('character_name', 'character')
+    safe_name = "".join(c for c in character_name if c.isalnum() or c in (' ', '-', '_')).strip().replace(' ', '_').lower()
+    
+    run = DailyCharacterRun(
+        video_options=video_options,
+        character_keyframe_uri=character_keyframe_uri,
+        char_by_name=char_by_name,
+        character_names_list=character_names_list,
+        character_subjects_list=character_subjects_list,
+        content_style=content_style,
+        total_segments=len(segments),
+        frames_dir=frames_dir,
+        videos_dir=videos_dir,
+        filename_prefix=safe_name,
+        aspect_ratio=video_options.get("aspect_ratio", "9:16"),
+        resolution=video_options.get("resolution", "720p"),
+        download=video_options.get("download", False)
+    )
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+    chain_frames = [loop.create_future() for _ in scene_chains]
+    chain_results = await asyncio.gather(*(
+        _generate_daily_character_chain(scene, run, semaphore, chain_frames[:k], chain_frames[k])
+        for k, scene in enumerate(scene_chains)
+    ))
+    
+    # Collect outcomes in segment order (chains are contiguous, so flattening keeps the order)
+    for segment_result in chain.from_iterable(chain_results):
         results["segments_results"].append(segment_result)
+        if segment_result["status"] == "completed":
+            results["video_urls"].append(segment_result["video_url"])
+            results["success_count"] += 1
+            if segment_result.get("downloaded_file"):
+                results.setdefault("downloaded_files", []).append(segment_result["downloaded_file"])
+        else:
+            results["error_count"] += 1
     
-    print(f"\n{'='*60}")
-    print(f"🎉 Daily Character Video Generation Complete!")
-    print(f"✅ Successful: {results['success_count']}/{results['total_segments']}")
-    print(f"❌ Failed: {results['error_count']}/{results['total_segments']}")
+    logger.info(
+        "daily_video.generate_done title=%s succeeded=%s failed=%s total=%s",
+        results['content_title'], results['success_count'], results['error_count'], results['total_segments']
+    )
     
     if results['error_count'] > 0:
         failed_segments = [r['segment_number'] for r in results['segments_results'] if r['status'] == 'failed']
-        print(f"⚠️ Failed segments: {failed_segments}")
-        print(f"💡 You can retry failed segments using the retry endpoint")
+        # Failed segments can be regenerated through the retry endpoint
+        logger.warning("daily_video.failed_segments segments=%s", failed_segments)
     
     # NOTE: Frame cleanup is now handled AFTER thumbnail generation in the merge pipeline
     # Frames are kept here so thumbnail can use them as reference
-    print(f"\nℹ️ Frames kept for thumbnail generation (will be cleaned up after merge)")
     results["frames_cleaned"] = False
     
-    print(f"{'='*60}")
-    
     return results
 
 
-def execute_daily_character_video_generation_with_references(content_data: dict, video_options: dict = None):
+async def execute_daily_character_video_generation_with_references(content_data: dict, video_options: dict = None):
     """
     Generate videos for daily character content using REFERENCE IMAGES (new mode).
     Uses both previous frame AND character keyframe as reference images for character consistency.
     
+    Every segment after the first references a frame extracted from the previous
+    segment's video, so segments form a single chain and run in order; the blocking
+    Imagen/Veo/download calls run in worker threads to keep the event loop free.
+    
     Args:
         content_data: Daily character content data
         video_options: Video generation options including character_keyframe_uri and use_frames_as_references=True
@@ -1641,21 +1450,17 @@ def execute_daily_character_video_generation_with_references(content_data: dict,
     # Extract character metadata for multi-character support
     character_metadata = content_data.get("character_metadata", {})
     characters = character_metadata.get("characters", [])
+    # Character metadata by name for the per-segment lookups (first entry wins on duplicate names)
+    char_by_name = {char.get("character_name"): char for char in reversed(characters)}
     
     # Build character names and subjects lists for Imagen
-    character_names_list = []
-    character_subjects_list = []
-    
     if characters:
-        for char in characters:
-            char_name = char.get("character_name", "Character")
-            char_subject = char.get("subject", "creature")  # Get subject description from database
-            character_names_list.append(char_name)
-            character_subjects_list.append(char_subject)
+        character_names_list = [char.get("character_name", "Character") for char in characters]
+        # Subject descriptions come from the database
+        character_subjects_list = [char.get("subject", "creature") for char in characters]
         
-        print(f"📋 Character metadata loaded:")
         for name, subject in zip(character_names_list, character_subjects_list):
-            print(f"   - {name}: {subject[:50]}...")
+            logger.debug("daily_video_refs.character name=%s subject=%.50s", name, subject)
     else:
         # Fallback for single character without metadata
         character_names_list = [content_data.get('character_name', 'Character')]
@@ -1678,22 +1483,16 @@ def execute_daily_character_video_generation_with_references(content_data: dict,
         "character_keyframe_uri": character_keyframe_uri
     }
     
-    print(f"🎬 Starting daily character video generation (REFERENCE MODE) for: {results['content_title']}")
-    print(f"👤 Character(s): {', '.join(character_names_list)}")
-    print(f"🎭 Style: {content_style}")
-    print(f"🖼️ Character Keyframe: {character_keyframe_uri}")
-    print(f"🎨 Mode: Using frames as REFERENCE IMAGES for character consistency")
-    print(f"📊 Total segments: {len(segments)}")
-    
-    # Import here to avoid circular imports
-    from app.services.genai_service import generate_video_with_keyframes
-    from app.services.imagen_service import generate_first_frame_with_imagen
+    logger.info(
+        "daily_video_refs.generate_start title=%s characters=%s style=%s keyframe=%s segments=%s",
+        results['content_title'], ", ".join(character_names_list), content_style, character_keyframe_uri, len(segments)
+    )
     
     previous_frame = None  # Track previous frame for continuity
     
-    # Process each segment sequentially
+    # Process each segment sequentially (each one references the previous segment's last frame)
     for i, segment in enumerate(segments, 1):
-        print(f"\n🎬 Generating video for Segment {i}/{len(segments)}...")
+        logger.info("daily_video_refs.segment_start segment=%s/%s", i, len(segments))
         
         segment_result = {
             "segment_number": i,
@@ -1707,27 +1506,26 @@ def execute_daily_character_video_generation_with_references(content_data: dict,
             # Check for Veo 3 structured prompt first (veo_prompt), then fallback to video_prompt
             prompt = segment.get('veo_prompt', '') or segment.get('video_prompt', '')
             if prompt:
-                print(f"✅ Using Veo 3 structured prompt with integrated audio")
+                logger.debug("daily_video_refs.prompt_source segment=%s source=veo_prompt", i)
             else:
                 # Build prompt from segment fields for daily character content
                 prompt = build_daily_character_video_prompt(segment)
-                print(f"⚠️  Using legacy prompt format (no integrated audio)")
+                logger.info("daily_video_refs.prompt_source segment=%s source=legacy", i)
             
             if not prompt or prompt == "Daily character moment":
                 raise ValueError(f"Could not build video prompt for segment {i}")
             
-            print(f"📝 Prompt: {prompt[:100]}...")
+            logger.debug("daily_video_refs.segment_prompt segment=%s prompt=%.100s", i, prompt)
             
             # Generate first frame with Imagen if frame description exists
             first_frame = None
             frame_description = segment.get('first_frame_description')
             
             if frame_description and i == 1:  # Only for first segment
-                print(f"🎨 Segment {i}: Generating custom first frame with Imagen (nano banana)...")
-                print(f"📝 Frame description: {frame_description[:100]}...")
+                logger.info("daily_video_refs.first_frame_start segment=%s", i)
+                logger.debug("daily_video_refs.first_frame_description segment=%s description=%.100s", i, frame_description)
                 try:
                     # Create frames directory in workspace
-                    import os
                     frames_dir = "frames"
                     os.makedirs(frames_dir, exist_ok=True)
                     
@@ -1737,24 +1535,12 @@ def execute_daily_character_video_generation_with_references(content_data: dict,
                         segment_char_urls = [segment.get("character_keyframe_uri", character_keyframe_uri)]
                     
                     # Get character names and subjects for this segment's characters
-                    segment_char_names = []
-                    segment_char_subjects = []
-                    characters_present = segment.get("characters_present", [])
-                    
-                    if characters_present and characters:
-                        # Match characters_present to character metadata
-                        for char_name in characters_present:
-                            for char in characters:
-                                if char.get("character_name") == char_name:
-                                    segment_char_names.append(char_name)
-                                    segment_char_subjects.append(char.get("subject", "creature"))
-                                    break
-                    else:
-                        # Fallback to all characters
-                        segment_char_names = character_names_list
-                        segment_char_subjects = character_subjects_list
+                    segment_char_names, segment_char_subjects = _resolve_segment_characters(
+                        segment, char_by_name, character_names_list, character_subjects_list
+                    )
                     
-                    generated_image, frame_path = generate_first_frame_with_imagen(
+                    generated_image, frame_path = await asyncio.to_thread(
+                        generate_first_frame_with_imagen,
                         character_image_urls=segment_char_urls,
                         frame_description=frame_description,
                         aspect_ratio=video_options.get("aspect_ratio", "9:16"),
@@ -1766,22 +1552,24 @@ def execute_daily_character_video_generation_with_references(content_data: dict,
                     )
                     # Use the saved frame path as first_frame (will be used as reference)
                     first_frame = frame_path
-                    print(f"✅ First frame generated and saved to: {frame_path}")
+                    logger.info("daily_video_refs.first_frame_generated segment=%s path=%s", i, frame_path)
                 except Exception as e:
-                    print(f"⚠️ Imagen generation failed: {str(e)}, using character keyframe")
+                    logger.warning("daily_video_refs.first_frame_failed segment=%s error=%s", i, e)
                     first_frame = character_keyframe_uri
             elif previous_frame:
                 # Use previous frame for continuity
                 first_frame = previous_frame
-                print(f"🔗 Segment {i}: Using previous frame as reference")
+                logger.info("daily_video_refs.reference segment=%s source=previous_last_frame path=%s", i, first_frame)
             else:
                 # Use character keyframe as fallback
                 first_frame = character_keyframe_uri
-                print(f"⚠️ Segment {i}: Previous frame not available, using character keyframe")
+                logger.warning("daily_video_refs.reference segment=%s source=character_keyframe reason=no_previous_frame", i)
             
             # NEW MODE: Generate video with REFERENCE IMAGES
             # Both previous frame and character keyframe are used as references
-            video_urls = generate_video_with_keyframes(
+            await asyncio.sleep(_VEO_BUCKET.reserve())
+            video_urls = await asyncio.to_thread(
+                generate_video_with_keyframes,
                 prompt=prompt,
                 first_frame=first_frame,  # Will be used as reference image
                 duration=segment.get('clip_duration', 8),
@@ -1798,15 +1586,13 @@ def execute_daily_character_video_generation_with_references(content_data: dict,
                 results["video_urls"].append(video_url)
                 results["success_count"] += 1
                 
-                print(f"✅ Segment {i} completed: {video_url}")
+                logger.info("daily_video_refs.segment_completed segment=%s url=%s", i, video_url)
                 
                 # Extract last frame from generated video for next segment
                 # This will be used as a reference image for the next segment
                 if i < len(segments):  # Not the last segment
                     try:
-                        print(f"🎞️ Extracting last frame from segment {i} for next segment...")
-                        from app.services.genai_service import download_video
-                        import os
+                        logger.info("daily_video_refs.extract_last_frame segment=%s", i)
                         
                         # Create frames directory in the workspace (not temp)
                         frames_dir = "frames"
@@ -1814,49 +1600,50 @@ def execute_daily_character_video_generation_with_references(content_data: dict,
                         
                         # Download video to frames directory
                         video_filename = f"segment_{i}_temp.mp4"
-                        video_path = download_video(video_url, video_filename, frames_dir)
+                        video_path = await asyncio.to_thread(download_video, video_url, video_filename, frames_dir)
                         
                         # Extract last frame to frames directory
                         from app.services.video_frame_extractor import extract_last_frame_from_video
                         frame_filename = f"segment_{i}_last_frame.png"
                         frame_path = os.path.join(frames_dir, frame_filename)
-                        extract_last_frame_from_video(video_path, frame_path)
+                        await asyncio.to_thread(extract_last_frame_from_video, video_path, frame_path)
                         
                         # Use this frame for next segment
                         previous_frame = frame_path
-                        print(f"✅ Last frame extracted and will be used as reference for segment {i+1}")
+                        logger.info("daily_video_refs.last_frame_extracted segment=%s path=%s", i, frame_path)
                         
                         # Clean up downloaded video (keep frame for next segment)
                         if os.path.exists(video_path):
                             os.remove(video_path)
-                            print(f"🗑️ Cleaned up temporary video file")
                             
                     except Exception as e:
-                        print(f"⚠️ Failed to extract last frame: {str(e)}")
-                        print(f"⚠️ Next segment will use character keyframe instead")
+                        # Next segment falls back to the character keyframe
+                        logger.warning("daily_video_refs.extract_failed segment=%s error=%s", i, e)
                         previous_frame = None
             else:
                 raise ValueError("No video URL returned from generation")
                 
         except Exception as e:
-            error_msg = f"Video generation failed for segment {i} (attempt 1): {str(e)}"
-            print(f"❌ {error_msg}")
+            error_text = str(e)
+            if is_rate_limit_error(error_text):
+                # Hold back the following Veo requests for the provider's Retry-After
+                _VEO_BUCKET.pause(backoff_delay(error_text, 0, getattr(e, "retry_after", None)))
+            error_msg = f"Video generation failed for segment {i} (attempt 1): {error_text}"
+            logger.error("daily_video_refs.segment_failed %s", error_msg)
             segment_result["status"] = "failed"
             segment_result["error"] = error_msg
             results["error_count"] += 1
         
         results["segments_results"].append(segment_result)
     
-    print(f"\n{'='*60}")
-    print(f"🎉 Daily Character Video Generation Complete!")
-    print(f"✅ Successful: {results['success_count']}/{results['total_segments']}")
-    print(f"❌ Failed: {results['error_count']}/{results['total_segments']}")
+    logger.info(
+        "daily_video_refs.generate_done title=%s succeeded=%s failed=%s total=%s",
+        results['content_title'], results['success_count'], results['error_count'], results['total_segments']
+    )
     
     if results['error_count'] > 0:
         failed_segments = [r['segment_number'] for r in results['segments_results'] if r['status'] == 'failed']
-        print(f"⚠️ Failed segments: {failed_segments}")
-        print(f"💡 You can retry failed segments using the retry endpoint")
-    
-    print(f"{'='*60}")
+        # Failed segments can be regenerated through the retry endpoint
+        logger.warning("daily_video_refs.failed_segments segments=%s", failed_segments)
     
     return results
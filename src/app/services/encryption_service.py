@@ -7,7 +7,7 @@ Handles encryption and decryption of sensitive character data using Fernet symme
 from cryptography.fernet import Fernet
 import os
 import base64
-from typing import Optional
+from typing import Optional, List
 
 
 class EncryptionService:
@@ -66,6 +66,24 @@ class EncryptionService:
             print(f"❌ Decryption error: {str(e)}")
             raise ValueError(f"Failed to decrypt data: {str(e)}")
     
+    def decrypt_many(self, encrypted_items: List[Optional[str]]) -> List[str]:
+        """
+        Decrypt a batch of encrypted strings with a single cipher pass
+        
+        Args:
+            encrypted_items: Encrypted strings (empty/None items decrypt to "")
+            
+        Returns:
+            list: Decrypted plain text strings, in input order
+        """
+        decrypt = self.cipher.decrypt
+        
+        try:
+            return [decrypt(item.encode()).decode() if item else "" for item in encrypted_items]
+        except Exception as e:
+            print(f"❌ Decryption error: {str(e)}")
+            raise ValueError(f"Failed to decrypt data: {str(e)}")
+    
     def encrypt_dict(self, data: dict, keys_to_encrypt: list) -> dict:
         """
         Encrypt specific keys in a dictionary
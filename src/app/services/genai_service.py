@@ -2,20 +2,26 @@ import time
 import requests
 import os
 import json
-import base64
+import orjson
+try:
+    # SIMD-accelerated drop-in replacement for the stdlib codec
+    import pybase64 as base64
+except ImportError:
+    import base64
 from google.genai import types
 from PIL import Image, ImageDraw, ImageFont
 from io import BytesIO
 from app.config.settings import settings
 from app.connectors.genai_connector import get_genai_client
+from app.connectors.http_connector import get_http_session
 
 
-def analyze_image_with_gemini(image_data: str, prompt: str) -> dict:
+def analyze_image_with_gemini(image_data, prompt: str) -> dict:
     """
     Analyze an image using Gemini 3 Pro with high-resolution analysis
     
     Args:
-        image_data: Base64 encoded image data
+        image_data: Raw image bytes, or base64 encoded image data (optionally a data URL)
         prompt: Analysis prompt
         
     Returns:
@@ -27,21 +33,21 @@ def analyze_image_with_gemini(image_data: str, prompt: str) -> dict:
         # Get Gemini client
         client = get_genai_client()
         
-        # Decode base64 image
-        if image_data.startswith('data:image'):
-            # Remove data URL prefix
-            image_data = image_data.split(',')[1]
-        
-        image_bytes = base64.b64decode(image_data)
+        if isinstance(image_data, (bytes, bytearray)):
+            # Raw bytes are sent to Gemini as-is
+            image_bytes = bytes(image_data)
+        else:
+            # Decode base64 image
+            if image_data.startswith('data:image'):
+                # Remove data URL prefix
+                image_data = image_data.split(',')[1]
+            
+            image_bytes = base64.b64decode(image_data)
         
-        # Create PIL Image to get format
+        # Only the header is parsed to get the format; the original bytes are sent unchanged
         pil_image = Image.open(BytesIO(image_bytes))
         image_format = (pil_image.format or 'PNG').lower()
-        
-        # Convert to bytes for Gemini
-        img_byte_arr = BytesIO()
-        pil_image.save(img_byte_arr, format=pil_image.format or 'PNG')
-        img_bytes = img_byte_arr.getvalue()
+        img_bytes = image_bytes
         
         # Generate analysis with Gemini 3 Pro using proper format
         response = client.models.generate_content(
@@ -74,7 +80,7 @@ def analyze_image_with_gemini(image_data: str, prompt: str) -> dict:
         response_text = response_text.strip()
         
         # Parse JSON
-        analysis_data = json.loads(response_text)
+        analysis_data = orjson.loads(response_text)
         
         print(f"✅ Image analysis complete!")
         
@@ -248,7 +254,8 @@ def generate_video_from_payload(payload: dict):
                 for idx, url in enumerate(reference_image_urls):
                     try:
                         if url.startswith("http://") or url.startswith("https://"):
-                            response = requests.get(url, timeout=30)
+                            # The enclosing attempt loop retries; keep one request per attempt
+                            response = get_http_session(retry=False).get(url, timeout=30)
                             response.raise_for_status()
                             ref_image = Image.open(BytesIO(response.content))
                             
@@ -514,7 +521,8 @@ def download_video(video_url: str, filename: str = None, download_dir: str = "do
                     time.sleep(wait)
 
                 # Make the GET request with streaming enabled
-                response = requests.get(video_url, headers=headers, stream=True, timeout=60)
+                # This loop retries with its own backoff; keep one request per attempt
+                response = get_http_session(retry=False).get(video_url, headers=headers, stream=True, timeout=60)
 
                 if response.status_code == 200:
                     # Success! Download the file
@@ -648,7 +656,6 @@ def generate_first_frame_with_imagen(character_keyframe_uri: str, frame_descript
     """
     from PIL import Image
     from io import BytesIO
-    import requests
     
     print(f"🎨 Generating first frame with Imagen...")
     print(f"📝 Description: {frame_description[:100]}...")
@@ -656,7 +663,7 @@ def generate_first_frame_with_imagen(character_keyframe_uri: str, frame_descript
     # Download character image if it's a URL
     if character_keyframe_uri.startswith("http://") or character_keyframe_uri.startswith("https://"):
         print(f"📥 Downloading character image from: {character_keyframe_uri[:50]}...")
-        response = requests.get(character_keyframe_uri, timeout=30)
+        response = get_http_session().get(character_keyframe_uri, timeout=30)
         response.raise_for_status()
         character_image = Image.open(BytesIO(response.content))
         print(f"✅ Character image loaded: {character_image.size}")
@@ -796,7 +803,6 @@ def generate_video_with_keyframes(
             first_frame="https://res.cloudinary.com/.../image.png"
         )
     """
-    import requests
     from PIL import Image
     from io import BytesIO
     
@@ -815,7 +821,7 @@ def generate_video_with_keyframes(
             # HTTP/HTTPS URL - download and convert to PIL Image
             elif image_input.startswith("http://") or image_input.startswith("https://"):
                 print(f"📥 Downloading image from URL: {image_input[:50]}...")
-                response = requests.get(image_input, timeout=30)
+                response = get_http_session().get(image_input, timeout=30)
                 response.raise_for_status()
                 img = Image.open(BytesIO(response.content))
                 print(f"✅ Image downloaded: {img.size} {img.mode}")
@@ -965,9 +971,8 @@ def generate_thumbnail_image(
                 char_image_url = char.get("image_url")
                 if char_image_url:
                     try:
-                        import requests
                         print(f"📥 Loading character image: {char.get('name', 'Character')}")
-                        response_img = requests.get(char_image_url, timeout=10)
+                        response_img = get_http_session().get(char_image_url, timeout=10)
                         char_image = Image.open(BytesIO(response_img.content))
                         contents.append(char_image)
                         print(f"✅ Character image loaded for reference")
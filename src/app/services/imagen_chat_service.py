@@ -8,10 +8,10 @@ For continuous segments, it updates the previous frame rather than generating fr
 import os
 from io import BytesIO
 from PIL import Image
-from datetime import datetime
 from google import genai
 from google.genai import types
 from app.config import settings
+from app.services.imagen_service import unique_frame_filename
 
 
 def get_genai_client():
@@ -170,8 +170,7 @@ Requirements:
         
         # Save frame
         os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"first_frame_{timestamp}.png"
+        filename = unique_frame_filename("first_frame")
         filepath = os.path.join(output_dir, filename)
         generated_image.save(filepath, "PNG")
         print(f"💾 First frame saved: {filepath}")
@@ -254,8 +253,7 @@ This is the ending frame of the same scene, so everything should feel continuous
         
         # Save frame
         os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"last_frame_{timestamp}.png"
+        filename = unique_frame_filename("last_frame")
         filepath = os.path.join(output_dir, filename)
         generated_image.save(filepath, "PNG")
         print(f"💾 Last frame saved: {filepath}")
@@ -329,8 +327,7 @@ This is the ending frame of the same scene, so everything should feel continuous
         
         # Save frame
         os.makedirs(output_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"first_frame_continuous_{timestamp}.png"
+        filename = unique_frame_filename("first_frame_continuous")
         filepath = os.path.join(output_dir, filename)
         generated_image.save(filepath, "PNG")
         print(f"💾 Continuous frame saved: {filepath}")
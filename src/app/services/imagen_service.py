@@ -4,12 +4,77 @@ Imagen Service (Nano Banana Model)
 This module provides image generation using Google's Imagen model.
 """
 
+import itertools
 import os
+import time
 from PIL import Image
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from google.genai import types
 from app.connectors.genai_connector import get_genai_client
+from app.connectors.http_connector import get_http_session
+
+
+# Upper bound on parallel character image downloads
+MAX_IMAGE_DOWNLOAD_WORKERS = 16
+
+# Process-wide sequence for frame filenames (segments of different scenes run concurrently)
+_frame_counter = itertools.count(1)
+
+
+def unique_frame_filename(prefix: str) -> str:
+    """
+    Collision-free PNG filename for a generated frame.
+    
+    A monotonic clock reading plus a process-wide counter: unlike a per-second
+    timestamp, two frames saved in the same second never overwrite each other.
+    
+    Args:
+        prefix: Frame kind, e.g. "first_frame" or "last_frame"
+    
+    Returns:
+        str: Filename such as "first_frame_123456789012_7.png"
+    """
+    return f"{prefix}_{time.monotonic_ns()}_{next(_frame_counter)}.png"
+
+
+def _download_image(url: str) -> Image.Image:
+    """Download one image URL and decode it with PIL"""
+    with get_http_session().get(url, stream=True, timeout=30) as response:
+        response.raise_for_status()
+        # Hand the body stream to PIL instead of building response.content first
+        response.raw.decode_content = True
+        img = Image.open(response.raw)
+        # Decode now (in the download worker) so the connection goes back to the pool
+        img.load()
+    return img
+
+
+def download_character_images(urls: list) -> list:
+    """
+    Download character reference images concurrently.
+    
+    Args:
+        urls: http(s) URLs of the character images
+    
+    Returns:
+        list: PIL Images, in the same order as urls
+    """
+    for url in urls:
+        if not (url.startswith("http://") or url.startswith("https://")):
+            raise ValueError(f"Unsupported URL format: {url}")
+    if not urls:
+        return []
+    
+    print(f"📥 Downloading {len(urls)} character image(s)...")
+    # executor.map keeps the input order, so image N still matches character N
+    with ThreadPoolExecutor(max_workers=min(MAX_IMAGE_DOWNLOAD_WORKERS, len(urls))) as executor:
+        character_images = list(executor.map(_download_image, urls))
+    
+    for idx, img in enumerate(character_images, 1):
+        print(f"✅ Character {idx} loaded: {img.size}")
+    return character_images
 
 
 def generate_first_frame_with_imagen(
@@ -43,9 +108,6 @@ def generate_first_frame_with_imagen(
     Returns:
         tuple: (PIL.Image, filepath) - Generated image and path where it was saved
     """
-    import requests
-    from datetime import datetime
-    
     print(f"🎨 Generating first frame with Imagen (nano banana)...")
     print(f"📝 Description: {frame_description[:100]}...")
     
@@ -66,17 +128,7 @@ def generate_first_frame_with_imagen(
         raise ValueError("Either character_image_url or character_image_urls must be provided")
     
     # Download all character images
-    character_images = []
-    for idx, url in enumerate(urls_to_download, 1):
-        if url.startswith("http://") or url.startswith("https://"):
-            print(f"📥 Downloading character {idx}/{len(urls_to_download)} from: {url[:50]}...")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            img = Image.open(BytesIO(response.content))
-            character_images.append(img)
-            print(f"✅ Character {idx} loaded: {img.size}")
-        else:
-            raise ValueError(f"Unsupported URL format: {url}")
+    character_images = download_character_images(urls_to_download)
     
     # Map aspect ratio to dimensions
     aspect_ratio_dimensions = {
@@ -197,8 +249,7 @@ Requirements:
             generated_image = _resize_to_aspect_ratio(character_image, aspect_ratio, target_size)
         
         # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"first_frame_{timestamp}.png"
+        filename = unique_frame_filename("first_frame")
         filepath = os.path.join(output_dir, filename)
         
         # Save the frame
@@ -216,8 +267,7 @@ Requirements:
         fallback_image = _resize_to_aspect_ratio(character_image, aspect_ratio, target_size)
         
         # Save fallback frame
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"first_frame_fallback_{timestamp}.png"
+        filename = unique_frame_filename("first_frame_fallback")
         filepath = os.path.join(output_dir, filename)
         
         fallback_image.save(filepath, "PNG")
@@ -318,9 +368,6 @@ def generate_last_frame_with_imagen(
     Returns:
         tuple: (PIL.Image, filepath) - Generated image and path where it was saved
     """
-    import requests
-    from datetime import datetime
-    
     print(f"🎨 Generating last frame with Imagen (nano banana)...")
     print(f"📝 Description: {last_frame_description[:100]}...")
     
@@ -341,17 +388,7 @@ def generate_last_frame_with_imagen(
         raise ValueError("Either character_image_url or character_image_urls must be provided")
     
     # Download all character images
-    character_images = []
-    for idx, url in enumerate(urls_to_download, 1):
-        if url.startswith("http://") or url.startswith("https://"):
-            print(f"📥 Downloading character {idx}/{len(urls_to_download)} from: {url[:50]}...")
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            img = Image.open(BytesIO(response.content))
-            character_images.append(img)
-            print(f"✅ Character {idx} loaded: {img.size}")
-        else:
-            raise ValueError(f"Unsupported URL format: {url}")
+    character_images = download_character_images(urls_to_download)
     
     # Use first character as primary
     character_image = character_images[0]
@@ -487,8 +524,7 @@ Requirements:
             generated_image = _resize_to_aspect_ratio(first_frame_image, aspect_ratio, target_size)
         
         # Generate filename with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"last_frame_{timestamp}.png"
+        filename = unique_frame_filename("last_frame")
         filepath = os.path.join(output_dir, filename)
         
         # Save the frame
@@ -506,8 +542,7 @@ Requirements:
         fallback_image = _resize_to_aspect_ratio(first_frame_image, aspect_ratio, target_size)
         
         # Save fallback frame
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"last_frame_fallback_{timestamp}.png"
+        filename = unique_frame_filename("last_frame_fallback")
         filepath = os.path.join(output_dir, filename)
         
         fallback_image.save(filepath, "PNG")
@@ -534,8 +569,6 @@ def generate_frame_from_description(
     Returns:
         tuple: (PIL.Image, filepath)
     """
-    from datetime import datetime
-    
     print(f"🎨 Generating frame from description...")
     print(f"📝 Description: {description[:100]}...")
     
@@ -596,8 +629,7 @@ Requirements:
             raise ValueError("No image generated in response")
         
         # Save
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"frame_{timestamp}.png"
+        filename = unique_frame_filename("frame")
         filepath = os.path.join(output_dir, filename)
         
         generated_image.save(filepath, "PNG")
@@ -5,6 +5,11 @@ import json
 import re
 import time
 
+from app.utils.retry_policy import is_temporary_error
+
+# Runs of non-ASCII characters (compiled once, used per segment prompt)
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+
 
 def clean_json_string(text: str) -> str:
     """Clean JSON string by replacing problematic characters"""
@@ -14,8 +19,9 @@ def clean_json_string(text: str) -> str:
     # Replace smart quotes with regular quotes
     text = text.replace('"', '"').replace('"', '"').replace(''', "'").replace(''', "'")
     
-    # Remove other problematic Unicode characters
-    text = re.sub(r'[^\x00-\x7F]+', '', text)
+    # Remove other problematic Unicode characters (common case: nothing to remove)
+    if not text.isascii():
+        text = _NON_ASCII_RE.sub('', text)
     
     return text
 
@@ -435,7 +441,8 @@ def execute_story_video_generation(story_data: dict, video_options: dict = None,
                     raise Exception("No video URL returned from generation")
                     
             except Exception as e:
-                error_msg = f"Video generation failed for segment {segment_num} (attempt {attempt + 1}): {str(e)}"
+                error_text = str(e)  # computed once for the message and the classifier
+                error_msg = f"Video generation failed for segment {segment_num} (attempt {attempt + 1}): {error_text}"
                 print(f"❌ {error_msg}")
                 
                 if attempt == max_retries - 1:  # Last attempt failed
@@ -445,18 +452,7 @@ def execute_story_video_generation(story_data: dict, video_options: dict = None,
                     results["error_count"] += 1
                 else:
                     # Check if it's a temporary error (overload, rate limit, internal server errors, etc.)
-                    error_str = str(e).lower()
-                    is_temporary_error = (
-                        "overloaded" in error_str or 
-                        "rate" in error_str or 
-                        "quota" in error_str or
-                        "internal server" in error_str or
-                        "'code': 13" in str(e) or
-                        "server issue" in error_str or
-                        "try again" in error_str
-                    )
-                    
-                    if is_temporary_error:
+                    if is_temporary_error(error_text):
                         print(f"🔄 Temporary error detected, will retry...")
                         continue
                     else:
@@ -5,12 +5,12 @@ Server-side merging creates actual merged files and cleans up segments.
 """
 import os
 import json
-import requests
 import subprocess
 import tempfile
 import shutil
 from typing import List, Dict, Optional
 from app.config.settings import settings
+from app.connectors.http_connector import get_http_session
 
 
 class VideoMerger:
@@ -55,7 +55,7 @@ class VideoMerger:
                     print(f"📥 Downloading segment {i+1}/{len(video_urls)}...")
                     
                     # Download video segment
-                    response = requests.get(url, stream=True, timeout=60)
+                    response = get_http_session().get(url, stream=True, timeout=60)
                     if response.status_code == 200:
                         temp_file = os.path.join(temp_dir, f"segment_{i+1}.mp4")
                         with open(temp_file, 'wb') as f:
@@ -12,6 +12,7 @@ from .story_retry_helper import (
     construct_retry_payload,
     get_retry_info_by_title
 )
+from .retry_policy import TokenBucket, is_temporary_error, is_rate_limit_error, backoff_delay
 
 __all__ = [
     'generate_character_id',
@@ -21,5 +22,9 @@ __all__ = [
     'load_story_metadata',
     'find_failed_sets',
     'construct_retry_payload',
-    'get_retry_info_by_title'
+    'get_retry_info_by_title',
+    'TokenBucket',
+    'is_temporary_error',
+    'is_rate_limit_error',
+    'backoff_delay'
 ]
@@ -0,0 +1,142 @@
+"""
+Retry Policy Utility
+
+This module classifies video/image generation provider errors as transient or
+permanent, computes how long to wait before the next attempt, and provides a
+token bucket for admitting requests to rate-limited providers.
+
+Classes:
+- TokenBucket: Thread-safe token bucket rate limiter
+
+Functions:
+- is_temporary_error(): Whether an error message describes a transient failure
+- is_rate_limit_error(): Whether an error message describes a rate limit/quota failure
+- backoff_delay(): Seconds to wait before retrying a transient failure
+"""
+
+import random
+import re
+import threading
+import time
+from typing import Optional
+
+# Provider errors worth retrying (overload, rate limit, quota, internal server errors).
+# "rate" is only matched as "rate limit" so words like "generate" do not count.
+_TEMP_ERR_RE = re.compile(
+    r"overloaded|\brate[ _-]?limit|\b429\b|quota|internal server|server issue|try again|'code': 13",
+    re.IGNORECASE
+)
+
+# Rate-limit/quota errors back off from a higher base than other transient errors
+_RATE_LIMIT_RE = re.compile(r"\b429\b|quota|\brate[ _-]?limit|too many requests", re.IGNORECASE)
+_RETRY_AFTER_RE = re.compile(r"retry[ _-]?(?:after|delay|in)\W*(\d+(?:\.\d+)?)", re.IGNORECASE)
+RETRY_BASE_DELAY = 1.0  # seconds
+RATE_LIMIT_BASE_DELAY = 5.0  # seconds
+MAX_RETRY_DELAY = 30.0  # seconds
+
+
+def is_temporary_error(message: str) -> bool:
+    """
+    Check whether a generation error is transient and the request should be retried.
+    
+    Args:
+        message: str() of the raised exception (computed once by the caller)
+    
+    Returns:
+        bool: True for overload, rate limit, quota and internal server errors
+    """
+    return _TEMP_ERR_RE.search(message) is not None
+
+
+def is_rate_limit_error(message: str) -> bool:
+    """
+    Check whether a generation error comes from a provider rate limit or quota.
+    
+    Args:
+        message: str() of the raised exception
+    
+    Returns:
+        bool: True for 429 / rate limit / quota errors
+    """
+    return _RATE_LIMIT_RE.search(message) is not None
+
+
+def backoff_delay(message: str, attempt: int, retry_after: Optional[float] = None) -> float:
+    """
+    Seconds to wait before retrying after a transient error.
+    
+    Exponential backoff with up to 50% jitter, capped at MAX_RETRY_DELAY; a retry-after
+    hint from the provider (argument or message) is honoured when it is longer.
+    
+    Args:
+        message: str() of the raised exception
+        attempt: 0-based index of the attempt that failed
+        retry_after: Structured retry-after value from the exception, if any
+    
+    Returns:
+        float: Delay in seconds
+    """
+    base = RATE_LIMIT_BASE_DELAY if _RATE_LIMIT_RE.search(message) else RETRY_BASE_DELAY
+    delay = min(MAX_RETRY_DELAY, base * 2 ** attempt) * (1 + random.uniform(0, 0.5))
+    
+    if retry_after is None:
+        match = _RETRY_AFTER_RE.search(message)
+        retry_after = match and float(match.group(1))
+    return max(delay, float(retry_after or 0))
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for admitting requests to a rate-limited provider.
+    
+    Tokens refill at `rate` per second up to `burst`. reserve() claims a token and
+    returns how long the caller must wait before using it, so the same bucket works
+    for blocking callers (time.sleep) and async callers (asyncio.sleep) without
+    holding the lock while waiting. pause() halts admission after a 429.
+    """
+    
+    def __init__(self, rate: float = 0.5, burst: int = 3):
+        """
+        Args:
+            rate: Tokens added per second
+            burst: Maximum number of tokens (requests admitted back to back)
+        """
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._halted_until = 0.0
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """
+        Claim one token.
+        
+        Returns:
+            float: Seconds to wait before issuing the request (0.0 if a token is available)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._halted_until - now)
+    
+    def acquire(self) -> None:
+        """
+        Block until a token is available.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    def pause(self, seconds: float) -> None:
+        """
+        Stop admitting requests for `seconds` (e.g. the provider's Retry-After).
+        
+        Args:
+            seconds: How long to halt admission
+        """
+        with self._lock:
+            self._halted_until = max(self._halted_until, time.monotonic() + seconds)
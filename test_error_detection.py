@@ -2,6 +2,14 @@
 Test script to verify error detection for code 13 (internal server error)
 """
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from app.utils.retry_policy import RATE_LIMIT_BASE_DELAY, backoff_delay, is_rate_limit_error, is_temporary_error
+
+
 def test_error_detection():
     """Test that code 13 errors are detected as retryable"""
     
@@ -26,18 +34,7 @@ def test_error_detection():
         "Quota exceeded",
     ]
     
-    # Test detection logic from content_to_video_service.py
-    def is_temporary_error(error_str):
-        error_str_lower = str(error_str).lower()
-        return (
-            "overloaded" in error_str_lower or 
-            "rate" in error_str_lower or 
-            "quota" in error_str_lower or
-            "internal server" in error_str_lower or
-            "'code': 13" in str(error_str) or
-            "server issue" in error_str_lower or
-            "try again" in error_str_lower
-        )
+    # content_to_video_service uses app.utils.retry_policy.is_temporary_error
     
     # Test detection logic from genai_service.py
     def is_transient_service_error(exc_or_obj):
@@ -109,5 +106,52 @@ def test_error_detection():
     print(f"  Contains 'please try again' (lowercase): {'please try again' in user_error.lower()}")
 
 
+
+def test_permanent_errors_not_retried():
+    """Test that words merely containing "rate" (generate, moderate, ...) are not retryable"""
+    retryable = [
+        "Rate limit exceeded",
+        "rate-limited by upstream",
+        "429 Too Many Requests",
+        "Quota exceeded",
+        "Video generation failed: {'code': 13, 'message': 'internal server issue'}",
+    ]
+    permanent = [
+        "Failed to generate video: prompt rejected",
+        "Content was flagged by moderate safety settings",
+        "Could not generate an accurate frame for the description",
+        "Invalid image file: unable to generate thumbnail",
+        "Unsupported frame rate",
+    ]
+    
+    for message in retryable:
+        assert is_temporary_error(message), message
+    for message in permanent:
+        assert not is_temporary_error(message), message
+    
+    print("✅ Permanent errors are not retried")
+
+
+def test_rate_limit_classification():
+    """Test that only real rate-limit errors get the rate-limit backoff"""
+    rate_limited = ["429 Too Many Requests", "Rate limit exceeded", "Quota exceeded for metric"]
+    other = [
+        "Failed to generate video: prompt rejected",
+        "Service is currently overloaded",
+        "request id 14290 failed",
+    ]
+    
+    for message in rate_limited:
+        assert is_rate_limit_error(message), message
+        assert backoff_delay(message, 0) >= RATE_LIMIT_BASE_DELAY, message
+    for message in other:
+        assert not is_rate_limit_error(message), message
+        assert backoff_delay(message, 0) < RATE_LIMIT_BASE_DELAY, message
+    
+    print("✅ Rate-limit errors are classified correctly")
+
+
 if __name__ == "__main__":
     test_error_detection()
+    test_permanent_errors_not_retried()
+    test_rate_limit_classification()